@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""Compile a font into the cropped glyph format used by draw565.
+
+The input is a font module generated by font_to_py.py (horizontally mapped
+and not reversed). font_to_py stores every glyph as a full height bitmap,
+padded to a whole number of bytes per row, so much of the data is blank.
+The cropped format stores only the bounding box of the inked pixels of
+each glyph, without padding the rows, which roughly halves the size of
+the fonts.
+
+Each glyph is stored as:
+
+  ====== =============================================================
+  Offset Contents
+  ====== =============================================================
+  0      Advance width
+  1      Left offset of the bounding box
+  2      Width of the bounding box
+  3      Top row of the bounding box
+  4      Number of rows in the bounding box
+  5      1-bit pixel data (MSB first), with each row following directly
+         on from the previous one and only the final byte padded
+  ====== =============================================================
+
+The index is the same as font_to_py's index (16-bit offsets of each glyph,
+starting with the default glyph, followed by the end of the data) although
+identical glyphs are only stored once.
+
+The advance widths are also collected into a width table (one byte per
+glyph, in index order) so that text can be measured without looking up
+each glyph.
+
+The input may also be a font that has already been cropped, so the fonts
+in wasp/fonts can be regenerated in place (for example after a change to
+this tool) using the command recorded in their headers.
+
+Note that ``get_ch()`` of a cropped font returns the glyph in the format
+above (starting at the left offset) together with the font height and the
+advance width, rather than font_to_py's full height bitmap and its width.
+Code that decodes glyphs itself must check ``hasattr(font, 'cropped')``;
+draw565 and the fonts module handle both formats.
+"""
+
+import argparse
+import sys
+
+def load_font(fname):
+    """Load a font_to_py (or cropped) font module without importing it."""
+    font = {}
+    with open(fname) as f:
+        src = f.read()
+    exec(compile(src, fname, 'exec'), font)
+    if not font['hmap']() or font['reverse']():
+        raise ValueError(f'{fname}: only hmap, non-reversed fonts are supported')
+
+    # Keep the header comments so the provenance of the font is not lost
+    font['header'] = [l for l in src.splitlines() if l.startswith('#')]
+    return font
+
+def glyphs(font):
+    """Generate (width, rows) for each glyph in font_to_py index order."""
+    index = font['_index']
+    data = font['_font']
+    height = font['height']()
+    nglyphs = font['max_ch']() - font['min_ch']() + 2
+    for i in range(0, 2 * nglyphs, 2):
+        doff = index[i] | (index[i+1] << 8)
+        if 'cropped' in font:
+            yield uncrop(data[doff:], height)
+            continue
+        width = data[doff] | (data[doff+1] << 8)
+        stride = (width + 7) // 8
+        rows = []
+        for y in range(height):
+            bits = int.from_bytes(data[doff+2+y*stride:doff+2+(y+1)*stride],
+                                  'big')
+            rows.append([(bits >> (8*stride - 1 - x)) & 1
+                         for x in range(width)])
+        yield (width, rows)
+
+def uncrop(glyph, height):
+    """Decode a glyph in the cropped format into (width, rows)."""
+    (width, left, bw, top, nrows) = glyph[0:5]
+    rows = [[0] * width for y in range(height)]
+    for i in range(bw * nrows):
+        if glyph[5 + i // 8] & (0x80 >> (i % 8)):
+            rows[top + i // bw][left + i % bw] = 1
+    return (width, rows)
+
+def crop(width, rows):
+    """Encode a single glyph in the cropped format."""
+    if width > 255:
+        raise ValueError('Glyph is too wide')
+    inked = [y for (y, row) in enumerate(rows) if any(row)]
+    cols = [x for x in range(width) if any(row[x] for row in rows)]
+    if not inked:
+        return bytes((width, 0, 0, 0, 0))
+
+    top = inked[0]
+    nrows = inked[-1] - top + 1
+    left = cols[0]
+    bw = cols[-1] - left + 1
+
+    bits = []
+    for row in rows[top:top+nrows]:
+        bits += row[left:left+bw]
+    bits += [0] * (-len(bits) % 8)
+
+    glyph = bytearray((width, left, bw, top, nrows))
+    for i in range(0, len(bits), 8):
+        byte = 0
+        for b in bits[i:i+8]:
+            byte = (byte << 1) | b
+        glyph.append(byte)
+    return bytes(glyph)
+
+def compile_font(font):
+    """Compile a font into the cropped format.
+
+    :returns: Tuple of font data, index and width table
+    """
+    data = bytearray()
+    index = bytearray()
+    widths = bytearray()
+    offsets = {}
+    for (width, rows) in glyphs(font):
+        glyph = crop(width, rows)
+        if glyph not in offsets:
+            offsets[glyph] = len(data)
+            data += glyph
+        doff = offsets[glyph]
+        index += bytes((doff & 0xff, doff >> 8))
+        widths.append(width)
+    index += bytes((len(data) & 0xff, len(data) >> 8))
+    if len(data) > 0xffff:
+        raise ValueError('Font is too large for a 16-bit index')
+    return (bytes(data), bytes(index), bytes(widths))
+
+def render_bytes(name, data):
+    lines = [f'{name} =\\']
+    for i in range(0, len(data), 16):
+        row = ''.join([f'\\x{b:02x}' for b in data[i:i+16]])
+        end = '\\' if i + 16 < len(data) else ''
+        lines.append(f"b'{row}'{end}")
+    return '\n'.join(lines)
+
+def render_py(font, cmd):
+    (data, index, widths) = compile_font(font)
+    lo = font['min_ch']()
+    hi = font['max_ch']()
+    height = font['height']()
+
+    out = []
+    out.append('# Code generated by cropfont.py.')
+    for l in font['header']:
+        if not l.startswith(('# Code generated', '# Cropped:')):
+            out.append(l)
+    out.append(f'# Cropped: {cmd}')
+    out.append(f"version = '{font['version']}'")
+    for fn in ('height', 'baseline', 'max_width', 'hmap', 'reverse',
+               'monospaced', 'min_ch', 'max_ch'):
+        out.append(f'''
+def {fn}():
+    return {font[fn]()}''')
+    out.append('''
+def cropped():
+    return True
+''')
+    out.append(render_bytes('_font', data))
+    out.append('')
+    out.append(render_bytes('_index', index))
+    out.append('')
+    out.append(render_bytes('_widths', widths))
+    out.append(f'''
+_mvfont = memoryview(_font)
+_mvi = memoryview(_index)
+
+def get_ch(ch):
+    mvi = _mvi
+    mvfont = _mvfont
+
+    oc = ord(ch)
+    ioff = 2 * (oc - {lo} + 1) if oc >= {lo} and oc <= {hi} else 0
+    doff = mvi[ioff] | (mvi[ioff+1] << 8)
+    width = mvfont[doff]
+
+    next_offs = doff + 5 + (mvfont[doff+2] * mvfont[doff+4] + 7) // 8
+    return _mvfont[doff + 1:next_offs], {height}, width''')
+    return '\n'.join(out) + '\n'
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+            description='Compile a font_to_py font into the cropped format.')
+    parser.add_argument('font', help='font module generated by font_to_py.py')
+    parser.add_argument('-o', '--output',
+                        help='output file (defaults to stdout)')
+    parser.add_argument('--stats', action='store_true',
+                        help='report the size of the font data')
+    args = parser.parse_args()
+
+    font = load_font(args.font)
+    cmd = ' '.join(['tools/cropfont.py'] + sys.argv[1:])
+    py = render_py(font, cmd)
+
+    if args.stats:
+        (data, index, widths) = compile_font(font)
+        before = len(font['_font']) + len(font['_index'])
+        after = len(data) + len(index)
+        print(f'{args.font}: {before} -> {after} bytes '
+              f'({100 * after // before}%)', file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(py)
+    else:
+        sys.stdout.write(py)
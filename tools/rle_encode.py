@@ -4,10 +4,21 @@
 # Copyright (C) 2020 Daniel Thompson
 
 import argparse
+import bisect
+import contextlib
+import hashlib
+import io
+import json
 import sys
 import os.path
+import time
 from PIL import Image
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def clut8_rgb888(i):
     """Reference CLUT for wasp-os.
 
@@ -48,9 +59,9 @@ def clut8_rgb565(i):
 
     .. note::
 
-        This function is unused within this file but needs to be
-        maintained alongside the reference clut so it is reproduced
-        here.
+        This function is used to generate the lookup table used by
+        draw565 (see --clut-table) and must be maintained alongside the
+        reference clut.
 
     :param int i: Index (from 0..255 inclusive) into the CLUT
     :return:      16-bit colour in RGB565 format
@@ -111,15 +122,95 @@ class ReverseCLUT:
         #print(f'# #{rgb888:06x} -> #{clut8_rgb888(index):06x}')
         return index
 
+    def prime(self, colors):
+        """Lookup many colours at once.
+
+        When NumPy is available all the colours are compared to the CLUT
+        in a single (vectorised) step and the results are added to the
+        lookup table. The results are identical to calling this object
+        for each colour (including which index is chosen when two CLUT
+        entries are equally close).
+        """
+        todo = [c for c in set(colors) if c not in self.lookup]
+        if not todo:
+            return
+        if np is None:
+            for c in todo:
+                self(c)
+            return
+
+        rgb = np.array(todo, dtype=np.int64)
+        clut = np.array(self.clut, dtype=np.int64)
+        rd = (rgb[:, None] >> 16) - (clut[None, :] >> 16)
+        gd = ((rgb[:, None] >> 8) & 0xff) - ((clut[None, :] >> 8) & 0xff)
+        bd = (rgb[:, None] & 0xff) - (clut[None, :] & 0xff)
+        best = np.argmin(rd * rd + gd * gd + bd * bd, axis=1)
+        self.lookup.update(zip(todo, best.tolist()))
+
+_reverse_clut = None
+
+def reverse_clut():
+    """Get the (shared) reverse lookup for the wasp-os CLUT."""
+    global _reverse_clut
+    if not _reverse_clut:
+        _reverse_clut = ReverseCLUT(clut8_rgb888)
+    return _reverse_clut
+
 def varname(p):
     return os.path.basename(os.path.splitext(p)[0])
 
-def encode(im):
-    pixels = im.load()
+def runs(im, vectorize=True):
+    """Find the runs of identical pixels in an image.
 
+    The image is scanned in raster order, so runs continue from the end
+    of one row to the start of the next. NumPy is used, when it is
+    available, to find the runs otherwise the pixels are compared one
+    at a time.
+
+    :returns: List of (pixel, run length) tuples, the pixels are as
+              returned by PIL (so RGB pixels are tuples)
+    """
+    if np is None or not vectorize:
+        pixels = im.load()
+        result = []
+        rl = 0
+        px = pixels[0, 0]
+        for y in range(im.height):
+            for x in range(im.width):
+                newpx = pixels[x, y]
+                if newpx == px:
+                    rl += 1
+                    continue
+                result.append((px, rl))
+                rl = 1
+                px = newpx
+        result.append((px, rl))
+        return result
+
+    a = np.asarray(im)
+    if a.ndim == 3:
+        flat = a.reshape(-1, a.shape[2])
+        key = np.zeros(len(flat), dtype=np.int64)
+        for c in range(flat.shape[1]):
+            key |= flat[:, c].astype(np.int64) << (8 * c)
+    else:
+        flat = a.reshape(-1)
+        key = flat
+    starts = np.flatnonzero(key[1:] != key[:-1]) + 1
+    starts = np.concatenate(([0], starts))
+    lengths = np.diff(np.append(starts, len(key)))
+    pixels = flat[starts].tolist()
+    if a.ndim == 3:
+        pixels = [tuple(px) for px in pixels]
+    elif im.mode == '1':
+        pixels = [255 if px else 0 for px in pixels]
+    return list(zip(pixels, lengths.tolist()))
+
+def rgb888(px):
+    return (px[0] << 16) + (px[1] << 8) + px[2]
+
+def encode(im, vectorize=True):
     rle = []
-    rl = 0
-    px = pixels[0, 0]
 
     def encode_pixel(px, rl):
         while rl > 255:
@@ -128,27 +219,107 @@ def encode(im):
             rl -= 255
         rle.append(rl)
 
-    for y in range(im.height):
-        for x in range(im.width):
-            newpx = pixels[x, y]
-            if newpx == px:
-                rl += 1
-                assert(rl < (1 << 21))
-                continue
-
-            # Code the previous run
-            encode_pixel(px, rl)
-
-            # Start a new run
-            rl = 1
-            px = newpx
-
-    # Handle the final run
-    encode_pixel(px, rl)
+    for (px, rl) in runs(im, vectorize):
+        assert(rl < (1 << 21))
+        encode_pixel(px, rl)
 
     return (im.width, im.height, bytes(rle))
 
-def encode_2bit(im):
+# The initial 2-bit palette: black, grey25, grey50, white
+_PALETTE_2BIT = (0, 254, 219, 215)
+
+def plan_reloads(colors, beam=32, lookahead=16):
+    """Plan the palette reloads needed to encode a sequence of colours.
+
+    The 2-bit decoder always loads a new colour into the next palette slot
+    in round-robin order (1, 2, 3, 1, ...) so the encoder cannot choose
+    which slot to evict. What it can do is load colours that are not
+    (yet) needed: reloading the colour already in the next slot skips
+    over that slot and loading a colour that is needed soon means it will
+    already be present when it is needed. Neither is worthwhile unless
+    it saves a later reload so we search for the plan with the fewest
+    reloads using a beam search, where each state is the palette together
+    with the next slot to be loaded. Amongst equally good states those
+    whose colours are needed soonest are preferred (as with Belady's
+    algorithm).
+
+    The initial palette entries are set by the caller of blit() (rather
+    than the image) so they cannot be reloaded. Runs drawn from them are
+    given negative colours (-1 to -3 for slots 1 to 3) and a plan will
+    never evict an initial entry that is still needed.
+
+    :param colors:    List of colours, one for each run of the image
+    :param beam:      Number of states to keep at each step of the search
+    :param lookahead: How far ahead to look for colours to load early
+    :returns:         List with a tuple of the colours to load before
+                      each run
+    """
+    n = len(colors)
+    background = _PALETTE_2BIT[0]
+    uses = {}
+    for (i, c) in enumerate(colors):
+        uses.setdefault(c, []).append(i)
+
+    def next_use(c, i):
+        positions = uses.get(c, ())
+        j = bisect.bisect_right(positions, i)
+        return positions[j] - i if j < len(positions) else n
+
+    # Each state is (reloads, key, slots, next slot, history) where the
+    # history is a linked list of (history, run, colours loaded)
+    states = [(0, 0, (-1, -2, -3), 0, None)]
+    for (i, c) in enumerate(colors):
+        if c == background or all(c in s[2] for s in states):
+            continue
+
+        upcoming = []
+        for f in colors[i+1:i+1+lookahead]:
+            if f != c and f > background and f not in upcoming:
+                upcoming.append(f)
+
+        candidates = {}
+        for (cost, _, slots, nc, history) in states:
+            if c in slots:
+                options = [((), slots, nc)]
+            elif c < 0:
+                # An initial entry has been evicted, this plan is a dead end
+                continue
+            else:
+                skip1 = [x for x in slots[nc:nc+1] if x > 0] + upcoming
+                skip2 = [x for x in slots[(nc+1)%3:][:1] if x > 0] + upcoming
+                options = []
+                for early in [()] + [(x,) for x in skip1] + \
+                             [(x, y) for x in skip1 for y in skip2]:
+                    t = list(slots)
+                    tnc = nc
+                    for x in early + (c,):
+                        if t[tnc] < 0 and next_use(t[tnc], i) < n:
+                            break
+                        t[tnc] = x
+                        tnc = (tnc + 1) % 3
+                    else:
+                        if len(set(t)) == 3:
+                            options.append((early + (c,), tuple(t), tnc))
+
+            for (loads, t, tnc) in options:
+                tcost = cost + len(loads)
+                key = sum([next_use(x, i) for x in t])
+                old = candidates.get((t, tnc))
+                if not old or (tcost, key) < old[:2]:
+                    h = (history, i, loads) if loads else history
+                    candidates[(t, tnc)] = (tcost, key, t, tnc, h)
+        states = sorted(candidates.values(), key=lambda s: s[:2])[:beam]
+        if not states:
+            return None
+
+    plan = [()] * n
+    history = states[0][4]
+    while history:
+        (history, i, loads) = history
+        plan[i] = loads
+    return plan
+
+def encode_2bit(im, vectorize=True, optimize=False):
     """2-bit palette based RLE encoder.
 
     This encoder has a reprogrammable 2-bit palette. This allows it to encode
@@ -160,27 +331,54 @@ def encode_2bit(im):
     The encoding competes well with the 1-bit encoder for small monochrome
     images but once run-lengths longer than 62 start to become frequent then
     this encoding is about 30% larger than a 1-bit encoding.
+
+    By default a colour is loaded into the palette when it is first needed.
+    When optimize is set then the palette reloads are planned (see
+    :py:meth:`plan_reloads`) to minimise the number of reloads, which
+    results in smaller images that are also faster to decode. Either way
+    the palette is loaded in the order expected by the decoder.
     """
-    pixels = im.load()
     assert(im.width <= 255)
     assert(im.height <= 255)
 
-    full_palette = ReverseCLUT(clut8_rgb888)
+    image_runs = runs(im, vectorize)
+    full_palette = reverse_clut()
+    full_palette.prime([rgb888(px) for (px, _) in image_runs])
+    colors = [full_palette(rgb888(px)) for (px, _) in image_runs]
+
+    # Load each colour when it is first needed. Runs drawn from the
+    # initial palette are relabelled (see plan_reloads()).
+    plan = []
+    palette = list(_PALETTE_2BIT)
+    initial = [False, True, True, True]
+    next_color = 1
+    for (i, c) in enumerate(colors):
+        if c in palette:
+            plan.append(())
+            slot = palette.index(c)
+            if initial[slot]:
+                colors[i] = -slot
+        else:
+            plan.append((c,))
+            palette[next_color] = c
+            initial[next_color] = False
+            next_color = next_color % 3 + 1
+
+    if optimize:
+        optimized = plan_reloads(colors)
+        if optimized and sum(map(len, optimized)) < sum(map(len, plan)):
+            plan = optimized
 
     rle = []
-    rl = 0
-    px = pixels[0, 0]
-    # black, grey25, grey50, white
-    palette = [0, 254, 219, 215]
+    palette = [0, -1, -2, -3]
     next_color = 1
 
-    def encode_pixel(px, rl):
+    def encode_pixel(px, rl, loads):
         nonlocal next_color
-        px = full_palette((px[0] << 16) + (px[1] << 8) + px[2])
-        if px not in palette:
+        for c in loads:
             rle.append(next_color << 6)
-            rle.append(px)
-            palette[next_color] = px
+            rle.append(c)
+            palette[next_color] = c
             next_color += 1
             if next_color >= len(palette):
                 next_color = 1
@@ -200,73 +398,74 @@ def encode_2bit(im):
     rle.append(im.width)
     rle.append(im.height)
 
-    for y in range(im.height):
-        for x in range(im.width):
-            newpx = pixels[x, y]
-            if newpx == px:
-                rl += 1
-                assert(rl < (1 << 21))
-                continue
-
-            # Code the previous run
-            encode_pixel(px, rl)
-
-            # Start a new run
-            rl = 1
-            px = newpx
-
-    # Handle the final run
-    encode_pixel(px, rl)
+    for ((_, rl), px, loads) in zip(image_runs, colors, plan):
+        assert(rl < (1 << 21))
+        encode_pixel(px, rl, loads)
 
     return bytes(rle)
 
-def encode_8bit(im):
-    """Experimental 8-bit RLE encoder.
-
-    For monochrome images this is about 3x less efficient than the 1-bit
-    encoder. This encoder is not currently used anywhere in wasp-os and
-    currently there is no decoder either (so don't assume this code
-    actually works).
+def encode_8bit(im, vectorize=True):
+    """8-bit CLUT based RLE encoder.
+
+    Every pixel is mapped to the nearest colour in the wasp-os CLUT (see
+    :py:meth:`clut8_rgb888`) so there is no palette to reload; this makes
+    the encoding a better choice than the 2-bit encoder for images with
+    many colours, such as anti-aliased or full colour artwork.
+
+    The image starts with a descriptor (8, width, height) and then each run
+    is coded as a CLUT index followed by a run length. A run length of 255
+    is extended by the bytes that follow, which are summed until a byte
+    other than 255 is found (exactly as for 2-bit images). A run length of
+    zero means the run is a single pixel that is followed by a literal
+    block: a count and then count CLUT indices, each of which is also a
+    single pixel. Literal blocks avoid spending two bytes on every pixel
+    in areas of fine detail.
     """
-    pixels = im.load()
+    assert(im.width <= 255)
+    assert(im.height <= 255)
 
-    rle = []
-    rl = 0
-    px = pixels[0, 0]
+    image_runs = runs(im, vectorize)
+    full_palette = reverse_clut()
+    full_palette.prime([rgb888(px) for (px, _) in image_runs])
 
-    def encode_pixel(px, rl):
-        px = (px[0] & 0xe0) | ((px[1] & 0xe0) >> 3) | ((px[2] & 0xc0) >> 6)
+    # Convert to CLUT indices, merging runs that map to the same index
+    runs8 = []
+    for (px, rl) in image_runs:
+        px = full_palette(rgb888(px))
+        if runs8 and runs8[-1][0] == px:
+            runs8[-1][1] += rl
+        else:
+            runs8.append([px, rl])
 
-        rle.append(px)
-        if rl > 0:
-            rle.append(px)
-        rl -= 2
-        if rl > (1 << 14):
-            rle.append(0x80 | ((rl >> 14) & 0x7f))
-        if rl > (1 <<  7):
-            rle.append(0x80 | ((rl >>  7) & 0x7f))
-        if rl >= 0:
-            rle.append(         rl        & 0x7f )
-
-    for y in range(im.height):
-        for x in range(im.width):
-            newpx = pixels[x, y]
-            if newpx == px:
-                rl += 1
-                assert(rl < (1 << 21))
-                continue
+    # Issue the descriptor
+    rle = [8, im.width, im.height]
 
-            # Code the previous run
-            encode_pixel(px, rl)
+    i = 0
+    while i < len(runs8):
+        (px, rl) = runs8[i]
+        i += 1
 
-            # Start a new run
-            rl = 1
-            px = newpx
+        # Gather single pixels into a literal block (when it saves space)
+        lit = 0
+        while (rl == 1 and lit < 255 and i + lit < len(runs8) and
+               runs8[i + lit][1] == 1):
+            lit += 1
+        if lit >= 2:
+            rle += [px, 0, lit]
+            rle += [index for (index, _) in runs8[i:i + lit]]
+            i += lit
+            continue
 
-    # Handle the final run
-    encode_pixel(px, rl)
+        rle.append(px)
+        if rl >= 255:
+            rle.append(255)
+            rl -= 255
+            while rl >= 255:
+                rle.append(255)
+                rl -= 255
+        rle.append(rl)
 
-    return (im.width, im.height, bytes(rle))
+    return bytes(rle)
 
 def render_c(image, fname, indent, depth):
     extra_indent = ' ' * indent
@@ -314,6 +513,24 @@ def render_py(image, fname, indent, depth):
     print(f'{extra_indent})')
 
 
+def render_clut_table(name='_CLUT8'):
+    """Render the RGB565 CLUT as a (big-endian) python bytes literal.
+
+    The output is used by draw565 as a lookup table. This allows the
+    table to be placed in flash when the module is frozen.
+    """
+    table = []
+    for i in range(256):
+        rgb565 = clut8_rgb565(i)
+        table.append(rgb565 >> 8)
+        table.append(rgb565 & 0xff)
+
+    print(f'{name} =\\')
+    for i in range(0, len(table), 16):
+        row = ''.join([f'\\x{b:02x}' for b in table[i:i+16]])
+        end = '\\' if i + 16 < len(table) else ''
+        print(f"b'{row}'{end}")
+
 def decode_to_ascii(image):
     (sx, sy, rle) = image
     data = bytearray(2*sx)
@@ -341,47 +558,234 @@ def decode_to_ascii(image):
     # Check the image is the correct length
     assert(dp == 0)
 
-parser = argparse.ArgumentParser(description='RLE encoder tool.')
-parser.add_argument('files', nargs='*',
-                    help='files to be encoded')
-parser.add_argument('--ascii', action='store_true',
-                    help='Run the resulting image(s) through an ascii art decoder')
-parser.add_argument('--c', action='store_true',
-                    help='Render the output as C instead of python')
-parser.add_argument('--clut', default=0, type=int,
-                    help='Lookup a colour value in the CLUT')
-parser.add_argument('--indent', default=0, type=int,
-                    help='Add extra indentation in the generated code')
-parser.add_argument('--1bit', action='store_const', const=1, dest='depth',
-                    help='Generate 1-bit image')
-parser.add_argument('--2bit', action='store_const', const=2, dest='depth',
-                    help='Generate 2-bit image')
-parser.add_argument('--8bit', action='store_const', const=8, dest='depth',
-                    help='Generate 8-bit image')
-
-args = parser.parse_args()
-
-if args.clut:
-    print(f'{args.clut} maps to {clut8_rgb888(args.clut):06x} (RGB888) or {clut8_rgb565(args.clut):04x} (RGB565)')
-
-if args.depth == 8:
-    encoder = encode_8bit
-elif args.depth == 2:
-    encoder = encode_2bit
-elif args.depth == 1:
-    encoder = encode
-else:
-    encoder = encode_2bit
-    args.depth = 2
-
-for fname in args.files:
-    image = encoder(Image.open(fname))
-
-    if args.c:
-        render_c(image, fname, args.indent, args.depth)
+def compare(fname):
+    """Report the size of an image in each of the formats it can be coded in.
+
+    The number of runs is also reported because (along with the number of
+    pixels) it determines how long the image takes to decode.
+    """
+    im = Image.open(fname).convert('RGB')
+    sizes = []
+
+    colors = im.getcolors(2)
+    if colors and len(colors) <= 2:
+        (_, _, rle) = encode(im)
+        sizes.append(f'1-bit {len(rle)+2:5d} bytes {len(rle):5d} runs')
+
+    if im.width <= 255 and im.height <= 255:
+        rle = encode_2bit(im)
+        nruns = len([b for b in rle[3:] if b & 0x3f])
+        sizes.append(f'2-bit {len(rle):5d} bytes {nruns:5d} runs')
+        saved = len(rle) - len(encode_2bit(im, optimize=True))
+        sizes.append(f'2-bit (optimized) saves {saved:3d} bytes')
+        rle = encode_8bit(im)
+        sizes.append(f'8-bit {len(rle):5d} bytes')
+
+    print(f'{fname}: {im.width}x{im.height}, ' + ', '.join(sizes))
+
+def expand(paths):
+    """Replace any directories in paths with the PNG files they contain."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(os.path.join(path, f) for f in os.listdir(path)
+                            if f.endswith('.png'))
+        else:
+            files.append(path)
+    return files
+
+class Cache:
+    """Cache of rendered images, keyed on a hash of their content.
+
+    The key covers the image file, every option that affects the rendered
+    output and the encoder itself, so an image is only re-encoded when it,
+    or the way it is rendered, changes.
+
+    Entries written by a different version of the encoder can never be
+    used again and are evicted when the cache is loaded, as are entries
+    that have not been used for :py:attr:`MAX_AGE` seconds (typically
+    because the image has changed or been removed).
+    """
+    MAX_AGE = 30 * 24 * 60 * 60
+
+    def __init__(self, fname, encoder=__file__):
+        self.fname = fname
+        self.entries = {}
+        self.dirty = False
+        self.now = int(time.time())
+        with open(encoder, 'rb') as f:
+            self.encoder = hashlib.sha256(f.read()).hexdigest()
+
+        if fname and os.path.exists(fname):
+            with open(fname) as f:
+                entries = json.load(f)
+            for (key, entry) in entries.items():
+                if (isinstance(entry, dict)
+                        and entry.get('encoder') == self.encoder
+                        and self.now - entry.get('used', 0) < self.MAX_AGE):
+                    self.entries[key] = entry
+                else:
+                    self.dirty = True
+
+    def key(self, fname, *options):
+        h = hashlib.sha256()
+        with open(fname, 'rb') as f:
+            h.update(f.read())
+        h.update(repr((fname,) + options).encode())
+        h.update(self.encoder.encode())
+        return h.hexdigest()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        # Refreshing the timestamp rewrites the cache, so do it sparingly
+        if self.now - entry['used'] > 24 * 60 * 60:
+            entry['used'] = self.now
+            self.dirty = True
+        return entry['text']
+
+    def put(self, key, value):
+        self.entries[key] = { 'text': value, 'encoder': self.encoder,
+                              'used': self.now }
+        self.dirty = True
+
+    def save(self):
+        if self.fname and self.dirty:
+            os.makedirs(os.path.dirname(self.fname) or '.', exist_ok=True)
+            with open(self.fname, 'w') as f:
+                json.dump(self.entries, f)
+
+def default_cache():
+    cache = os.environ.get('XDG_CACHE_HOME',
+                           os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache, 'wasp-os', 'rle_encode.json')
+
+def write_if_changed(fname, text):
+    """Write a file, unless it already has the required contents.
+
+    Leaving unchanged files alone means their timestamps are preserved
+    and anything that depends on them (such as a firmware build) is
+    not needlessly rebuilt.
+
+    :returns: True if the file was written
+    """
+    if os.path.exists(fname):
+        with open(fname) as f:
+            if f.read() == text:
+                return False
+    with open(fname, 'w') as f:
+        f.write(text)
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description='RLE encoder tool.')
+    parser.add_argument('files', nargs='*',
+                        help='files to be encoded')
+    parser.add_argument('--ascii', action='store_true',
+                        help='Run the resulting image(s) through an ascii art decoder')
+    parser.add_argument('--c', action='store_true',
+                        help='Render the output as C instead of python')
+    parser.add_argument('--clut', default=0, type=int,
+                        help='Lookup a colour value in the CLUT')
+    parser.add_argument('--clut-table', action='store_true',
+                        help='Render the RGB565 CLUT as a lookup table')
+    parser.add_argument('--compare', action='store_true',
+                        help='Compare the size of each image in every format')
+    parser.add_argument('--indent', default=0, type=int,
+                        help='Add extra indentation in the generated code')
+    parser.add_argument('--1bit', action='store_const', const=1, dest='depth',
+                        help='Generate 1-bit image')
+    parser.add_argument('--2bit', action='store_const', const=2, dest='depth',
+                        help='Generate 2-bit image')
+    parser.add_argument('--8bit', action='store_const', const=8, dest='depth',
+                        help='Generate 8-bit image')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Minimise the palette reloads of 2-bit images')
+    parser.add_argument('-o', '--output',
+                        help='Write all the images to a single file')
+    parser.add_argument('--output-dir',
+                        help='Write each image to its own file in a directory')
+    parser.add_argument('--cache', default=default_cache(),
+                        help='Cache of previously encoded images '
+                             f'(default: {default_cache()})')
+    parser.add_argument('--no-cache', action='store_const', const=None,
+                        dest='cache', help='Do not cache encoded images')
+    parser.add_argument('--no-numpy', action='store_true',
+                        help='Do not use NumPy to accelerate the encoders')
+
+    args = parser.parse_args()
+
+    if args.no_numpy:
+        global np
+        np = None
+
+    if args.clut:
+        print(f'{args.clut} maps to {clut8_rgb888(args.clut):06x} (RGB888) or {clut8_rgb565(args.clut):04x} (RGB565)')
+
+    if args.clut_table:
+        render_clut_table()
+
+    files = expand(args.files)
+
+    if args.compare:
+        for fname in files:
+            compare(fname)
+        return
+
+    if args.depth == 8:
+        encoder = encode_8bit
+    elif args.depth == 2:
+        encoder = encode_2bit
+    elif args.depth == 1:
+        encoder = encode
     else:
-        render_py(image, fname, args.indent, args.depth)
+        encoder = encode_2bit
+        args.depth = 2
+    if args.optimize and encoder == encode_2bit:
+        encoder = lambda im: encode_2bit(im, optimize=True)
 
     if args.ascii:
-        print()
-        decode_to_ascii(image)
+        for fname in files:
+            image = encoder(Image.open(fname))
+            render_py(image, fname, args.indent, args.depth)
+            print()
+            decode_to_ascii(image)
+        return
+
+    # Encode the images (unless they are cached)
+    cache = Cache(args.cache if args.output or args.output_dir else None)
+    rendered = []
+    for fname in files:
+        key = cache.key(fname, args.depth, args.c, args.indent,
+                        args.optimize)
+        text = cache.get(key)
+        if text is None:
+            image = encoder(Image.open(fname))
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                if args.c:
+                    render_c(image, fname, args.indent, args.depth)
+                else:
+                    render_py(image, fname, args.indent, args.depth)
+            text = out.getvalue()
+            cache.put(key, text)
+        rendered.append((fname, text))
+    cache.save()
+
+    if args.output_dir:
+        ext = '.c' if args.c else '.py'
+        for (fname, text) in rendered:
+            out = os.path.join(args.output_dir, varname(fname) + ext)
+            if write_if_changed(out, text):
+                print(f'Wrote {out}', file=sys.stderr)
+    elif args.output:
+        text = '\n'.join([text for (_, text) in rendered])
+        if write_if_changed(args.output, text):
+            print(f'Wrote {args.output}', file=sys.stderr)
+    else:
+        for (_, text) in rendered:
+            sys.stdout.write(text)
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,28 @@ from argparse import ArgumentParser, RawTextHelpFormatter
 from importlib import import_module
 from typing import Tuple
 
+R = 0b11111_000000_00000
+G = 0b00000_111111_00000
+B = 0b00000_000000_11111
+
+def lighten(color: int, step: int = 1) -> int:
+    """Get a lighter shade (matches Draw565.lighten)"""
+    r = min((color & R) + (step << 11), R)
+    g = min((color & G) + (step << 6), G)
+    b = min((color & B) + step, B)
+    return r | g | b
+
+def darken(color: int, step: int = 1) -> int:
+    """Get a darker shade (matches Draw565.darken)"""
+    rm = color & R
+    rs = step << 11
+    gm = color & G
+    gs = step << 6
+    bm = color & B
+    return ((rm - rs if rm > rs else 0) |
+            (gm - gs if gm > gs else 0) |
+            (bm - step if bm > step else 0))
+
 class DefaultTheme():
     """This represents the default theme.
 
@@ -24,8 +46,25 @@ class DefaultTheme():
     SPOT2 = 0xddd0
     CONTRAST = 15
 
+    def derive(self) -> Tuple[int, ...]:
+        """Calculates the derived shades.
+
+        The shades are in slot order (wasp.Theme.UI_DARK onwards) and
+        must match Manager._compile_theme() in wasp.py.
+        """
+        return (darken(self.UI),
+                lighten(self.UI, self.CONTRAST),
+                darken(self.UI, self.CONTRAST),
+                lighten(self.SPOT1, self.CONTRAST),
+                darken(self.SPOT1, self.CONTRAST))
+
     def serialize(self) -> bytes:
-        """Serializes the theme for use in wasp-os"""
+        """Serializes the theme for use in wasp-os
+
+        The result is a compiled theme: every slot (indexed by
+        wasp.Theme) including the precomputed derived shades, so that
+        wasp-os does not have to calculate them.
+        """
         def split_bytes(x: int) -> Tuple[int, int]:
             return ((x >> 8) & 0xFF, x & 0xFF)
         theme_bytes = bytes([
@@ -39,7 +78,8 @@ class DefaultTheme():
             *split_bytes(self.UI),
             *split_bytes(self.SPOT1),
             *split_bytes(self.SPOT2),
-            *split_bytes(self.CONTRAST)
+            *split_bytes(self.CONTRAST),
+            *[b for x in self.derive() for b in split_bytes(x)]
         ])
         return theme_bytes
 
@@ -66,19 +106,20 @@ theme.py:
     from themer import DefaultTheme
 
     class Theme(DefaultTheme):
-        BLE_ICON_COLOR = 0x041F
+        BLE_COLOR = 0x041F
 
 shell:
 
     # NOTE: do not include .py at end of file!
     $ ./themer.py theme
-    > b'\\xef{\\xef{\\xef{<\\xe7\\xef{\\xb6\\xb5\\xb6\\xbd\\xff\\xff\\xff9'
+    > b'\\x04\\x1f{\\xef{\\xef\\xe7<{\\xef\\xff\\xff\\xbd\\xb69\\xff\\xff\\x00\\xdd\\xd0\\x00\\x0f1\\xbe\\xb5\\xbf\\x00\\x10\\xff\\xef\\x83@'
 
 main.py:
 
     ...
     wasp.system.set_theme(
-        b'\\xef{\\xef{\\xef{<\\xe7\\xef{\\xb6\\xb5\\xb6\\xbd\\xff\\xff\\xff9')
+        b'\\x04\\x1f{\\xef{\\xef\\xe7<{\\xef\\xff\\xff\\xbd\\xb69\\xff'
+        b'\\xff\\x00\\xdd\\xd0\\x00\\x0f1\\xbe\\xb5\\xbf\\x00\\x10\\xff\\xef\\x83@')
     ...
 ''',
         formatter_class=RawTextHelpFormatter
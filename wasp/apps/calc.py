@@ -89,10 +89,10 @@ class CalculatorApp():
     def _draw(self):
         draw = wasp.watch.drawable
 
-        hi = wasp.system.theme('bright')
-        lo = wasp.system.theme('mid')
+        hi = wasp.system.theme(wasp.Theme.BRIGHT)
+        lo = wasp.system.theme(wasp.Theme.MID)
         mid = draw.lighten(lo, 2)
-        bg = draw.darken(wasp.system.theme('ui'), wasp.system.theme('contrast'))
+        bg = wasp.system.theme(wasp.Theme.UI_DARKER)
         bg2 = draw.darken(bg, 2)
 
         # Draw the background
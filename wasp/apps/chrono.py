@@ -58,8 +58,8 @@ class ChronoApp():
         True then a full redraw is be performed.
         """
         draw = wasp.watch.drawable
-        hi = wasp.system.theme('bright')
-        c1 = draw.darken(wasp.system.theme('spot1'), wasp.system.theme('contrast'))
+        hi = wasp.system.theme(wasp.Theme.BRIGHT)
+        c1 = wasp.system.theme(wasp.Theme.SPOT1_DARKER)
 
         if redraw:
             now = wasp.watch.rtc.get_localtime()
@@ -71,7 +71,7 @@ class ChronoApp():
             wasp.system.bar.draw()
 
             # Draw the dividers
-            draw.set_color(wasp.system.theme('mid'))
+            draw.set_color(wasp.system.theme(wasp.Theme.MID))
             for theta in range(12):
                 draw.polar(120, 120, theta * 360 // 12, 110, 118, 3)
 
@@ -67,8 +67,8 @@ class ClockApp():
         True then a full redraw is be performed.
         """
         draw = wasp.watch.drawable
-        hi =  wasp.system.theme('bright')
-        lo =  wasp.system.theme('mid')
+        hi =  wasp.system.theme(wasp.Theme.BRIGHT)
+        lo =  wasp.system.theme(wasp.Theme.MID)
         mid = draw.lighten(lo, 1)
 
         if redraw:
@@ -244,8 +244,9 @@ class GameOfLifeApp():
             if x < 0 or x >= 240 or y < 0 or y >= 240:
                 return
 
-            display.set_window(x, y, 4, 4)
-            display.write_data(px)
+            display.quick_window(x, y, 4, 4)
+            display.quick_write(px)
+            display.quick_end()
 
         draw_cell(1, display, alive if b[1//32] & (1 << (1 & 0x1f)) else dead)
         v = xorshift12(1)
@@ -11,6 +11,7 @@ A graphing heart rate monitor using a PPG sensor.
 """
 
 import wasp
+import array
 import machine
 import ppg
 
@@ -26,13 +27,14 @@ class HeartApp():
         # take long enough it is not needed
         draw = wasp.watch.drawable
         draw.fill()
-        draw.set_color(wasp.system.theme('bright'))
+        draw.set_color(wasp.system.theme(wasp.Theme.BRIGHT))
         draw.string('PPG graph', 0, 6, width=240)
 
         wasp.system.request_tick(1000 // 8)
 
         self._hrdata = ppg.PPG(wasp.watch.hrs.read_hrs())
         self._x = 0
+        self._rects = array.array('H', (0,) * 10)
 
     def background(self):
         wasp.watch.hrs.disable()
@@ -45,12 +47,12 @@ class HeartApp():
         spl = self._hrdata.preprocess(wasp.watch.hrs.read_hrs())
 
         if len(self._hrdata.data) >= 240:
-            draw.set_color(wasp.system.theme('bright'))
+            draw.set_color(wasp.system.theme(wasp.Theme.BRIGHT))
             draw.string('{} bpm'.format(self._hrdata.get_heart_rate()),
                         0, 6, width=240)
 
         # Graph is orange by default...
-        color = wasp.system.theme('spot1')
+        color = wasp.system.theme(wasp.Theme.SPOT1)
 
         # If the maths goes wrong lets show it in the chart!
         if spl > 100 or spl < -100:
@@ -60,8 +62,10 @@ class HeartApp():
         spl += 104
 
         x = self._x
-        draw.fill(0, x, 32, 1, 208-spl)
-        draw.fill(color, x, 239-spl, 1, spl)
+        rects = self._rects
+        n = wasp.widgets.add_rect(rects, 0, x, 32, 1, max(207-spl, 0), 0)
+        n = wasp.widgets.add_rect(rects, n, x, 239-spl, 1, spl, color)
+        draw.fill_rects(rects, n)
         x += 2
         if x >= 240:
             x = 0
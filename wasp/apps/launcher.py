@@ -42,9 +42,7 @@ class LauncherApp():
                 return
 
         self._page = i
-        wasp.watch.display.mute(True)
-        self._draw()
-        wasp.watch.display.mute(False)
+        wasp.watch.drawable.render(self._draw)
 
     def touch(self, event):
         page = self._get_page(self._page)
@@ -75,7 +73,7 @@ class LauncherApp():
             if not app:
                 return
             draw.blit(app.ICON if 'ICON' in dir(app) else icons.app, x+13, y+12)
-            draw.set_color(wasp.system.theme('mid'))
+            draw.set_color(wasp.system.theme(wasp.Theme.MID))
             draw.string(app.NAME, x, y+120-30, 120)
 
         draw = wasp.watch.drawable
@@ -31,54 +31,113 @@ class PagerApp():
 
     def background(self):
         """De-activate the application."""
-        self._chunks = None
-        self._numpages = None
+        self._wrapper = None
 
     def swipe(self, event):
         """Swipe to page up/down."""
         if event[0] == wasp.EventType.UP:
-            if self._page >= self._numpages:
+            if not self._more():
                 wasp.system.navigate(wasp.EventType.BACK)
                 return
-            self._page += 1
+            self._turn(1)
         else:
             if self._page <= 0:
                 wasp.watch.vibrator.pulse()
                 return
-            self._page -= 1
-        self._draw()
+            self._turn(-1)
 
     def _redraw(self):
         """Redraw from scratch (jump to the first page)"""
         self._page = 0
-        self._chunks = wasp.watch.drawable.wrap(self._msg, 240)
-        self._numpages = (len(self._chunks) - 2) // 9
+        self._wrapper = wasp.watch.drawable.wrapper(self._msg, 240)
         self._draw()
 
+    def _more(self):
+        """Check whether there is another page after the current one.
+
+        Pages are wrapped lazily so this wraps (at most) one more page
+        of the message.
+        """
+        return self._wrapper.line((self._page + 1) * 9) is not None
+
     def _draw(self):
         """Draw a page from scratch."""
-        mute = wasp.watch.display.mute
+        wasp.watch.drawable.render(self._paint)
+
+    def _paint(self):
         draw = wasp.watch.drawable
 
-        mute(True)
         draw.set_color(0xffff)
         draw.fill()
 
-        page = self._page
-        i = page * 9
-        j = i + 11
-        chunks = self._chunks[i:j]
-        for i in range(len(chunks)-1):
-            sub = self._msg[chunks[i]:chunks[i+1]].rstrip()
-            draw.string(sub, 0, 24*i)
+        line = self._page * 9
+        wrapper = self._wrapper
+        for i in range(10):
+            chunk = wrapper.line(line + i)
+            if not chunk:
+                break
+            draw.string(self._msg[chunk[0]:chunk[1]].rstrip(), 0, 24*i)
+
+        self._draw_scroll()
+
+    def _turn(self, step):
+        """Scroll to the next or previous page.
+
+        Consecutive pages share a line so the display is scrolled by the
+        hardware, in a single step, and only the other nine lines need to
+        be drawn.
+        """
+        draw = wasp.watch.drawable
+        self._page += step
+        line = self._page * 9
+        if step > 0:
+            self._clear_scroll(line)
+            self._lines = (line + 1, 24)
+            draw.scroll(216, self._paint_lines)
+        else:
+            self._lines = (line, 0)
+            draw.scroll(-216, self._paint_lines)
+        self._draw_scroll()
 
+    def _clear_scroll(self, line):
+        """Remove the scroll indicator before it is scrolled to the top.
+
+        The indicator is only cleared, rather than redrawing the whole
+        line, unless the text runs underneath it.
+        """
+        draw = wasp.watch.drawable
+        chunk = self._wrapper.line(line)
+        s = self._msg[chunk[0]:chunk[1]].rstrip() if chunk else ''
+        w = draw.bounding_box(s)[0] + 1
+        if w <= 240-18:
+            draw.fill(0, 240-18, 216, 18, 24)
+        else:
+            draw.set_color(0xffff)
+            draw.string(s, 0, 216)
+            if w < 240:
+                draw.fill(0, w, 216, 240-w, 24)
+
+    def _paint_lines(self):
+        """Draw the nine lines of text that were exposed by scrolling."""
+        draw = wasp.watch.drawable
+        (line, y) = self._lines
+        draw.set_color(0xffff)
+        draw.fill(None, 0, y, 240, 216)
+
+        wrapper = self._wrapper
+        for i in range(9):
+            chunk = wrapper.line(line + i)
+            if not chunk:
+                break
+            draw.string(self._msg[chunk[0]:chunk[1]].rstrip(), 0, y + 24*i)
+
+    def _draw_scroll(self):
+        page = self._page
         scroll = self._scroll
         scroll.up = page > 0
-        scroll.down = page < self._numpages
+        scroll.down = self._more()
         scroll.draw()
 
-        mute(False)
-
 class NotificationApp(PagerApp):
     NAME = 'Notifications'
 
@@ -90,7 +90,7 @@ class SettingsApp():
         self._current_setting = self._settings[self._sett_index % len(self._settings)]
         mute(True)
         draw.fill()
-        draw.set_color(wasp.system.theme('bright'))
+        draw.set_color(wasp.system.theme(wasp.Theme.BRIGHT))
         draw.set_font(fonts.sans24)
         draw.string(self._current_setting, 0, 6, width=240)
         if self._current_setting == 'Brightness':
@@ -121,7 +121,7 @@ class SettingsApp():
 
     def _update(self):
         draw = wasp.watch.drawable
-        draw.set_color(wasp.system.theme('bright'))
+        draw.set_color(wasp.system.theme(wasp.Theme.BRIGHT))
         if self._current_setting == 'Brightness':
             if wasp.system.brightness == 3:
                 say = "High"
@@ -66,10 +66,7 @@ class SoftwareApp():
             page = page + 1 if page < pages else 0
         self.page = page
 
-        mute = wasp.watch.display.mute
-        mute(True)
-        self._draw()
-        mute(False)
+        wasp.watch.drawable.render(self._draw)
 
     def touch(self, event):
         """Notify the application of a touchscreen touch event."""
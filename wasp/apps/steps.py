@@ -14,6 +14,7 @@ The step counts automatically reset at midnight.
 
 import wasp
 
+import array
 import fonts
 import icons
 import time
@@ -49,6 +50,7 @@ class StepCounterApp():
         watch.accel.reset()
         self._scroll = wasp.widgets.ScrollIndicator()
         self._wake = 0
+        self._rects = array.array('H', (0,) * (5 * 32))
 
     def foreground(self):
         """Cancel the alarm and draw the application.
@@ -132,7 +134,7 @@ class StepCounterApp():
         t = str(count)
         w = fonts.width(fonts.sans36, t)
         draw.set_font(fonts.sans36)
-        draw.set_color(draw.lighten(wasp.system.theme('spot1'), wasp.system.theme('contrast')))
+        draw.set_color(wasp.system.theme(wasp.Theme.SPOT1_LIGHTER))
         draw.string(t, 228-w, 132-18)
 
     def _update_graph(self):
@@ -154,14 +156,21 @@ class StepCounterApp():
             draw.string('No data', 239-160, 0, 160, right=True)
             return
 
-        color = wasp.system.theme('spot2')
+        color = wasp.system.theme(wasp.Theme.SPOT2)
+        rects = self._rects
 
         # Draw the frame
-        draw.fill(0x3969, 0, 39, 240, 1)
-        draw.fill(0x3969, 0, 239, 240, 1)
-        for i in (0, 60, 90, 120, 150, 180, 239):
-            draw.fill(0x3969, i, 39, 1, 201)
-
+        n = 0
+        for (x, y, w, h) in ((0, 39, 240, 1), (0, 239, 240, 1), (0, 39, 1, 201),
+                             (60, 39, 1, 201), (90, 39, 1, 201),
+                             (120, 39, 1, 201), (150, 39, 1, 201),
+                             (180, 39, 1, 201), (239, 39, 1, 201)):
+            n = wasp.widgets.add_rect(rects, n, x, y, w, h, 0x3969)
+        draw.fill_rects(rects, n)
+
+        # Draw the bars (in batches, so neighbouring bars of the same
+        # height are merged)
+        n = 0
         total = 0
         for x, d in enumerate(data):
             if d == 0 or x < 2:
@@ -170,8 +179,12 @@ class StepCounterApp():
             total += d
             d = d // 3
             if d > 200:
-                draw.fill(0xffff, x, 239-200, 1, 200)
+                n = wasp.widgets.add_rect(rects, n, x, 239-200, 1, 200, 0xffff)
             else:
-                draw.fill(color, x, 239-d, 1, d)
+                n = wasp.widgets.add_rect(rects, n, x, 239-d, 1, d, color)
+            if n == 32:
+                draw.fill_rects(rects, n)
+                n = 0
+        draw.fill_rects(rects, n)
 
         draw.string(str(total), 239-160, 0, 160, right=True)
@@ -93,7 +93,7 @@ class StopwatchApp():
         y = 240 - 6 - (len(splits) * 24)
         
         draw.set_font(fonts.sans24)
-        draw.set_color(wasp.system.theme('mid'))
+        draw.set_color(wasp.system.theme(wasp.Theme.MID))
 
         n = self._nsplits
         for i, s in enumerate(splits):
@@ -132,23 +132,34 @@ class StopwatchApp():
         # Update the statusbar
         wasp.system.bar.update()
 
-        if self._last_count != self._count:
-            centisecs = self._count
-            secs = centisecs // 100
-            centisecs %= 100
-            minutes = secs // 60
-            secs %= 60
-
-            t1 = '{}:{:02}'.format(minutes, secs)
-            t2 = '{:02}'.format(centisecs)
-
+        last = self._last_count
+        count = self._count
+        if last != count:
+            # Only redraw the minutes and seconds if they have changed
             draw = wasp.watch.drawable
+            if last < 0 or last // 100 != count // 100:
+                draw.invalidate(0, 120-36, 180, 36)
+            draw.invalidate(180, 120-36+18, 46, 24)
+            self._last_count = count
+            draw.flush(self._paint, clear=False)
+
+    def _paint(self, x, y, w, h):
+        """Repaint the damaged parts of the time (see Draw565.flush)."""
+        draw = wasp.watch.drawable
+        centisecs = self._count
+        secs = centisecs // 100
+        centisecs %= 100
+        minutes = secs // 60
+        secs %= 60
+
+        draw.set_color(wasp.system.theme(wasp.Theme.UI_LIGHTER))
+        if draw.damaged(0, 120-36, 180, 36):
+            t1 = '{}:{:02}'.format(minutes, secs)
             draw.set_font(fonts.sans36)
-            draw.set_color(draw.lighten(wasp.system.theme('ui'), wasp.system.theme('contrast')))
             w = fonts.width(fonts.sans36, t1)
             draw.string(t1, 180-w, 120-36)
             draw.fill(0, 0, 120-36, 180-w, 36)
 
+        if draw.damaged(180, 120-36+18, 46, 24):
             draw.set_font(fonts.sans24)
-            draw.string(t2, 180, 120-36+18, width=46)
-            self._last_count = self._count
+            draw.string('{:02}'.format(centisecs), 180, 120-36+18, width=46)
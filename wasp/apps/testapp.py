@@ -218,7 +218,9 @@ class TestApp():
 
     def _draw(self):
         """Redraw the display from scratch."""
-        wasp.watch.display.mute(True)
+        wasp.watch.drawable.render(self._paint)
+
+    def _paint(self):
         draw = wasp.watch.drawable
         draw.fill()
         draw.set_font(fonts.sans24)
@@ -253,7 +255,6 @@ class TestApp():
             draw.blit(self.ICON, 120-48, 120-32)
 
         self.scroll.draw()
-        wasp.watch.display.mute(False)
 
     def _update_colours(self):
         draw = wasp.watch.drawable
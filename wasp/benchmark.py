@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+"""On-device benchmarks
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Time the performance critical kernels of wasp-os (drawing, PPG signal
+processing, the game of life and text wrapping) using ``machine.Timer``.
+Each kernel is run several times and the results are printed on the
+console as JSON lines, one line per kernel, with times in microseconds:
+
+.. code-block:: python
+
+    >>> import benchmark
+    >>> benchmark.run(runs=5)
+    {"bench": "fill", "runs": 5, "min_us": 21362, "mean_us": 21401, "max_us": 21487}
+    ...
+
+The watch must be stopped (using Ctrl-C) whilst the benchmarks are running
+because they draw directly on the display. ``wasptool --benchmark`` runs
+the benchmarks and records the results, together with the board and
+firmware version, so the results from different devices can be compared.
+"""
+
+import gc
+import machine
+import wasp
+
+# Number of generations run by the game of life benchmark
+LIFE_GENERATIONS = 10
+
+def _timed(fn):
+    t = machine.Timer(id=1, period=8000000)
+    t.start()
+    fn()
+    elapsed = t.time()
+    t.stop()
+    del t
+    return elapsed
+
+def _fill():
+    draw = wasp.watch.drawable
+    return lambda: draw.fill(0xffff, 60, 60, 120, 120)
+
+def _fill_h():
+    draw = wasp.watch.drawable
+    def fill_h():
+        for i in range(60, 180, 2):
+            draw.fill(0xffff, 60, i, 120, 1)
+    return fill_h
+
+def _fill_v():
+    draw = wasp.watch.drawable
+    def fill_v():
+        for i in range(60, 180, 2):
+            draw.fill(0xffff, i, 60, 1, 120)
+    return fill_v
+
+def _string():
+    draw = wasp.watch.drawable
+    def string():
+        draw.string("The quick brown", 12, 24+24)
+        draw.string("fox jumped over", 12, 24+48)
+        draw.string("the lazy dog.", 12, 24+72)
+        draw.string("0123456789", 12, 24+120, width=228)
+        draw.string('!"£$%^&*()', 12, 24+144, width=228)
+    return string
+
+def _line():
+    draw = wasp.watch.drawable
+    points = (0, 50), (19, 46), (35, 35), (46, 19)
+    def line():
+        for x, y in points:
+            draw.line(120, 120, 120+x, 120+y, 4, 0xfb00)
+            draw.line(120, 120, 120+y, 120-x, 3, 0x07c0)
+            draw.line(120, 120, 120-x, 120-y, 5, 0x6b3f)
+            draw.line(120, 120, 120-y, 120+x, 2, 0xffe0)
+    return line
+
+def _rle():
+    import icons
+    draw = wasp.watch.drawable
+    def rle():
+        for i in range(0, 128, 16):
+            draw.blit(icons.software, i+16, i+32)
+    return rle
+
+def _wrap():
+    draw = wasp.watch.drawable
+    s = 'This\nis a very long string that will need to be ' \
+        'wrappedinmultipledifferentways!'
+    return lambda: draw.wrap(s, 240)
+
+def _ppg():
+    import array
+    import math
+    from ppg import PPG
+
+    # Ten seconds of a synthetic 72bpm pulse sampled at 24Hz
+    spl = array.array('H', [2000 + int(40 * math.sin(2 * math.pi * i / 20))
+                                for i in range(240)])
+    def ppg():
+        p = PPG(spl[0])
+        for s in spl:
+            p.preprocess(s)
+        p.get_heart_rate()
+    return ppg
+
+def _life():
+    import array
+    from apps.gameoflife import game_of_life
+
+    board = array.array('I', [0] * (64*64//32))
+    next_board = array.array('I', board)
+    def life():
+        # Seed the board with an "acorn" (like the game of life app)
+        b = board
+        nb = next_board
+        for i in range(len(b)):
+            b[i] = 0
+        b[62] = 32 << 16
+        b[64] = 8 << 16
+        b[66] = 103 << 16
+        for i in range(LIFE_GENERATIONS):
+            game_of_life(b, 64, 64, nb)
+            (b, nb) = (nb, b)
+    return life
+
+BENCHMARKS = (
+    ('fill', _fill),
+    ('fill_h', _fill_h),
+    ('fill_v', _fill_v),
+    ('string', _string),
+    ('line', _line),
+    ('rle', _rle),
+    ('wrap', _wrap),
+    ('ppg', _ppg),
+    ('life', _life),
+)
+
+def run(runs=5, only=None):
+    """Run the benchmarks and print the results as JSON lines.
+
+    :param int runs: Number of times to run each kernel
+    :param only: Names of the benchmarks to run (or None to run them all)
+    """
+    draw = wasp.watch.drawable
+    draw.reset()
+    draw.fill()
+
+    for (name, setup) in BENCHMARKS:
+        if only and name not in only:
+            continue
+        fn = setup()
+        gc.collect()
+        times = [ _timed(fn) for i in range(runs) ]
+        print('{{"bench": "{}", "runs": {}, "min_us": {}, "mean_us": {}, '
+              '"max_us": {}}}'.format(name, runs, min(times),
+                                     sum(times) // runs, max(times)))
+        del fn
+        gc.collect()
+
+    # Restore the display
+    draw.reset()
+    if wasp.system.app:
+        wasp.system.switch(wasp.system.app)
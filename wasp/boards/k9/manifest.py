@@ -9,6 +9,7 @@ import manifest_240x240
 freeze('.', 'watch.py', opt=3)
 freeze('../..', manifest_240x240.manifest +
     (
+        'benchmark.py',
         'boot.py',
         'draw565.py',
         'drivers/bma421.py',
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+""" Host benchmarks for draw565 and the widget library.
+
+The benchmarks are not run by ``make check``, use ``make bench`` instead.
+The drawing operations are the same as the TestApp benchmarks although
+these record both the wall time and the SPI traffic (and hence the
+estimated time on the watch) of each operation. See the ``bench`` fixture
+in conftest.py.
+
+The drawable is configured exactly as it is on the watch, without a glyph
+cache, image cache or band. Benchmarks that measure these attach them
+explicitly.
+"""
+
+import pytest
+import wasp
+
+import display
+import draw565
+import icons
+import logo
+import widgets
+
+pytestmark = pytest.mark.skipif(not display.HEADLESS,
+        reason='benchmarks must use the headless display (WASP_SIM_HEADLESS)')
+
+@pytest.fixture
+def draw():
+    draw = wasp.watch.drawable
+    draw.reset()
+    draw.fill(0)
+    return draw
+
+def test_fill(bench, draw):
+    bench(draw.fill, 0xffff, 60, 60, 120, 120)
+
+def test_fill_h(bench, draw):
+    def fill_h():
+        for i in range(60, 180, 2):
+            draw.fill(0xffff, 60, i, 120, 1)
+    bench(fill_h)
+
+def test_fill_v(bench, draw):
+    def fill_v():
+        for i in range(60, 180, 2):
+            draw.fill(0xffff, i, 60, 1, 120)
+    bench(fill_v)
+
+@pytest.mark.parametrize("cache", (True, False))
+def test_string(bench, draw, cache):
+    def string():
+        draw.string("The quick brown", 12, 24+24)
+        draw.string("fox jumped over", 12, 24+48)
+        draw.string("the lazy dog.", 12, 24+72)
+        draw.string("0123456789", 12, 24+120, width=228)
+        draw.string('!"£$%^&*()', 12, 24+144, width=228)
+    try:
+        if cache:
+            draw.set_glyph_cache(draw565.GlyphCache())
+        bench(string)
+    finally:
+        draw.set_glyph_cache(None)
+
+def test_wrap(bench, draw):
+    s = 'This\nis a very long string that will need to be ' \
+        'wrappedinmultipledifferentways!'
+    def wrap():
+        chunks = draw.wrap(s, 240)
+        for i in range(len(chunks)-1):
+            sub = s[chunks[i]:chunks[i+1]].rstrip()
+            draw.string(sub, 0, 48+24*i)
+    bench(wrap)
+
+def test_line(bench, draw):
+    points = (0, 50), (19, 46), (35, 35), (46, 19)
+    def line():
+        for x, y in points:
+            draw.line(120, 120, 120+x, 120+y, 4, 0xfb00)
+            draw.line(120, 120, 120+y, 120-x, 3, 0x07c0)
+            draw.line(120, 120, 120-x, 120-y, 5, 0x6b3f)
+            draw.line(120, 120, 120-y, 120+x, 2, 0xffe0)
+    bench(line)
+
+def test_blit_1bit(bench, draw):
+    bench(draw.rleblit, logo.pine64, (0, 0), 0xffff)
+
+@pytest.mark.parametrize("cache", (True, False))
+def test_blit_2bit(bench, draw, cache):
+    def blit():
+        for i in range(0, 128, 16):
+            draw.blit(icons.software, i+16, i+32)
+    try:
+        if cache:
+            draw.set_image_cache(draw565.ImageCache())
+        bench(blit)
+    finally:
+        draw.set_image_cache(None)
+
+@pytest.mark.parametrize("band", (False, True))
+def test_render(bench, draw, band):
+    def paint():
+        draw.fill()
+        draw.string("The quick brown", 12, 24+24)
+        draw.string("fox jumped over", 12, 24+48)
+        draw.blit(icons.software, 88, 120)
+        draw.line(20, 200, 220, 180, 3, 0xfb00)
+    try:
+        if band:
+            draw.set_band(draw565.Band(wasp.watch.display, 24))
+        bench(draw.render, paint)
+    finally:
+        draw.set_band(None)
+
+WIDGETS = (
+    ('BatteryMeter', lambda: widgets.BatteryMeter()),
+    ('Button', lambda: widgets.Button(20, 140, 200, 60, 'Button')),
+    ('Checkbox', lambda: widgets.Checkbox(0, 40, 'Checkbox')),
+    ('Clock', lambda: widgets.Clock()),
+    ('ConfirmationView', lambda: widgets.ConfirmationView()),
+    ('GfxButton', lambda: widgets.GfxButton(20, 20, icons.app)),
+    ('NotificationBar', lambda: widgets.NotificationBar()),
+    ('ScrollIndicator', lambda: widgets.ScrollIndicator()),
+    ('Slider', lambda: widgets.Slider(32, 10, 90)),
+    ('Spinner', lambda: widgets.Spinner(50, 60, 0, 99, 2)),
+    ('StatusBar', lambda: widgets.StatusBar()),
+)
+
+@pytest.mark.parametrize("name,factory", WIDGETS,
+                         ids=[w[0] for w in WIDGETS])
+def test_widget(bench, draw, name, factory):
+    widget = factory()
+    if name == 'ConfirmationView':
+        bench(widget.draw, 'Are you sure?')
+    else:
+        bench(widget.draw)
+
+def test_every_widget():
+    classes = { name for (name, cls) in vars(widgets).items()
+                     if isinstance(cls, type) and hasattr(cls, 'draw') }
+    assert classes == { w[0] for w in WIDGETS }
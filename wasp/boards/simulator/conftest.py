@@ -1,8 +1,13 @@
 import glob
 import importlib
 import inspect
+import json
+import math
+import os
 import pytest
 
+BUDGET = os.path.join(os.path.dirname(__file__), 'render_budget.json')
+
 def discover_app_constructors():
     apps = []
 
@@ -23,3 +28,171 @@ def discover_app_constructors():
 def pytest_generate_tests(metafunc):
     if 'constructor' in metafunc.fixturenames:
          metafunc.parametrize('constructor', discover_app_constructors())
+
+def pytest_addoption(parser):
+    group = parser.getgroup('render', 'render-cost budgets')
+    group.addoption('--render-budget', default=BUDGET,
+                    help='file containing the render-cost budget of each '
+                         'application')
+    group.addoption('--update-render-budget', action='store_true',
+                    help='replace the render-cost budgets with the measured '
+                         'costs (plus some headroom)')
+
+    group = parser.getgroup('bench', 'benchmarks')
+    group.addoption('--bench-json', metavar='FILE',
+                    help='save the benchmark results to a JSON file')
+    group.addoption('--bench-compare', metavar='FILE',
+                    help='compare the benchmark results with a baseline '
+                         '(saved using --bench-json)')
+
+class RenderBudget(object):
+    """Compare the estimated cost of drawing with a stored budget."""
+    def __init__(self, fname, update):
+        self.fname = fname
+        self.update = update
+        self.budget = {}
+        if os.path.exists(fname):
+            with open(fname) as f:
+                self.budget = json.load(f)
+
+    def check(self, name, kind, us, cost):
+        """Check the cost of drawing against the budget.
+
+        :param name: Application name
+        :param kind: Kind of drawing ('first' or 'tick')
+        :param us: Estimated time, in microseconds, taken on the watch
+        :param cost: Counts the estimate was made from
+        """
+        if self.update:
+            # Allow 25% (and 200us) headroom for drawing that depends on
+            # the time of day or the state of the simulated sensors
+            self.budget.setdefault(name, {})[kind] = \
+                    100 * math.ceil((1.25 * us + 200) / 100)
+            return
+
+        budget = self.budget.get(name, {}).get(kind)
+        if budget is None:
+            pytest.skip(f'{name} has no {kind} budget '
+                        '(use --update-render-budget)')
+        assert us <= budget, \
+                f'{name}: {kind} takes {us/1000:.2f}ms ' \
+                f'(budget {budget/1000:.2f}ms): {cost}'
+
+    def save(self):
+        with open(self.fname, 'w') as f:
+            json.dump(self.budget, f, indent=4, sort_keys=True)
+            f.write('\n')
+
+@pytest.fixture(scope='session')
+def render_budget(request):
+    budget = RenderBudget(request.config.getoption('render_budget'),
+                          request.config.getoption('update_render_budget'))
+    yield budget
+    if budget.update:
+        budget.save()
+
+@pytest.fixture(scope='session')
+def render_profiler():
+    import profiler
+    import wasp
+
+    p = profiler.Profiler(wasp.watch.spi)
+    yield p
+    p.close()
+
+_bench_results = {}
+
+class Bench(object):
+    """Measure the wall time and SPI traffic of a drawing operation.
+
+    This is called in the same way as the pytest-benchmark fixture:
+
+    .. code-block:: python
+
+        def test_fill(bench):
+            bench(draw.fill, 0xffff, 60, 60, 120, 120)
+    """
+    def __init__(self, name, profiler, min_time=0.2, min_rounds=5,
+                 max_rounds=1000):
+        self.name = name
+        self.profiler = profiler
+        self.min_time = min_time
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+
+    def __call__(self, fn, *args):
+        import time
+
+        # The first call fills the caches and is not measured
+        result = fn(*args)
+        (_, cost) = self.profiler.measure(fn, *args)
+
+        times = []
+        start = time.perf_counter()
+        while len(times) < self.max_rounds and (
+                len(times) < self.min_rounds or
+                time.perf_counter() - start < self.min_time):
+            t = time.perf_counter()
+            fn(*args)
+            times.append(time.perf_counter() - t)
+
+        stats = {
+            'rounds': len(times),
+            'min_s': min(times),
+            'mean_s': sum(times) / len(times),
+            'spi_bytes': cost.cmd_bytes + cost.param_bytes + cost.pixel_bytes,
+            'watch_us': round(self.profiler.time_us(cost)),
+        }
+        for field in cost.FIELDS:
+            stats[field] = getattr(cost, field)
+        _bench_results[self.name] = stats
+        return result
+
+@pytest.fixture
+def bench(request, render_profiler):
+    return Bench(request.node.name, render_profiler)
+
+def _percent(now, then):
+    if then is None:
+        return '    new'
+    if not then:
+        return f'{"":7}' if not now else '    new'
+    return f'{100 * (now - then) / then:+6.1f}%'
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _bench_results:
+        return
+    fname = config.getoption('bench_compare')
+    if fname:
+        with open(fname) as f:
+            baseline = json.load(f)['benchmarks']
+
+    columns = (('spi_bytes', 'SPI bytes', 1, '10'),
+               ('watch_us', 'watch (ms)', 0.001, '10.2f'),
+               ('min_s', 'wall (ms)', 1000, '10.3f'))
+    tr = terminalreporter
+    tr.write_sep('-', 'benchmarks')
+    header = f'{"name":32}'
+    for (_, title, _, _) in columns:
+        header += f' {title:>10}' + (' ' * 8 if fname else '')
+    tr.write_line(header)
+    for (name, stats) in sorted(_bench_results.items()):
+        line = f'{name:32}'
+        for (field, _, scale, fmt) in columns:
+            line += f' {stats[field] * scale:{fmt}}'
+            if fname:
+                then = baseline.get(name, {}).get(field)
+                line += ' ' + _percent(stats[field], then)
+        tr.write_line(line)
+
+def pytest_sessionfinish(session):
+    fname = session.config.getoption('bench_json')
+    if fname and _bench_results:
+        import platform
+        with open(fname, 'w') as f:
+            json.dump({
+                    'python': platform.python_version(),
+                    'machine': platform.machine(),
+                    'benchmarks': _bench_results,
+                }, f, indent=4, sort_keys=True)
+            f.write('\n')
@@ -6,21 +6,24 @@
 import warnings
 warnings.simplefilter("ignore", lineno=58)
 
+import os
 import sys
-import sdl2
-import sdl2.ext
+import time
 import numpy as np
-from PIL import Image
 import wasp
 
-DISPOFF = 0x28
-DISPON = 0x29
-CASET = 0x2a
-RASET = 0x2b
-RAMWR = 0x2c
+from framebuffer import Framebuffer, rgb888, WIDTH, HEIGHT, MEMORY_ROWS
 
-WIDTH = 240
-HEIGHT = 240
+# Set WASP_SIM_HEADLESS to draw into frame memory without creating a window
+HEADLESS = bool(os.environ.get('WASP_SIM_HEADLESS'))
+if not HEADLESS:
+    import sdl2
+    import sdl2.ext
+    from PIL import Image
+
+# Maximum rate at which the window is refreshed (0 refreshes after every
+# write to the display)
+FPS = int(os.environ.get('WASP_SIM_FPS', 60))
 
 SKIN = {
     'fname' : 'res/simulator_skin.png',
@@ -29,92 +32,57 @@ SKIN = {
     'offset' : (53, 93)
 }
 
-class ST7789Sim(object):
+class ST7789Sim(Framebuffer):
+    """Emulated ST7789 that shows the panel in the simulator window."""
     def __init__(self):
+        super().__init__()
+        self.fps = FPS
+        self._refreshed = 0
+        self._pending = False
 
-        self.x = 0
-        self.y = 0
-        self.colclip = [0, WIDTH-1]
-        self.rowclip = [0, HEIGHT-1]
-        self.cmd = 0
-        self.mute = False
-
-    def write(self, data):
-        # Converting data to a memoryview ensures we act more like spi.write()
-        # when running in a real device (e.g. data must be  bytes-like object
-        # that implements the buffer protocol)
-        data = memoryview(data)
-
-        if len(data) == 1:
-            # Assume if we get a byte at a time then it is command.
-            # This is a simplification do we don't have to track
-            # the D/C pin from within the simulator.
-            cmd = data[0]
-            if cmd == DISPOFF:
-                self.mute = True
-            elif cmd == DISPON:
-                self.mute = False
-                window.refresh()
-            else:
-                self.cmd = data[0]
-
-        elif self.cmd == CASET:
-            self.colclip[0] = (data[0] << 8) + data[1]
-            assert(self.colclip[0] >= 0 and self.colclip[0] <= 240)
-            self.colclip[1] = (data[2] << 8) + data[3]
-            assert(self.colclip[1] >= 0 and self.colclip[1] <= 240)
-            self.x = self.colclip[0]
-
-        elif self.cmd == RASET:
-            self.rowclip[0] = (data[0] << 8) + data[1]
-            assert(self.rowclip[0] >= 0 and self.rowclip[0] <= 240)
-            self.rowclip[1] = (data[2] << 8) + data[3]
-            assert(self.rowclip[1] >= 0 and self.rowclip[1] <= 240)
-            self.y = self.rowclip[0]
-
-        elif self.cmd == RAMWR:
-            #pixelview = sdl2.ext.PixelView(windowsurface)
-            pixelview = sdl2.ext.pixels2d(windowsurface)
-
-            half = False
-            for d in data:
-                if not half:
-                    rgb = d << 8
-                    half = True
-                    continue
-                rgb |= d
-                half = False
-
-                #pixel = ((rgb & 0xf800) >> 8,
-                #         (rgb & 0x07e0) >> 3,
-                #         (rgb & 0x001f) << 3)
-                pixel = (((rgb & 0xf800) << 8) +
-                         ((rgb & 0x07e0) << 5) +
-                         ((rgb & 0x001f) << 3))
-            
-                pv_x = self.x + SKIN['adjust'][0]
-                pv_y = self.y + SKIN['adjust'][1]
-                pixelview[pv_x][pv_y] = pixel
-
-                self.x += 1
-                if self.x > self.colclip[1]:
-                    self.x = self.colclip[0]
-                    self.y += 1
-                if self.y > self.rowclip[1]:
-                    self.y = self.rowclip[0]
-            
-            # Forcibly release the surface to ensure it is unlocked
-            del pixelview
-            if not self.mute:
-                window.refresh()
+    def refresh(self, force=False):
+        """Refresh the window (but no more than fps times a second).
+
+        If the window was refreshed too recently then the refresh is
+        deferred until the next call to :py:meth:`flush`.
+        """
+        if self.mute:
+            return
+        now = time.monotonic()
+        if force or not self.fps or now - self._refreshed >= 1 / self.fps:
+            window.refresh()
+            self._refreshed = now
+            self._pending = False
+        else:
+            self._pending = True
+
+    def flush(self):
+        """Perform any refresh that was deferred by :py:meth:`refresh`."""
+        if self._pending:
+            self.refresh()
+
+    def repaint(self, rows=None):
+        """Copy rows of frame memory to the window."""
+        if rows is None:
+            rows = np.arange(MEMORY_ROWS)
+        panel = self.panel_rows(rows)
+        visible = panel < HEIGHT
+
+        pixelview = sdl2.ext.pixels2d(windowsurface)
+        ax = SKIN['adjust'][0]
+        ay = SKIN['adjust'][1]
+        pixelview[ax:ax+WIDTH, ay+panel[visible]] = \
+                rgb888(self.memory[rows[visible]]).T
+
+        # Forcibly release the surface to ensure it is unlocked
+        del pixelview
+        self.refresh()
 
 class CST816SSim():
     def __init__(self):
         self.regs = bytearray(64)
 
     def readfrom_mem_into(self, addr, reg, dbuf, pins):
-        tick(pins)
-
         if not self.regs[1]:
             raise OSError
 
@@ -125,8 +93,6 @@ class CST816SSim():
             self.regs[1] = 0
 
     def writeto_mem(self, addr, reg, buf, pins):
-        tick(pins)
-
         if reg == 0xa5:
             # This will be a sleep command... which we can ignore
             return
@@ -197,7 +163,7 @@ class CST816SSim():
 
     def swipe(self, direction):
         pins = wasp.watch.Pin.pins
-        if direction ==' up':
+        if direction == 'up':
             self.regs[1] = 1
         elif direction == 'down':
             self.regs[1] = 2
@@ -224,18 +190,21 @@ SKIN['window'] = (SKIN['size'][0] + SKIN['left_pad'] + SKIN['right_pad'],
 SKIN['adjust'] = (SKIN['offset'][0] + SKIN['left_pad'],
                   SKIN['offset'][1] + SKIN['top_pad'])
 
-sdl2.ext.init()
-window = sdl2.ext.Window("ST7789", size=SKIN['window'])
-window.show()
-windowsurface = window.get_surface()
-sdl2.ext.fill(windowsurface, (0xff, 0xff, 0xff))
-skin = sdl2.ext.load_image(SKIN['fname'])
-sdl2.SDL_BlitSurface(skin, None, windowsurface, sdl2.SDL_Rect(
-        SKIN['left_pad'], SKIN['top_pad'], SKIN['size'][0], SKIN['size'][1]))
-sdl2.SDL_FreeSurface(skin)
-window.refresh()
-
-spi_st7789_sim = ST7789Sim()
+if HEADLESS:
+    spi_st7789_sim = Framebuffer()
+else:
+    sdl2.ext.init()
+    window = sdl2.ext.Window("ST7789", size=SKIN['window'])
+    window.show()
+    windowsurface = window.get_surface()
+    sdl2.ext.fill(windowsurface, (0xff, 0xff, 0xff))
+    skin = sdl2.ext.load_image(SKIN['fname'])
+    sdl2.SDL_BlitSurface(skin, None, windowsurface, sdl2.SDL_Rect(
+            SKIN['left_pad'], SKIN['top_pad'], SKIN['size'][0], SKIN['size'][1]))
+    sdl2.SDL_FreeSurface(skin)
+    window.refresh()
+
+    spi_st7789_sim = ST7789Sim()
 i2c_cst816s_sim = CST816SSim()
 
 def save_image(surface, fname):
@@ -259,6 +228,11 @@ def save_image(surface, fname):
     Image.fromarray(rgb).save(fname)
 
 def tick(pins):
+    """Run the SDL event pump (and perform any deferred window refresh)."""
+    if HEADLESS:
+        return
+    spi_st7789_sim.flush()
+
     events = sdl2.ext.get_events()
     for event in events:
         if event.type == sdl2.SDL_QUIT:
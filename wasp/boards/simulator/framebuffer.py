@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+""" Headless ST7789 emulation.
+
+The frame memory of the display controller is emulated using a NumPy array
+of RGB565 pixels. Nothing here depends on SDL so the framebuffer can be
+used on hosts without a display (it is selected by setting
+``WASP_SIM_HEADLESS``) and directly, as a mock display, from unit tests:
+
+.. code-block:: python
+
+    fb = framebuffer.Framebuffer()
+    draw = draw565.Draw565(framebuffer.display(fb))
+    draw.fill(0xf800, 10, 10, 20, 20)
+    assert (fb.pixels[10:30, 10:30] == 0xf800).all()
+"""
+
+import time
+import numpy as np
+
+# The driver is shared with the watch so it expects MicroPython's sleep_ms()
+if not hasattr(time, 'sleep_ms'):
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+from drivers.st7789 import MEMORY_ROWS, ST7789_SPI
+
+DISPOFF = 0x28
+DISPON = 0x29
+CASET = 0x2a
+RASET = 0x2b
+RAMWR = 0x2c
+VSCRDEF = 0x33
+VSCSAD = 0x37
+
+WIDTH = 240
+HEIGHT = 240
+
+class Framebuffer(object):
+    """Emulated ST7789 frame memory.
+
+    .. data:: memory
+
+        Frame memory, as a MEMORY_ROWS x WIDTH array of RGB565 pixels.
+        Rows are indexed first so ``memory[y, x]`` is the pixel at (x, y).
+    """
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.colclip = [0, WIDTH-1]
+        self.rowclip = [0, HEIGHT-1]
+        self.cmd = 0
+        self.mute = False
+
+        # Frame memory and vertical scrolling state. The scrolling area
+        # (tfa, vsa, bfa) and start address (vsp) describe how the rows of
+        # frame memory are mapped onto the panel.
+        self.memory = np.zeros((MEMORY_ROWS, WIDTH), dtype=np.uint16)
+        self.scroll = [0, MEMORY_ROWS, 0]
+        self.vsp = 0
+
+    def panel_row(self, m):
+        """Map a row of frame memory to the row of the panel it is shown on."""
+        (tfa, vsa, bfa) = self.scroll
+        if m < tfa or m >= tfa + vsa:
+            return m
+        return tfa + (m - self.vsp) % vsa
+
+    def panel_rows(self, rows):
+        """Map an array of rows of frame memory to rows of the panel."""
+        (tfa, vsa, bfa) = self.scroll
+        return np.where((rows >= tfa) & (rows < tfa + vsa),
+                        tfa + (rows - self.vsp) % vsa, rows)
+
+    @property
+    def pixels(self):
+        """The HEIGHT x WIDTH array of RGB565 pixels shown on the panel.
+
+        The rows of frame memory are shown in the order selected by the
+        vertical scrolling registers and the panel is entirely black when
+        muted. The array is a copy and is not updated by later writes.
+        """
+        if self.mute:
+            return np.zeros((HEIGHT, WIDTH), dtype=np.uint16)
+        rows = np.arange(MEMORY_ROWS)
+        panel = self.panel_rows(rows)
+        visible = panel < HEIGHT
+        pixels = np.empty((HEIGHT, WIDTH), dtype=np.uint16)
+        pixels[panel[visible]] = self.memory[rows[visible]]
+        return pixels
+
+    def refresh(self, force=False):
+        """Hook called when the panel is turned on (DISPON)."""
+        pass
+
+    def repaint(self, rows=None):
+        """Hook called when rows of frame memory have been changed.
+
+        :param rows: Array of the rows that were written to or None if
+                     every row may now be on a different row of the
+                     panel (due to scrolling).
+        """
+        pass
+
+    def write(self, data):
+        # Converting data to a memoryview ensures we act more like spi.write()
+        # when running in a real device (e.g. data must be  bytes-like object
+        # that implements the buffer protocol)
+        data = memoryview(data)
+
+        if len(data) == 1:
+            # Assume if we get a byte at a time then it is command.
+            # This is a simplification do we don't have to track
+            # the D/C pin from within the simulator.
+            self.write_cmd(data[0])
+        else:
+            self.write_data(data)
+
+    def write_cmd(self, cmd):
+        """Handle a command opcode (a byte sent whilst D/C is low)."""
+        if cmd == DISPOFF:
+            self.mute = True
+        elif cmd == DISPON:
+            self.mute = False
+            self.refresh(force=True)
+        else:
+            self.cmd = cmd
+
+        # RAMWR resets the write pointer to the start of the window
+        if cmd == RAMWR:
+            self.x = self.colclip[0]
+            self.y = self.rowclip[0]
+
+    def write_data(self, data):
+        """Handle parameters or pixels (bytes sent whilst D/C is high)."""
+        data = memoryview(data)
+
+        if self.cmd == CASET:
+            self.colclip[0] = (data[0] << 8) + data[1]
+            assert(self.colclip[0] >= 0 and self.colclip[0] <= 240)
+            self.colclip[1] = (data[2] << 8) + data[3]
+            assert(self.colclip[1] >= 0 and self.colclip[1] <= 240)
+            self.x = self.colclip[0]
+
+        elif self.cmd == RASET:
+            self.rowclip[0] = (data[0] << 8) + data[1]
+            assert(self.rowclip[0] >= 0 and self.rowclip[0] < MEMORY_ROWS)
+            self.rowclip[1] = (data[2] << 8) + data[3]
+            assert(self.rowclip[1] >= 0 and self.rowclip[1] < MEMORY_ROWS)
+            self.y = self.rowclip[0]
+
+        elif self.cmd == VSCRDEF:
+            self.scroll = [(data[0] << 8) + data[1],
+                           (data[2] << 8) + data[3],
+                           (data[4] << 8) + data[5]]
+            assert(sum(self.scroll) == MEMORY_ROWS)
+
+        elif self.cmd == VSCSAD:
+            self.vsp = (data[0] << 8) + data[1]
+            self.repaint()
+
+        elif self.cmd == RAMWR:
+            (x0, x1) = self.colclip
+            (y0, y1) = self.rowclip
+            w = x1 - x0 + 1
+            size = w * (y1 - y0 + 1)
+
+            # The pixels are sent big endian
+            pixels = np.frombuffer(data, dtype='>u2', count=len(data) // 2)
+
+            # Writes continue from the current position and wrap around to
+            # the start of the window. Only the final size pixels can
+            # survive a write that is larger than the window.
+            pos = (self.y - y0) * w + (self.x - x0)
+            if len(pixels) > size:
+                pos += len(pixels) - size
+                pixels = pixels[-size:]
+            offsets = (pos + np.arange(len(pixels))) % size
+            rows = y0 + offsets // w
+            self.memory[rows, x0 + offsets % w] = pixels
+            pos = (pos + len(pixels)) % size
+            self.x = x0 + pos % w
+            self.y = y0 + pos // w
+
+            self.repaint(np.unique(rows))
+
+def rgb888(pixels):
+    """Convert an array of RGB565 pixels to RGB888."""
+    rgb = pixels.astype(np.uint32)
+    return (((rgb & 0xf800) << 8) +
+            ((rgb & 0x07e0) << 5) +
+            ((rgb & 0x001f) << 3))
+
+class Signal(object):
+    """A GPIO pin that can be driven but is not connected to anything."""
+    OUT = 'OUT'
+
+    def __init__(self, value=1):
+        self._value = value
+
+    def init(self, direction, value=1):
+        self._value = value
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self._value = v
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+def display(fb=None):
+    """Create an ST7789 driver that draws to a framebuffer.
+
+    :param Framebuffer fb: Framebuffer to draw to, if None then a new
+                           framebuffer is created (and can be found via the
+                           ``fb`` attribute of the driver).
+    :returns: An initialized ST7789_SPI driver
+    """
+    if fb is None:
+        fb = Framebuffer()
+    d = ST7789_SPI(WIDTH, HEIGHT, fb, Signal(), Signal())
+    d.fb = fb
+    return d
@@ -2,6 +2,8 @@
 # Copyright (C) 2020 Daniel Thompson
 
 import display
+import os
+import spitrace
 import time
 
 class Tracer(object):
@@ -28,6 +30,9 @@ class Pin(object):
         self._value = 0
         self._quiet = quiet
 
+        # Number of times the pin has changed state
+        self.edges = 0
+
         # Update the pin registry
         self.pins[id] = self
 
@@ -54,11 +59,14 @@ class Pin(object):
         if v:
             if not self._quiet:
                 print(self._id + ": set on")
-            self._value = False
+            value = False
         else:
             if not self._quiet:
                 print(self._id + ": set off")
-            self._value = True
+            value = True
+        if value != self._value:
+            self._value = value
+            self.edges += 1
 
     def __call__(self, v=None):
         self.value(v)
@@ -67,17 +75,74 @@ class PWM(Tracer):
     FREQ_16MHZ = 'FREQ_16MHZ'
 
 class SPI(object):
+    buses = {}
+
     def __init__(self, id):
         self._id = id
+        self._pending = None
+        self.trace = None
+
+        # Objects that observe every transfer, they must provide write(buf,
+        # data) and sync() methods (see spitrace.Recorder)
+        self.monitors = []
         if id == 0:
             self.sim = display.spi_st7789_sim
+
+            # Set WASP_SIM_TRACE to record the traffic sent to the display
+            fname = os.environ.get('WASP_SIM_TRACE')
+            if fname:
+                self.record(open(fname, 'wb'))
         else:
             self.sim = None
 
+        # Update the bus registry
+        self.buses[id] = self
+
+    def record(self, f):
+        """Record every transfer to a trace file (see spitrace.py).
+
+        Traces that do not start at boot should begin by re-initializing
+        the display (``watch.display.init_display()``) so that the trace
+        can be replayed without knowing the earlier state of the display.
+
+        :param f: Binary file to write the trace to, or None to stop
+                  recording (and close the current trace)
+        """
+        if self.trace:
+            self.monitors.remove(self.trace)
+            self.trace.close()
+        self.trace = spitrace.Recorder(f) if f else None
+        if self.trace:
+            self.monitors.append(self.trace)
+
     def init(self, baudrate=1000000,  polarity=0, phase=0, bits=8, sck=None, mosi=None, miso=None):
         pass
 
+    def write_async(self, buf):
+        """Simulate a DMA transfer.
+
+        The data is not consumed until the transfer is completed (by wait()
+        or the next write) so code that modifies a buffer that is still
+        being transferred will draw garbage, just like it would on real
+        hardware.
+        """
+        self.wait()
+        self._pending = buf
+
+    def wait(self):
+        buf = self._pending
+        if buf is not None:
+            self._pending = None
+            self.write(buf)
+
     def write(self, buf):
+        self.wait()
+        if self.monitors:
+            # Pin.value() stores the inverse of the level that is set
+            dc = Pin.pins.get('DISP_DC')
+            data = dc is None or not dc._value
+            for m in self.monitors:
+                m.write(buf, data)
         if self.sim:
             self.sim.write(buf)
         else:
@@ -125,6 +190,9 @@ class Timer():
         self.time()
 
 def lightsleep(ms=10):
+    for spi in SPI.buses.values():
+        for m in spi.monitors:
+            m.sync()
     display.tick(Pin.pins)
     time.sleep(ms / 1000)
 
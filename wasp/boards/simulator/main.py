@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 # Copyright (C) 2020 Daniel Thompson
 
+import os
 import wasp
 
 # Test app is used a lot on the simulator. Let's make sure it is
@@ -41,4 +42,10 @@ wasp.system.blank_after = 300
 #        b'\x00\x0f'     # contrast
 #    )
 
+# Set WASP_SIM_PROFILE to report the (estimated) time the watch would take
+# to draw each tick
+if os.environ.get('WASP_SIM_PROFILE'):
+    import profiler
+    profiler.Profiler(wasp.watch.spi, verbose=True).attach(wasp.system)
+
 wasp.system.run()
@@ -9,12 +9,19 @@ def native(fn):
 
 def viper(fn):
     def ptr8(buf):
+        # Strings expose their UTF-8 encoding via the buffer protocol
+        if isinstance(buf, str):
+            return buf.encode()
         return buf
 
     def ptr16(buf):
         return memoryview(buf).cast('b').cast('H')
 
     def ptr32(buf):
+        # Viper loads words as (signed) machine integers, so signed arrays
+        # must be sign extended to match the device
+        if getattr(buf, 'typecode', None) in ('i', 'l'):
+            return memoryview(buf).cast('b').cast('i')
         return memoryview(buf).cast('b').cast('I')
 
     # This is a bit of a hack since the scopes don't exactly match where
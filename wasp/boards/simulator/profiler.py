@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+""" Render-cost profiler.
+
+The profiler observes the SPI traffic sent to the display and counts the
+work done by each system tick (and hence by each application). The counts
+are converted into an estimate of the time the same work would take on
+the watch using a simple model of the SPI bus and the driver.
+
+.. code-block:: python
+
+    p = profiler.Profiler(wasp.watch.spi)
+    p.attach(wasp.system)
+    ...
+    print(p.apps['Clock'].worst)
+"""
+
+from framebuffer import RAMWR
+
+class Model(object):
+    """Estimate the time taken to drive the display on the watch.
+
+    Every byte costs the time taken to clock it out at the SPI bus rate
+    and every call into the driver carries a fixed overhead. The default
+    overheads are estimates for an nRF52832 running at 64MHz and should
+    be calibrated against the on-device benchmarks.
+    """
+    def __init__(self, rate=8000000, transfer_us=10, window_us=30, cs_us=2):
+        """Configure the model.
+
+        :param int rate: SPI bus frequency
+        :param transfer_us: Overhead of each call to spi.write()
+        :param window_us: Overhead of each call to quick_window() (excluding
+                          the transfers it makes)
+        :param cs_us: Cost of each change to the chip select
+        """
+        self.rate = rate
+        self.transfer_us = transfer_us
+        self.window_us = window_us
+        self.cs_us = cs_us
+
+    def time_us(self, cost):
+        """Estimate the time, in microseconds, taken to do some work."""
+        nbytes = cost.cmd_bytes + cost.param_bytes + cost.pixel_bytes
+        return (nbytes * 8000000 / self.rate +
+                cost.transfers * self.transfer_us +
+                cost.windows * self.window_us +
+                cost.cs_toggles * self.cs_us)
+
+class Cost(object):
+    """Counts of the work done to drive the display.
+
+    .. data:: windows
+
+        Number of windows opened (RAMWR commands, including those needed to
+        split a window whilst the display is scrolled)
+
+    .. data:: transfers
+
+        Number of calls to spi.write()
+
+    .. data:: cmd_bytes
+
+        Number of bytes sent with D/C low
+
+    .. data:: param_bytes
+
+        Number of parameter bytes (data bytes that are not pixels)
+
+    .. data:: pixel_bytes
+
+        Number of pixel bytes (data bytes that follow RAMWR)
+
+    .. data:: cs_toggles
+
+        Number of changes to the chip select
+    """
+    FIELDS = ('windows', 'transfers', 'cmd_bytes', 'param_bytes',
+              'pixel_bytes', 'cs_toggles')
+
+    def __init__(self, *counts):
+        if not counts:
+            counts = (0,) * len(self.FIELDS)
+        for (field, count) in zip(self.FIELDS, counts):
+            setattr(self, field, count)
+
+    def counts(self):
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    def __add__(self, other):
+        return Cost(*[a + b for (a, b) in zip(self.counts(), other.counts())])
+
+    def __sub__(self, other):
+        return Cost(*[a - b for (a, b) in zip(self.counts(), other.counts())])
+
+    def __bool__(self):
+        return any(self.counts())
+
+    def __str__(self):
+        return ' '.join(f'{field}={count}'
+                        for (field, count) in zip(self.FIELDS, self.counts()))
+
+class AppCost(object):
+    """Summary of the ticks run by an application."""
+    def __init__(self):
+        self.ticks = 0
+        self.total = Cost()
+        self.worst = Cost()
+
+class Profiler(object):
+    """Count the work done to drive the display.
+
+    .. data:: apps
+
+        Dictionary of :py:class:`AppCost` indexed by application name. It
+        is updated by every tick once the profiler is attached to the
+        system manager.
+    """
+    def __init__(self, spi, model=None, verbose=False):
+        """Start counting the traffic on a (simulated) SPI bus.
+
+        :param machine.SPI spi: Bus that the display is attached to
+        :param Model model: Model to estimate the time taken on the watch
+        :param bool verbose: Print the cost of every tick that draws
+        """
+        import machine
+
+        self.model = model if model else Model()
+        self.verbose = verbose
+        self.apps = {}
+        self._cost = Cost()
+        self._cmd = 0
+        self._cs = machine.Pin.pins['DISP_CS']
+        self._cs_base = self._cs.edges
+        self._spi = spi
+        spi.monitors.append(self)
+
+    def close(self):
+        """Stop counting the traffic on the SPI bus."""
+        self._spi.monitors.remove(self)
+
+    def write(self, buf, data):
+        cost = self._cost
+        cost.transfers += 1
+        if not data:
+            cost.cmd_bytes += len(buf)
+            self._cmd = buf[-1]
+            if self._cmd == RAMWR:
+                cost.windows += 1
+        elif self._cmd == RAMWR:
+            cost.pixel_bytes += len(buf)
+        else:
+            cost.param_bytes += len(buf)
+
+    def sync(self):
+        pass
+
+    def snapshot(self):
+        """Get the work done since the profiler was created."""
+        cost = Cost(*self._cost.counts())
+        cost.cs_toggles = self._cs.edges - self._cs_base
+        return cost
+
+    def measure(self, fn, *args):
+        """Measure the work done by a function.
+
+        :returns: A (result, cost) tuple
+        """
+        before = self.snapshot()
+        result = fn(*args)
+        return (result, self.snapshot() - before)
+
+    def time_us(self, cost):
+        """Estimate the time, in microseconds, taken to do some work."""
+        return self.model.time_us(cost)
+
+    def attach(self, system):
+        """Measure every tick run by the system manager."""
+        tick = system._tick
+
+        def profiled_tick():
+            app = getattr(system.app, 'NAME', '')
+            (_, cost) = self.measure(tick)
+
+            # The application may have changed during the tick, if so then
+            # the cost is charged to the new application
+            app = getattr(system.app, 'NAME', app)
+            summary = self.apps.get(app)
+            if not summary:
+                summary = AppCost()
+                self.apps[app] = summary
+            summary.ticks += 1
+            summary.total += cost
+            if self.time_us(cost) > self.time_us(summary.worst):
+                summary.worst = cost
+            if self.verbose and cost:
+                print(f'PROFILE: {app}: {self.time_us(cost)/1000:.2f}ms {cost}')
+
+        system._tick = profiled_tick
+
+    def detach(self, system):
+        """Stop measuring the system manager's ticks."""
+        if '_tick' in system.__dict__:
+            del system._tick
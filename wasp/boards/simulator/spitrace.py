@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (C) 2020 Daniel Thompson
+
+""" Record and replay the SPI traffic sent to the display.
+
+A trace starts with a five byte header (``b'wspt'`` and a version number)
+followed by a sequence of records. Each record is a kind byte, the time
+since the previous record (in microseconds) and a payload length, both
+encoded as unsigned LEB128, and then the payload:
+
+  ===== ====== ==========================================================
+  Kind  Name   Payload
+  ===== ====== ==========================================================
+  0     CMD    Bytes sent whilst D/C is low (the command opcode)
+  1     DATA   Bytes sent whilst D/C is high (parameters or pixels)
+  2     APP    UTF-8 name of the application that is now running
+  3     SYNC   Empty, the system went to sleep (marks the end of a frame)
+  ===== ====== ==========================================================
+
+Traces are replayed into a :py:class:`framebuffer.Framebuffer` so frames
+can be rebuilt, and compared, without running wasp-os:
+
+.. code-block:: sh
+
+    sh$ WASP_SIM_TRACE=before.trace make check
+    sh$ ... change draw565 ...
+    sh$ WASP_SIM_TRACE=after.trace make check
+    sh$ python3 wasp/boards/simulator/spitrace.py diff before.trace after.trace
+    sh$ python3 wasp/boards/simulator/spitrace.py replay after.trace -o frames
+"""
+
+import sys
+import time
+
+MAGIC = b'wspt\x01'
+
+CMD = 0
+DATA = 1
+APP = 2
+SYNC = 3
+
+KINDS = ('CMD', 'DATA', 'APP', 'SYNC')
+
+def _app_name():
+    """Get the name of the running application (if wasp has started)."""
+    system = getattr(sys.modules.get('wasp'), 'system', None)
+    app = getattr(system, 'app', None)
+    return getattr(app, 'NAME', '')
+
+def _varint(n):
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+    return out
+
+class Recorder(object):
+    """Write a trace of the SPI traffic to a (binary) file."""
+    def __init__(self, f):
+        self._f = f
+        self._then = time.monotonic_ns() // 1000
+        self._app = None
+        self._busy = False
+        f.write(MAGIC)
+
+    def _record(self, kind, payload=b''):
+        now = time.monotonic_ns() // 1000
+        header = bytearray((kind,))
+        header += _varint(now - self._then)
+        header += _varint(len(payload))
+        self._then = now
+        self._f.write(header)
+        self._f.write(payload)
+
+    def write(self, buf, data=True):
+        """Record a transfer.
+
+        :param buf: Bytes that were transferred
+        :param data: True if D/C was high (data) or False for commands
+        """
+        app = _app_name()
+        if app != self._app:
+            self._app = app
+            self._record(APP, app.encode())
+        self._record(DATA if data else CMD, bytes(buf))
+        self._busy = True
+
+    def sync(self):
+        """Record the end of a frame (if anything was drawn)."""
+        if self._busy:
+            self._record(SYNC)
+            self._busy = False
+
+    def close(self):
+        self.sync()
+        self._f.close()
+
+def read(f):
+    """Read a trace.
+
+    :param f: Binary file (or file name) to read the trace from
+    :returns: Generator of (kind, timestamp in microseconds, payload)
+    """
+    if isinstance(f, str):
+        with open(f, 'rb') as f:
+            yield from read(f)
+        return
+
+    data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError('Not a wasp-os SPI trace')
+
+    def varint():
+        nonlocal pos
+        n = 0
+        shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            n |= (b & 0x7f) << shift
+            shift += 7
+            if b < 0x80:
+                return n
+
+    pos = len(MAGIC)
+    t = 0
+    while pos < len(data):
+        kind = data[pos]
+        pos += 1
+        t += varint()
+        n = varint()
+        yield (kind, t, data[pos:pos+n])
+        pos += n
+
+def replay(records, fb=None):
+    """Replay a trace into a framebuffer.
+
+    :param records: Records, typically from :py:func:`read`
+    :param fb: Framebuffer to draw to, if None a new one is created
+    :returns: Generator of (timestamp, app, framebuffer, stats) for each
+              frame where stats is a dictionary of record counts and bytes
+              transferred whilst drawing the frame
+    """
+    if fb is None:
+        import framebuffer
+        fb = framebuffer.Framebuffer()
+
+    app = ''
+    t = 0
+    stats = None
+    for (kind, t, payload) in records:
+        if stats is None:
+            stats = { 'CMD': 0, 'DATA': 0, 'bytes': 0 }
+        if kind == APP:
+            app = payload.decode()
+        elif kind == SYNC:
+            yield (t, app, fb, stats)
+            stats = None
+        else:
+            # Dispatch on the recorded D/C level rather than letting the
+            # framebuffer guess (single byte parameters are not commands)
+            if kind == CMD:
+                for cmd in payload:
+                    fb.write_cmd(cmd)
+            else:
+                fb.write_data(payload)
+            stats[KINDS[kind]] += 1
+            stats['bytes'] += len(payload)
+    if stats:
+        yield (t, app, fb, stats)
+
+def save_frame(fb, fname):
+    """Save the panel (as shown by a framebuffer) as an image."""
+    from PIL import Image
+    import framebuffer
+    import numpy as np
+
+    rgb = framebuffer.rgb888(fb.pixels)
+    rgb = np.dstack((rgb >> 16, (rgb >> 8) & 0xff, rgb & 0xff))
+    Image.fromarray(rgb.astype(np.uint8)).save(fname)
+
+def diff(a, b):
+    """Compare two traces (ignoring the timestamps).
+
+    :returns: None if the traces send the same bytes to the display,
+              otherwise a description of the first difference
+    """
+    a = list(read(a))
+    b = list(read(b))
+    app = ''
+    for i in range(max(len(a), len(b))):
+        if i >= len(a) or i >= len(b):
+            return f'record {i} ({app}): trace is truncated ' \
+                   f'({len(a)} vs. {len(b)} records)'
+        (ka, _, pa) = a[i]
+        (kb, _, pb) = b[i]
+        if ka == APP:
+            app = pa.decode()
+        if ka != kb or pa != pb:
+            return f'record {i} ({app}): {KINDS[ka]} {bytes(pa[:16]).hex()} ' \
+                   f'vs. {KINDS[kb]} {bytes(pb[:16]).hex()}'
+    return None
+
+def main():
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(
+            description='Replay and compare traces of the SPI traffic sent '
+                        'to the display by the simulator.')
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('replay', help='rebuild the frames from a trace')
+    p.add_argument('trace')
+    p.add_argument('-o', '--output-dir',
+                   help='save each frame as a PNG image in this directory')
+    p = sub.add_parser('diff', help='compare the data sent by two traces')
+    p.add_argument('a')
+    p.add_argument('b')
+    args = parser.parse_args()
+
+    # The framebuffer takes the size of the frame memory from the driver
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+    if args.cmd == 'replay':
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+        for (i, (t, app, fb, stats)) in enumerate(replay(read(args.trace))):
+            print(f'{i:5} {t/1000000:10.3f}s {app:12} {stats["CMD"]:6} cmds '
+                  f'{stats["DATA"]:6} writes {stats["bytes"]:8} bytes')
+            if args.output_dir:
+                name = app.replace(' ', '') or 'Boot'
+                save_frame(fb, os.path.join(args.output_dir,
+                                            f'{i:05}-{name}.png'))
+    else:
+        difference = diff(args.a, args.b)
+        if difference:
+            print(difference)
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -2,12 +2,15 @@ import pytest
 import time
 import wasp
 import apps.testapp
+import apps.pager
 import apps.settings
+import draw565
+import fonts
 
 def step():
     wasp.system._tick()
     wasp.machine.deepsleep()
-    time.sleep(0.1)
+    time.sleep(0.01)
 wasp.system.step = step
 
 wasp.watch.touch.press = wasp.watch.touch.i2c.sim.press
@@ -49,6 +52,31 @@ def test_app(system, name):
         system.step()
     system.switch(system.quick_ring[0])
 
+@pytest.mark.parametrize("name", sorted(wasp.system.apps))
+def test_render_budget(system, render_profiler, render_budget, name):
+    app = system.apps[name]
+
+    # The simulated step counter grows every time it is read
+    wasp.watch.accel.reset()
+
+    def first_draw():
+        system.switch(app)
+        system.step()
+    (_, first) = render_profiler.measure(first_draw)
+
+    # Force the application's tick to run (and take the median to avoid
+    # penalizing the tick where the clock changes minute)
+    ticks = []
+    for i in range(3):
+        if system.tick_expiry is not None:
+            system.tick_expiry = wasp.watch.rtc.get_uptime_ms()
+        ticks.append(render_profiler.measure(system.step)[1])
+    tick = sorted(ticks, key=render_profiler.time_us)[1]
+
+    render_budget.check(name, 'first', render_profiler.time_us(first), first)
+    render_budget.check(name, 'tick', render_profiler.time_us(tick), tick)
+    system.switch(system.quick_ring[0])
+
 def test_constructor(system, constructor):
     # Special case for the notification app
     if 'NotificationApp' in str(constructor):
@@ -94,6 +122,73 @@ def test_stopwatch(system):
 
     system.step()
 
+def test_stopwatch_damage(system, render_profiler, monkeypatch):
+    sim = wasp.watch.spi.sim
+    monkeypatch.setattr(wasp.watch.battery, 'charging', lambda: False)
+    monkeypatch.setattr(wasp.watch.battery, 'level', lambda: 80)
+    monkeypatch.setattr(wasp.system.bar, 'update', lambda: None)
+    system.switch(system.apps['Stopclock'])
+    app = system.app
+    app._reset()
+
+    # A change to the centiseconds only redraws the centiseconds and a
+    # change to the seconds redraws both (but nothing else)
+    for (count, limit) in ((12300, (180+46)*36*2), (12345, (46+1)*24*2),
+                           (12456, (180+46)*36*2)):
+        app._count = count
+        (_, cost) = render_profiler.measure(app._update)
+        assert 0 < cost.pixel_bytes <= limit
+        pixels = sim.pixels
+        app._draw()
+        assert (sim.pixels == pixels).all()
+
+def test_status_bar_damage(system, render_profiler, monkeypatch):
+    import widgets
+
+    sim = wasp.watch.spi.sim
+    draw = wasp.watch.drawable
+    battery = wasp.watch.battery
+    clock = widgets.Clock()
+    meter = widgets.BatteryMeter()
+
+    def redraw():
+        pixels = sim.pixels
+        draw.fill()
+        clock.draw()
+        meter.draw()
+        assert (sim.pixels == pixels).all()
+
+    monkeypatch.setattr(battery, 'charging', lambda: False)
+    monkeypatch.setattr(battery, 'level', lambda: 80)
+    draw.fill()
+    clock.draw()
+    meter.draw()
+
+    # Changing the level only redraws the level indicator
+    monkeypatch.setattr(battery, 'level', lambda: 79)
+    (_, cost) = render_profiler.measure(meter.update)
+    assert 0 < cost.pixel_bytes <= 14*18*2
+    redraw()
+
+    # Crossing the low battery threshold, or starting to charge, redraws
+    # the icon too
+    for (charging, level) in ((False, 3), (True, 3), (False, 50)):
+        monkeypatch.setattr(battery, 'charging', lambda: charging)
+        monkeypatch.setattr(battery, 'level', lambda: level)
+        (_, cost) = render_profiler.measure(meter.update)
+        assert cost.pixel_bytes >= 24*32*2
+        redraw()
+
+    # The clock is only redrawn when the minute changes
+    now = clock.on_screen
+    clock.on_screen = now[:5] + (now[5] - 1,) + now[6:]
+    (_, cost) = render_profiler.measure(clock.update)
+    assert cost.pixel_bytes == 0
+    clock.on_screen = now[:4] + (now[4] - 1,) + now[5:]
+    (_, cost) = render_profiler.measure(clock.update)
+    assert 0 < cost.pixel_bytes <= (138+1)*27*2    # +1 for the glyph gap
+    redraw()
+
 def test_selftests(system):
     """Walk though each screen in the Self Test.
 
@@ -159,3 +254,199 @@ def test_settings(system):
         system.step()
 
     assert(start_point == system.app._current_setting)
+
+def test_window_cache(system):
+    display = wasp.watch.display
+    draw = wasp.watch.drawable
+
+    draw.fill(0, 0, 0, 240, 24)
+    commands = display.saved_commands
+    draw.fill(0xffff, 0, 0, 240, 24)
+    assert display.saved_commands == commands + 2
+    draw.fill(0, 0, 24, 240, 24)
+    assert display.saved_commands == commands + 3
+
+    # Forgetting the window forces it to be sent again
+    display.forget_window()
+    draw.fill(0, 0, 24, 240, 24)
+    assert display.saved_commands == commands + 3
+
+def test_write_async(system):
+    display = wasp.watch.display
+    spi = wasp.watch.spi
+
+    class Monitor:
+        def __init__(self):
+            self.log = []
+        def write(self, buf, data):
+            self.log.append((bytes(buf), data))
+        def sync(self):
+            pass
+
+    # Starting a new window (or sending a command) whilst an asynchronous
+    # transfer is in flight must not change D/C until it has completed
+    monitor = Monitor()
+    pixels = b'\xf8\x00' * 240
+    display.scroll(0)
+    spi.monitors.append(monitor)
+    try:
+        display.quick_window(0, 0, 240, 1)
+        display.write_async(pixels)
+        display.quick_window(0, 1, 240, 1)
+        display.write_async(pixels)
+        display.write_cmd(0x13)
+        display.quick_end()
+    finally:
+        spi.monitors.remove(monitor)
+    assert [data for (buf, data) in monitor.log if buf == pixels] == [True] * 2
+    assert monitor.log[-1] == (b'\x13', False)
+    assert (spi.sim.memory[0:2] == 0xf800).all()
+
+def test_scroll(system):
+    display = wasp.watch.display
+    draw = wasp.watch.drawable
+    sim = wasp.watch.spi.sim
+
+    # Windows that wrap past the bottom of the frame memory are split
+    assert draw.scroll(100) == (140, 100)
+    draw.fill(0xf800, 0, 130, 240, 20)
+    assert (sim.memory[230:240] == 0xf800).all()
+    assert (sim.memory[0:10] == 0xf800).all()
+    assert (sim.memory[10] != 0xf800).all()
+    assert draw.scroll(-110) == (0, 110)
+    assert display.scroll_offset == 230
+
+    # Each page turn scrolls once and must look the same as a full redraw
+    # (whether or not the text runs underneath the scroll indicator)
+    for msg in ('Scroll test ' * 100, 'Scroll\n' * 40, 'Scroll' * 400):
+        system.switch(apps.pager.PagerApp(msg))
+        assert display.scroll_offset == 0
+        for (swipe, page, offset) in (('down', 1, 216), ('down', 2, 192),
+                                      ('up', 1, 216)):
+            wasp.watch.touch.swipe(swipe)
+            system.step()
+            assert system.app._page == page
+            assert display.scroll_offset == offset
+            pixels = sim.pixels
+            system.app._draw()
+            assert (sim.pixels == pixels).all()
+
+@pytest.mark.parametrize("font", ('sans24', 'sans28', 'sans36'))
+def test_cropped_font(system, font):
+    draw = wasp.watch.drawable
+    sim = wasp.watch.spi.sim
+    font = getattr(fonts, font)
+    assert font.cropped()
+
+    # Glyphs rendered directly must match those rendered by the glyph cache
+    cache = draw._glyphs
+    s = ''.join([chr(c) for c in range(font.min_ch(), font.max_ch()+1)])
+    draw.set_font(font)
+    draw.set_color(0xffff, 0x001f)
+    try:
+        draw.set_glyph_cache(None)
+        draw.string(s[:7], 0, 0, width=240)
+        draw.set_glyph_cache(draw565.GlyphCache())
+        draw.string(s[:7], 0, 120, width=240)
+        draw.string(s[:7], 0, 120, width=240)
+    finally:
+        draw.set_glyph_cache(cache)
+    h = font.height()
+    assert (sim.memory[0:h] == sim.memory[120:120+h]).all()
+    assert (sim.memory[0:h] != 0x001f).any()
+
+def test_theme(system):
+    from tools.themer import DefaultTheme
+
+    class Theme(DefaultTheme):
+        UI = 0x39ff
+        SPOT1 = 0x00ff
+        CONTRAST = 7
+
+    default = system._theme
+    compiled = Theme().serialize()
+    try:
+        # Deriving the shades on the watch must match the compiled theme
+        assert system.set_theme(compiled[:22])
+        derived = [system.theme(i) for i in range(16)]
+        assert system.set_theme(compiled)
+        assert [system.theme(i) for i in range(16)] == derived
+        assert system.theme(wasp.Theme.UI_LIGHTER) == \
+               wasp.watch.drawable.lighten(0x39ff, 7)
+        assert system.theme('spot1') == system.theme(wasp.Theme.SPOT1)
+        assert not system.set_theme(compiled[:20])
+
+        system.switch(apps.testapp.TestApp())
+        system.step()
+    finally:
+        system.set_theme(default)
+
+@pytest.mark.parametrize("size", ((30, 30), (64, 40)))
+def test_rle8(system, size):
+    from PIL import Image
+    from tools.rle_encode import encode_2bit, encode_8bit
+    import random
+
+    # Long runs, runs of exactly 255 pixels and areas of fine detail
+    (w, h) = size
+    im = Image.new('RGB', size)
+    rng = random.Random(w)
+    colors = [(0, 0, 0), (0xff, 0x33, 0), (0x33, 0x99, 0xff), (0xff,) * 3]
+    for i in range(w * h):
+        if i // w in (2, 3, 4, 5) or 100 <= i < 355:
+            px = colors[1]
+        else:
+            px = rng.choice(colors) if i % 7 else colors[3]
+        im.putpixel((i % w, i // w), px)
+
+    draw = wasp.watch.drawable
+    sim = wasp.watch.spi.sim
+    draw.fill(0x001f)
+    draw.blit(encode_2bit(im), 0, 0)
+    draw.blit(encode_8bit(im), 120, 120)
+    assert (sim.memory[0:h, 0:w] == sim.memory[120:120+h, 120:120+w]).all()
+
+def test_spi_trace(system, tmp_path):
+    import spitrace
+
+    spi = wasp.watch.spi
+    traces = []
+    for msg in ('Trace test ', 'Trace test ', 'Trace tests '):
+        fname = str(tmp_path / f'{len(traces)}.trace')
+        system.switch(system.quick_ring[0])
+        spi.record(open(fname, 'wb'))
+        try:
+            # Start from a known state so the trace is self-contained
+            wasp.watch.display.init_display()
+            system.switch(apps.pager.PagerApp(msg * 40))
+            system.step()
+            wasp.watch.touch.swipe('down')
+            system.step()
+        finally:
+            spi.record(None)
+        traces.append((fname, spi.sim.memory.copy()))
+
+    # Replaying the trace must rebuild the same frame memory
+    frames = list(spitrace.replay(spitrace.read(traces[0][0])))
+    (t, app, fb, stats) = frames[-1]
+    assert len(frames) >= 2
+    assert app == 'Pager'
+    assert (fb.memory == traces[0][1]).all()
+    assert sum(stats['bytes'] for (t, app, fb, stats) in frames) > 240 * 240
+
+    assert spitrace.diff(traces[0][0], traces[1][0]) is None
+    assert spitrace.diff(traces[0][0], traces[2][0])
+
+def test_benchmark(system, capsys):
+    import benchmark
+    import json
+
+    benchmark.run(runs=2)
+    results = [ json.loads(ln) for ln in capsys.readouterr().out.split('\n')
+                                   if ln.startswith('{') ]
+    assert [ r['bench'] for r in results ] == \
+           [ name for (name, setup) in benchmark.BENCHMARKS ]
+    for r in results:
+        assert r['runs'] == 2
+        assert 0 <= r['min_us'] <= r['mean_us'] <= r['max_us']
+    assert system.app == system.quick_ring[0]
@@ -1,18 +1,64 @@
+import array
 import draw565
 import fonts
+import icons
+import framebuffer
+import numpy as np
 import pytest
 
+@pytest.fixture(scope='module')
+def display():
+    """Provide a display driver that draws into a headless framebuffer."""
+    return framebuffer.display()
+
 @pytest.fixture
-def draw():
+def draw(display):
     """Provide a RGB565 drawing surface.
 
-    Currently most of the draw565 functions will not work since we haven't
-    mocked up the display. This limits the testing that we can perform.
+    The display is a headless framebuffer (``display.fb``) so the results
+    of drawing can be checked pixel-for-pixel.
     """
-    d = draw565.Draw565(None)
+    display.scroll(0)
+    d = draw565.Draw565(display)
+    d.fill(0)
 
     return d
 
+def render_string(font, s, fg, bg):
+    """Reference renderer for draw565.string()."""
+    h = font.height()
+    w = fonts.width(font, s) - 1 if s else 0
+    pixels = np.full((h, w), bg, dtype=np.uint16)
+    x = 0
+    for ch in s:
+        (glyph, _, advance) = font.get_ch(ch)
+        (left, bw, top, rows) = glyph[0:4]
+        for i in range(bw * rows):
+            if glyph[4 + i // 8] & (0x80 >> (i % 8)):
+                pixels[top + i // bw, x + left + i % bw] = fg
+        x += advance + 1
+    return pixels
+
+@pytest.mark.parametrize("module", (draw565, fonts))
+def test_viper_args(module):
+    """Viper functions can take at most four positional arguments.
+
+    The simulator runs viper functions as plain Python so it cannot
+    enforce this limit itself.
+    """
+    import ast
+
+    with open(module.__file__) as f:
+        tree = ast.parse(f.read())
+
+    viper = [ fn for fn in ast.walk(tree)
+              if isinstance(fn, ast.FunctionDef) and
+                 any(ast.unparse(d) == 'micropython.viper'
+                     for d in fn.decorator_list) ]
+    assert viper
+    for fn in viper:
+        assert len(fn.args.args) <= 4, fn.name
+
 def test_lighten(draw):
     assert draw.lighten(0b00000_000000_00000         ) == 0b00001_000010_00001
     assert draw.lighten(0b00000_000000_00000, 0b00001) == 0b00001_000010_00001
@@ -57,3 +103,703 @@ def test_font_width(draw):
 
         if f.max_ch() >= 90:
             assert draw.bounding_box('IIII')[0] < draw.bounding_box('WWWW')[0]
+
+def test_width_table():
+    for f in (fonts.sans24, fonts.sans28, fonts.sans36):
+        table = fonts.widths(f)
+        assert len(table) == f.max_ch() - f.min_ch() + 2
+        for ch in ('0', ':'):
+            assert table[ord(ch) - f.min_ch() + 1] == f.get_ch(ch)[2]
+        assert table[0] == f.get_ch('\0')[2]
+
+        s = '12:34 é'
+        w = sum([f.get_ch(ch)[2] + 1 for ch in s])
+        assert fonts.width(f, s) == w
+        # ... and again (from the cache)
+        assert fonts.width(f, s) == w
+
+@pytest.mark.parametrize("font", ('sans24', 'sans28', 'sans36'))
+def test_cropfont(font):
+    from tools import cropfont
+
+    # Cropping an already cropped font reproduces it exactly (so the
+    # command recorded in the header can be rerun)
+    fname = f'wasp/fonts/{font}.py'
+    with open(fname) as f:
+        src = f.read()
+    cmd = [l for l in src.splitlines() if l.startswith('# Cropped: ')][0]
+    assert cropfont.render_py(cropfont.load_font(fname), cmd[11:]) == src
+
+def test_wrap(draw):
+    s = 'The quick brown fox\njumped over the lazy dog'
+    chunks = draw.wrap(s, 120)
+    assert chunks[0] == 0
+    assert chunks[-1] == len(s)
+    assert s[chunks[1]-1] == ' '
+    assert s.index('\n') + 1 in chunks
+    for i in range(len(chunks)-1):
+        assert draw.bounding_box(s[chunks[i]:chunks[i+1]].rstrip())[0] <= 120
+
+def test_wrapper(draw):
+    s = 'Café au lait?\n\n' + 'The quick brown fox jumped over the lazy dog. ' * 20
+    chunks = draw.wrap(s, 120)
+    nlines = len(chunks) - 1
+
+    # Visit the lines out of order so that the page index must be extended
+    wrapper = draw.wrapper(s, 120, lines=4)
+    for i in (nlines - 1, 0, 5, 3, nlines, nlines + 9):
+        if i < nlines:
+            assert wrapper.line(i) == (chunks[i], chunks[i+1])
+        else:
+            assert wrapper.line(i) is None
+
+    wrapper = draw.wrapper(s, 120)
+    assert [wrapper.line(i) for i in range(nlines)] == \
+           list(zip(chunks[:-1], chunks[1:]))
+    assert draw.wrapper('', 240).line(0) is None
+
+def test_damage(draw):
+    def collect(x, y, w, h):
+        rects.append((x, y, w, h))
+
+    # Overlapping and touching rectangles are merged
+    rects = []
+    draw.invalidate(10, 10, 20, 20)
+    draw.invalidate(20, 20, 20, 20)
+    draw.invalidate(40, 10, 10, 10)
+    draw.invalidate(100, 100, 10, 10)
+    assert draw.damaged(45, 15, 1, 1)
+    assert not draw.damaged(60, 60, 10, 10)
+    draw.flush(collect, clear=False)
+    assert sorted(rects) == [(10, 10, 40, 30), (100, 100, 10, 10)]
+
+    # The damage set is emptied by a flush
+    rects = []
+    draw.flush(collect, clear=False)
+    assert rects == []
+
+    # Whilst flushing only the rectangle being redrawn is damaged so
+    # widgets are only repainted as part of the rectangles they overlap
+    def paint(x, y, w, h):
+        rects.append([(x, y)] + [r for r in widgets if draw.damaged(*r)])
+    rects = []
+    widgets = ((0, 0, 240, 24), (10, 100, 20, 20), (200, 150, 30, 30))
+    draw.invalidate(0, 0, 20, 20)
+    draw.invalidate(5, 110, 10, 10)
+    draw.flush(paint, clear=False)
+    assert sorted(rects) == [[(0, 0), widgets[0]], [(5, 110), widgets[1]]]
+    assert not draw.damaged(0, 0, 240, 240)
+
+    # A widget that flushes its own region leaves the application's
+    # damage pending, even when the application invalidated first
+    rects = []
+    widget = (190, 0, 50, 27)
+    draw.invalidate(0, 100, 240, 40)
+    draw.invalidate(*widget)
+    draw.flush(collect, clear=False, region=widget)
+    assert rects == [widget]
+    assert draw.damaged(0, 100, 240, 40)
+    assert not draw.damaged(*widget)
+    rects = []
+    draw.flush(collect, clear=False)
+    assert rects == [(0, 100, 240, 40)]
+
+    # Damage that straddles the region is only redrawn inside the region
+    # and remains pending for its owner
+    rects = []
+    draw.invalidate(0, 20, 240, 20)
+    draw.flush(collect, clear=False, region=widget)
+    assert rects == [(190, 20, 50, 7)]
+    rects = []
+    draw.flush(collect, clear=False)
+    assert rects == [(0, 20, 240, 20)]
+
+    # The damage set is bounded
+    rects = []
+    for i in range(32):
+        draw.invalidate(i * 7, i * 7, 2, 2)
+    draw.flush(collect, clear=False)
+    assert 0 < len(rects) <= 8
+    for i in range(32):
+        assert any(x <= i*7 and y <= i*7 and x+w >= i*7+2 and y+h >= i*7+2
+                   for (x, y, w, h) in rects)
+
+def test_image_cache():
+    cache = draw565.ImageCache(100)
+
+    a = (bytearray(40), 4, 5)
+    b = (bytearray(40), 5, 4)
+    c = (bytearray(40), 2, 10)
+    cache.put('a', a)
+    cache.put('b', b)
+    assert cache.get('a') is a
+    assert cache.get('b') is b
+
+    # 'b' was used least recently so must be evicted to make space for 'c'
+    cache.get('a')
+    cache.put('c', c)
+    assert cache.get('b') is None
+    assert cache.get('a') is a
+    assert cache.get('c') is c
+
+    # Images that exceed the budget are never cached
+    cache.put('d', (bytearray(200), 10, 10))
+    assert cache.get('d') is None
+    assert cache.hits == 5
+    assert cache.misses == 2
+
+    cache.clear()
+    assert cache.get('a') is None
+
+def test_image_cache_key(draw):
+    from PIL import Image
+    from tools import rle_encode
+
+    fb = draw._display.fb
+    cache = draw565.ImageCache()
+
+    def image(i, encoder):
+        im = Image.new('RGB', (8, 8))
+        im.putpixel((i % 8, i // 8), (255, 255, 255))
+        return encoder(im)
+
+    # Images that are freed (so a new image may reuse their memory) must
+    # not be mistaken for the new image
+    for i in range(16):
+        im = image(i, rle_encode.encode_2bit)
+        draw.set_image_cache(None)
+        draw.blit(im, 0, 0)
+        expected = fb.pixels
+        draw.fill(0)
+        draw.set_image_cache(cache)
+        draw.blit(im, 0, 0)
+        assert (fb.pixels == expected).all()
+    assert cache.hits == 0
+
+    # 8-bit images are not affected by the colours they are drawn with
+    im = image(3, rle_encode.encode_8bit)
+    cache.clear()
+    draw.blit(im, 0, 0, 0xf800)
+    draw.blit(im, 0, 0, 0x07e0, 0x001f)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_sort_rects():
+    rects = array.array('H', (
+            20, 0, 10, 4, 0xffff,
+            0, 8, 4, 4, 0x001f,
+            0, 0, 10, 4, 0xffff,
+            10, 0, 10, 4, 0xffff,
+            0, 4, 4, 4, 0x001f,
+            50, 50, 0, 4, 0xf800))
+    n = draw565._sort_rects(rects, 6)
+    assert n == 2
+    assert list(rects[0:10]) == [0, 4, 4, 8, 0x001f, 0, 0, 30, 4, 0xffff]
+
+def test_rle_encode_vectorized():
+    from PIL import Image
+    from tools import rle_encode
+    import random
+
+    rng = random.Random(0)
+    im = Image.new('RGBA', (40, 30))
+    for i in range(40 * 30):
+        # Runs that differ only by alpha must still be separate runs
+        px = rng.choice(((0, 0, 0, 255), (0, 0, 0, 0), (200, 10, 90, 255),
+                         (rng.randrange(256), 50, 50, 255)))
+        im.putpixel((i % 40, i // 40), px)
+    assert rle_encode.runs(im) == rle_encode.runs(im, vectorize=False)
+    for encoder in (rle_encode.encode_2bit, rle_encode.encode_8bit):
+        assert encoder(im) == encoder(im, vectorize=False)
+
+    mono = im.convert('1')
+    assert rle_encode.encode(mono) == rle_encode.encode(mono, vectorize=False)
+
+    # Priming must pick the same CLUT index (including on ties)
+    colors = [rng.randrange(1 << 24) for i in range(200)] + [0x1a1a1a]
+    primed = rle_encode.ReverseCLUT(rle_encode.clut8_rgb888)
+    primed.prime(colors)
+    reference = rle_encode.ReverseCLUT(rle_encode.clut8_rgb888)
+    assert [primed.lookup[c] for c in colors] == [reference(c) for c in colors]
+
+def test_rle_encode_optimize():
+    from PIL import Image
+    from tools import rle_encode
+
+    # One colour is used between each of the others, so loading colours
+    # strictly in the order they are needed causes the palette to thrash
+    colors = ((0xff, 0, 0), (0, 0xff, 0), (0, 0, 0xff), (0xff, 0xff, 0),
+              (0xff, 0xff, 0xff))
+    pattern = (0, 1, 0, 2, 0, 4, 0, 3)
+    im = Image.new('RGB', (32, 8))
+    for i in range(32 * 8):
+        im.putpixel((i % 32, i // 32), colors[pattern[(i // 2) % 8]])
+    rle = rle_encode.encode_2bit(im)
+    optimized = rle_encode.encode_2bit(im, optimize=True)
+    assert len(optimized) < len(rle)
+
+    # The images must be identical, even when drawn with different colours
+    # in the initial palette
+    for palette in ((0, 0x694a, 0xef7b, 0xffff), (0x1234, 0x1f00, 0xf8, 0)):
+        images = []
+        for data in (rle, optimized):
+            buf = bytearray(2 * 32 * 8)
+            state = array.array('I', (3, 0, 0, 1, len(data), 32 * 8))
+            n = draw565._rle_decode(data, array.array('H', palette), state,
+                                    buf)
+            assert n == 32 * 8
+            images.append(buf)
+        assert images[0] == images[1]
+
+def test_rle_encode_cache(tmp_path):
+    from tools import rle_encode
+
+    encoder = tmp_path / 'encoder.py'
+    encoder.write_text('# version 1')
+    image = tmp_path / 'image.png'
+    image.write_bytes(b'image')
+    fname = str(tmp_path / 'cache.json')
+
+    cache = rle_encode.Cache(fname, str(encoder))
+    key = cache.key(str(image), 2)
+    cache.put(key, 'text')
+    cache.put(cache.key(str(image), 8), 'unused')
+    cache.save()
+    assert rle_encode.Cache(fname, str(encoder)).get(key) == 'text'
+
+    # Entries that have not been used for a long time are evicted
+    rle_encode.Cache.MAX_AGE, max_age = 0, rle_encode.Cache.MAX_AGE
+    try:
+        cache = rle_encode.Cache(fname, str(encoder))
+    finally:
+        rle_encode.Cache.MAX_AGE = max_age
+    assert cache.entries == {} and cache.dirty
+
+    # Changing the encoder changes the key and evicts the old entries
+    cache = rle_encode.Cache(fname, str(encoder))
+    assert len(cache.entries) == 2
+    encoder.write_text('# version 2')
+    cache = rle_encode.Cache(fname, str(encoder))
+    assert cache.key(str(image), 2) != key
+    assert cache.get(key) is None
+    assert cache.entries == {}
+    cache.save()
+    with open(fname) as f:
+        assert f.read() == '{}'
+
+def test_ramwr_wrap():
+    fb = framebuffer.Framebuffer()
+    fb.write(bytes((0x2a,)))
+    fb.write(bytes((0, 10, 0, 13)))
+    fb.write(bytes((0x2b,)))
+    fb.write(bytes((0, 20, 0, 22)))
+
+    # 4x3 window: write 5 pixels then 10 more (wrapping back to the start)
+    (r, g, b) = (0xf800, 0x07e0, 0x001f)
+    fb.write(bytes((0x2c,)))
+    fb.write(b'\xf8\x00' * 5)
+    fb.write(b'\x00\x1f' * 9 + b'\x07\xe0')
+    window = fb.memory[20:23, 10:14]
+    assert window.tolist() == [[b, b, g, r],
+                               [r, b, b, b],
+                               [b, b, b, b]]
+    assert fb.memory[19:24, 9:15].astype(int).sum() == window.astype(int).sum()
+
+    # Only the final pixels of an over-sized write are visible
+    fb.write(b'\xf8\x00' * 11 + b'\x00\x1f' * 3)
+    assert window.tolist() == [[r, r, b, b],
+                               [b, r, r, r],
+                               [r, r, r, r]]
+
+    # The panel shows the scrolled frame memory (and is black when muted)
+    fb.write(bytes((0x37,)))
+    fb.write(bytes((0, 20)))
+    assert (fb.pixels[0:3, 10:14] == window).all()
+    fb.write(bytes((0x28,)))
+    assert not fb.pixels.any()
+
+def test_spitrace_replay():
+    import spitrace
+
+    # Single byte parameters (COLMOD, MADCTL) must not be mistaken for
+    # commands, even if they look like DISPOFF or RAMWR
+    trace = ((spitrace.CMD, 0, b'\x29'),
+             (spitrace.CMD, 0, b'\x3a'), (spitrace.DATA, 0, b'\x05'),
+             (spitrace.CMD, 0, b'\x36'), (spitrace.DATA, 0, b'\x28'),
+             (spitrace.CMD, 0, b'\x2a'), (spitrace.DATA, 0, b'\x00\x00\x00\x01'),
+             (spitrace.CMD, 0, b'\x2b'), (spitrace.DATA, 0, b'\x00\x00\x00\x00'),
+             (spitrace.CMD, 0, b'\x2c'), (spitrace.DATA, 0, b'\xf8\x00' * 2))
+    frames = list(spitrace.replay(trace))
+    assert len(frames) == 1
+    (t, app, fb, stats) = frames[0]
+    assert not fb.mute
+    assert fb.memory[0, 0:2].tolist() == [0xf800, 0xf800]
+    assert stats == { 'CMD': 6, 'DATA': 5, 'bytes': 20 }
+
+def test_fill(draw):
+    fb = draw._display.fb
+    expected = np.zeros((240, 240), dtype=np.uint16)
+    for (color, x, y, w, h) in ((0xf800, 0, 0, None, None),
+                                (0x07e0, 10, 20, 1, 1),
+                                (0x001f, 3, 7, 237, 5),
+                                (0xffff, 100, 0, 7, 240),
+                                (0x1234, 200, 150, None, None)):
+        draw.fill(color, x, y, w, h)
+        expected[y:y+h if h else None, x:x+w if w else None] = color
+    assert (fb.pixels == expected).all()
+
+    rects = array.array('H')
+    for i in range(24):
+        (x, y) = (i % 6 * 40, i // 6 * 60)
+        rects.extend((x, y, 40, 60, (0xf800, 0x07e0, 0x001f)[i % 3]))
+        expected[y:y+60, x:x+40] = rects[-1]
+    draw.fill_rects(rects)
+    assert (fb.pixels == expected).all()
+
+@pytest.mark.parametrize("font", ('sans24', 'sans28', 'sans36'))
+def test_string(draw, font):
+    fb = draw._display.fb
+    font = getattr(fonts, font)
+    draw.set_font(font)
+    draw.set_color(0xffe0, 0x001f)
+    h = font.height()
+    s = 'Wasp-os 12:34 %'
+
+    for cache in (None, draw565.GlyphCache()):
+        draw.set_glyph_cache(cache)
+        draw.fill(0)
+        draw.string(s, 7, 3)
+        draw.string(s[:5], 0, 120, width=240)
+        draw.string(s[:5], 0, 180, width=200, right=True)
+
+        ref = render_string(font, s, 0xffe0, 0x001f)[:, :233]
+        w = ref.shape[1]
+        assert (fb.pixels[3:3+h, 7:7+w] == ref).all()
+
+        ref = render_string(font, s[:5], 0xffe0, 0x001f)
+        w = ref.shape[1]
+        pad = (240 - w) // 2
+        assert (fb.pixels[120:120+h, 0:pad] == 0x001f).all()
+        assert (fb.pixels[120:120+h, pad:pad+w] == ref).all()
+        assert (fb.pixels[120:120+h, pad+w:] == 0x001f).all()
+        assert (fb.pixels[180:180+h, 200-w:200] == ref).all()
+
+    # Strings that do not fit in the line buffer are clipped at the edge
+    # of the display
+    draw.fill(0)
+    s = '0123456789' * 4
+    draw.string(s, 10, 60)
+    ref = render_string(font, s, 0xffe0, 0x001f)
+    assert (fb.pixels[60:60+h, 10:] == ref[:, :230]).all()
+
+@pytest.mark.parametrize("depth", (1, 2, 8))
+def test_blit(draw, depth):
+    from PIL import Image
+    from tools import rle_encode
+    import random
+
+    fb = draw._display.fb
+    rng = random.Random(depth)
+    (w, h) = (61, 37)
+    im = Image.new('RGB', (w, h))
+    colors = [(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+              for i in range(6)]
+    for i in range(w * h):
+        if i % 13 < 6:
+            im.putpixel((i % w, i // w), colors[(i // 97) % 6])
+        else:
+            im.putpixel((i % w, i // w), rng.choice(colors))
+
+    # Images are drawn using the colours the 2-bit encoder assumes are in
+    # its initial palette
+    clut = [int.from_bytes(draw565._CLUT8[2*i:2*i+2], 'big')
+            for i in range(256)]
+    (bg, c1, c2, fg) = [clut[i] for i in rle_encode._PALETTE_2BIT]
+    reverse = rle_encode.reverse_clut()
+    if depth == 1:
+        im = im.convert('1')
+        image = rle_encode.encode(im)
+        expected = np.where(np.array(im), fg, bg)
+    else:
+        image = (rle_encode.encode_2bit(im) if depth == 2
+                                            else rle_encode.encode_8bit(im))
+        expected = np.array([[clut[reverse(rle_encode.rgb888(im.getpixel((x, y))))]
+                              for x in range(w)] for y in range(h)])
+
+    for cache in (None, draw565.ImageCache()):
+        draw.set_image_cache(cache)
+        draw.fill(0x1234)
+        draw.blit(image, 170, 190, fg, c1, c2)
+        draw.blit(image, 170, 190, fg, c1, c2)
+        assert (fb.pixels[190:190+h, 170:170+w] == expected).all()
+        assert (fb.pixels[0:190] == 0x1234).all()
+
+def test_scrolled(draw):
+    fb = draw._display.fb
+    draw.fill(0x001f, 0, 0, 240, 24)
+
+    # Drawing coordinates do not move when the display is scrolled (even
+    # if the window must be split)
+    assert draw.scroll(-24) == (0, 24)
+    assert (fb.pixels[24:48] == 0x001f).all()
+    assert draw.scroll(100) == (140, 100)
+    draw.fill(0)
+    draw.fill(0xf800, 0, 130, 240, 20)
+    draw.string('Scroll', 0, 120, width=240)
+    expected = fb.pixels
+
+    draw._display.scroll(0)
+    draw.fill(0)
+    draw.fill(0xf800, 0, 130, 240, 20)
+    draw.string('Scroll', 0, 120, width=240)
+    assert (fb.pixels == expected).all()
+    assert (expected[144:150] == 0xf800).all()
+
+def test_scrolled_underfill(draw):
+    display = draw._display
+    fb = display.fb
+    draw.fill(0x001f)
+
+    # Start a window that must be split but stop two bytes short of the
+    # split; the next command must not be mistaken for the tail of the
+    # window
+    display.scroll(200)
+    display.quick_window(0, 30, 240, 20)
+    display.quick_write(b'\xf8\x00' * (240*10 - 1))
+    display.quick_end()
+    display.scroll(120)
+    assert fb.cmd == 0x37
+    assert fb.vsp == 120
+
+    draw.fill(0x07e0, 0, 100, 240, 40)
+    pixels = fb.pixels
+    assert (pixels[100:140] == 0x07e0).all()
+    assert (pixels[0:100] != 0x07e0).all()
+    assert (pixels[140:] != 0x07e0).all()
+
+def paint_scene(draw, images):
+    """Paint a scene that exercises every drawing operation."""
+    draw.set_font(fonts.sans24)
+    draw.set_color(0xffff)
+    draw.fill()
+    draw.fill(0x001f, 10, 5, 200, 30)
+    draw.fill(0xf800, 0, 50, 30, 11)
+    rects = array.array('H', (40, 100, 60, 3, 0x07e0,
+                              150, 93, 7, 40, 0xffe0))
+    draw.fill_rects(rects)
+    draw.string('Band 12:34', 12, 17)
+    draw.string('Wasp-os', 0, 61, width=240)
+    draw.string('Right', 0, 131, width=200, right=True)
+    draw.set_font(fonts.sans36)
+    draw.string('0123456789' * 2, 5, 200)
+    (mono, clut8) = images
+    draw.blit(icons.software, 88, 70)
+    draw.blit(icons.battery, 200, 150, 0xf800, 0x07e0, 0x001f)
+    draw.blit(mono, 0, 160, 0xffe0)
+    draw.rleblit(mono, (120, 101), 0x07ff, 0x1234)
+    draw.blit(clut8, 150, 190)
+    draw.line(3, 20, 230, 130, 3, 0xfb00)
+    draw.line(200, 5, 190, 235, 2, 0x6b3f)
+    draw.circle(60, 180, 30, 0x07e0, 4)
+    draw.rounded_rect(150, 20, 80, 50, 12, 0xf81f)
+    draw.arc(120, 120, 100, 110, 30, 250, 0xffe0)
+
+@pytest.fixture(scope='module')
+def scene_images():
+    """Provide a 1-bit and an 8-bit image for paint_scene()."""
+    from PIL import Image
+    from tools import rle_encode
+    import random
+
+    rng = random.Random(8)
+    (w, h) = (45, 33)
+    im = Image.new('RGB', (w, h))
+    for i in range(w * h):
+        im.putpixel((i % w, i // w), ((i // 7) % 3 * 120, rng.randrange(256),
+                                      (i // 29) % 2 * 255))
+    return (rle_encode.encode(im.convert('1')), rle_encode.encode_8bit(im))
+
+@pytest.mark.parametrize("rows", (24, 7))
+@pytest.mark.parametrize("caches", (False, True))
+def test_render(draw, scene_images, rows, caches):
+    fb = draw._display.fb
+    paint_scene(draw, scene_images)
+    expected = fb.pixels
+
+    if caches:
+        draw.set_glyph_cache(draw565.GlyphCache())
+        draw.set_image_cache(draw565.ImageCache())
+    draw.set_band(draw565.Band(draw._display, rows))
+    draw.fill(0x1234)
+    draw.render(lambda: paint_scene(draw, scene_images))
+    assert (fb.pixels == expected).all()
+
+    # A partial redraw only touches the rows it was asked to redraw
+    # (including when they do not line up with the band)
+    draw.fill(0x1234)
+    draw.render(lambda: paint_scene(draw, scene_images), 53, 101)
+    pixels = fb.pixels
+    assert (pixels[53:154] == expected[53:154]).all()
+    assert (pixels[:53] == 0x1234).all()
+    assert (pixels[154:] == 0x1234).all()
+
+def test_band_left_edge(draw):
+    fb = draw._display.fb
+    band = draw565.Band(draw._display, 24)
+    buf = bytearray()
+    for i in range(10 * 4):
+        buf.extend((0x0800 * (i % 10)).to_bytes(2, 'big'))
+
+    # Pixels to the left of the display are discarded rather than written
+    # to the end of the previous row
+    band.start(0, 24)
+    band.rawblit(buf, -3, 5, 10, 4)
+    band.flush()
+    expected = np.zeros((240, 240), dtype=np.uint16)
+    expected[5:9, 0:7] = [0x0800 * i for i in range(3, 10)]
+    assert (fb.pixels == expected).all()
+
+def render_line(x0, y0, x1, y1, width, color):
+    """Reference renderer for draw565.line().
+
+    This is the original algorithm, which draws a width x width square
+    at every point on the Bresenham path, clipped to the display.
+    """
+    pixels = np.zeros((240, 240), dtype=np.uint16)
+    dw = (width - 1) // 2
+    (x0, y0, x1, y1) = (x0 - dw, y0 - dw, x1 - dw, y1 - dw)
+    dx = abs(x1 - x0)
+    sx = 1 if x0 < x1 else -1
+    dy = -abs(y1 - y0)
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        pixels[max(y0, 0):max(y0 + width, 0),
+               max(x0, 0):max(x0 + width, 0)] = color
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
+    return pixels
+
+@pytest.mark.parametrize("width", (1, 2, 3, 4, 5))
+def test_line(draw, width):
+    fb = draw._display.fb
+
+    # Every octant (and the axes and diagonals between them) from the
+    # centre of the display
+    ends = [(120 + dx, 120 + dy) for (dx, dy) in
+                ((100, 0), (100, 37), (71, 71), (37, 100), (0, 100),
+                 (-37, 100), (-71, 71), (-100, 37), (-100, 0), (-100, -37),
+                 (-71, -71), (-37, -100), (0, -100), (37, -100), (71, -71),
+                 (100, -37), (1, 1), (2, -1))]
+    lines = [(120, 120, x, y) for (x, y) in ends]
+
+    # Lines whose ends (or pen) are clipped by the edges of the display
+    lines += [(0, 0, 239, 239), (239, 0, 0, 239), (0, 5, 80, 0),
+              (-20, 30, 100, 250), (230, -15, 260, 200), (5, 239, 239, 200),
+              (-10, 100, 300, 100), (100, -10, 100, 300), (0, 0, 0, 0),
+              (239, 239, 239, 239)]
+
+    for (x0, y0, x1, y1) in lines:
+        draw.fill(0)
+        draw.line(x0, y0, x1, y1, width, 0xfb00)
+        expected = render_line(x0, y0, x1, y1, width, 0xfb00)
+        assert (fb.pixels == expected).all(), (x0, y0, x1, y1)
+
+def in_rounded_rect(px, py, w, h, r):
+    """Reference test for whether a pixel lies within a rounded rectangle.
+
+    Pixels in the corners are inside if their centre lies within half a
+    pixel (approximately) of the corner circle.
+    """
+    if px < 0 or py < 0 or px >= w or py >= h:
+        return False
+    dx = max(r - px, px - (w - 1 - r), 0)
+    dy = max(r - py, py - (h - 1 - r), 0)
+    return dx*dx + dy*dy <= r*r + r
+
+def render_shape(x, y, w, h, r, color, width=None, sector=None):
+    """Reference renderer for the shapes drawn by draw565."""
+    import math
+
+    pixels = np.zeros((240, 240), dtype=np.uint16)
+    r = min(r, w // 2, h // 2)
+    hollow = width and 2*width < w and 2*width < h
+    if sector:
+        (start, end) = sector
+        to_radians = math.pi / 180
+        (svx, svy) = (int(math.sin(start * to_radians) * 1024),
+                      -int(math.cos(start * to_radians) * 1024))
+        (evx, evy) = (int(math.sin(end * to_radians) * 1024),
+                      -int(math.cos(end * to_radians) * 1024))
+        reflex = (end - start) % 360 > 180
+
+    for py in range(max(y, 0), min(y + h, 240)):
+        for px in range(max(x, 0), min(x + w, 240)):
+            (sx, sy) = (px - x, py - y)
+            if not in_rounded_rect(sx, sy, w, h, r):
+                continue
+            if hollow and in_rounded_rect(sx - width, sy - width,
+                                          w - 2*width, h - 2*width,
+                                          max(r - width, 0)):
+                continue
+            if sector:
+                (cx, cy) = (sx - w // 2, sy - h // 2)
+                after_start = svx * cy - svy * cx >= 0
+                before_end = cx * evy - cy * evx >= 0
+                if reflex:
+                    if not (after_start or before_end):
+                        continue
+                elif not (after_start and before_end):
+                    continue
+            pixels[py, px] = color
+    return pixels
+
+@pytest.mark.parametrize("args", (
+    (120, 120, 100, None), (120, 120, 100, 8), (60, 70, 23, 1),
+    (30, 40, 0, None), (30, 40, 1, None), (30, 40, 1, 1),
+    (10, 120, 30, 5), (230, 235, 40, None), (-5, -5, 20, None)))
+def test_circle(draw, args):
+    fb = draw._display.fb
+    (x, y, r, width) = args
+    draw.circle(x, y, r, 0x07e0, width)
+    expected = render_shape(x - r, y - r, 2*r + 1, 2*r + 1, r, 0x07e0,
+                            width)
+    assert (fb.pixels == expected).all()
+
+@pytest.mark.parametrize("args", (
+    (20, 30, 200, 100, 12, None), (20, 30, 200, 100, 12, 5),
+    (20, 30, 200, 100, 0, 3), (100, 10, 20, 200, 30, None),
+    (100, 10, 21, 200, 300, 4), (50, 60, 7, 7, 1, None),
+    (200, -10, 80, 40, 15, 6), (-30, 200, 60, 60, 25, None)))
+def test_rounded_rect(draw, args):
+    fb = draw._display.fb
+    (x, y, w, h, r, width) = args
+    draw.rounded_rect(x, y, w, h, r, 0xf81f, width)
+    expected = render_shape(x, y, w, h, r, 0xf81f, width)
+    assert (fb.pixels == expected).all()
+
+@pytest.mark.parametrize("args", (
+    (120, 120, 90, 100, 0, 360), (120, 120, 90, 100, 0, 90),
+    (120, 120, 90, 100, 45, 200), (120, 120, 0, 50, 300, 30),
+    (120, 120, 80, 100, 10, 350), (120, 120, 1, 1, 0, 180),
+    (20, 220, 30, 40, 90, 315), (120, 120, 100, 110, 0, 0)))
+def test_arc(draw, args):
+    fb = draw._display.fb
+    (x, y, r0, r1, start, end) = args
+    draw.arc(x, y, r0, r1, start, end, 0xffe0)
+    sweep = (end - start) % 360 if end != start else 0
+    if end - start >= 360:
+        sweep = 360
+    if not sweep:
+        assert not fb.pixels.any()
+        return
+    expected = render_shape(x - r1, y - r1, 2*r1 + 1, 2*r1 + 1, r1, 0xffe0,
+                            r1 - r0 + 1 if r0 else None,
+                            None if sweep == 360 else (start, start + sweep))
+    assert (fb.pixels == expected).all()
@@ -16,51 +16,688 @@ R = const(0b11111_000000_00000)
 G = const(0b00000_111111_00000)
 B = const(0b00000_000000_11111)
 
+# Maximum number of (merged) rectangles in the damage set
+_DAMAGE_MAX = const(8)
+
+# Maximum number of glyphs composed into a single scanline
+_GLYPH_MAX = const(64)
+
+# Number of words in the glyph info header (see _layout)
+_INFO_HDR = const(13)
+
+# Number of spans that can be rasterised without allocating memory
+_SPAN_MAX = const(128)
+
+@micropython.viper
+def _layout(s, index, fnt, info):
+    """Look up the glyphs for the next chunk of a string.
+
+    The string is consumed as UTF-8 so that no character objects need
+    to be allocated. The parameters are held in the header at the start of
+    info (the glyphs follow it). info[0] and info[1] hold the byte offset
+    and the number of characters already consumed, info[4] and info[5]
+    hold the length of the string and the width limit, info[6] and info[7]
+    hold the range of characters in the font and info[8] is non-zero if
+    the font is cropped. On return info[2] and info[3] hold the number of
+    glyphs and the width (including the one pixel gap after each glyph)
+    of the chunk. The rest of the header is used by _compose().
+
+    Glyphs from cropped fonts (see tools/cropfont.py) are recorded with a
+    stride of zero.
+    """
+    sp = ptr8(s)
+    ip = ptr8(index)
+    fp = ptr8(fnt)
+    inf = ptr32(info)
+
+    pos = int(inf[0])
+    done = int(inf[1])
+    nchars = int(inf[4])
+    limit = int(inf[5])
+    lo = int(inf[6])
+    hi = int(inf[7])
+    cropped = int(inf[8])
+    nmax = (int(len(info)) - _INFO_HDR) >> 1
+    n = 0
+    px = 0
+
+    while done < nchars and n < nmax:
+        c = int(sp[pos])
+        if (c & 0xc0) == 0x80:
+            # Skip the continuation bytes of a multibyte character
+            pos += 1
+            continue
+
+        ioff = 0
+        if c >= lo and c <= hi:
+            ioff = 2 * (c - lo + 1)
+        doff = ip[ioff] | (ip[ioff+1] << 8)
+        if cropped:
+            w = int(fp[doff])
+            g = (doff + 1) | (w << 16)
+        else:
+            w = fp[doff] | (fp[doff+1] << 8)
+            g = (doff + 2) | (w << 16) | (((w + 7) >> 3) << 24)
+        if n and px + w + 1 > limit:
+            break
+
+        inf[_INFO_HDR + 2*n] = g
+        inf[_INFO_HDR + 2*n + 1] = c
+        n += 1
+        px += w + 1
+        pos += 1
+        done += 1
+
+    inf[0] = pos
+    inf[1] = done
+    inf[2] = n
+    inf[3] = px
+
 @micropython.viper
-def _bitblit(bitbuf, pixels, bgfg: int, count: int):
-    mv = ptr16(bitbuf)
-    px = ptr8(pixels)
+def _compose(buf, fnt, pool, info):
+    """Render a single scanline of a string into buf.
+
+    The number of glyphs is taken from info[2] and info[9] to info[12]
+    hold the row, the colours, the left padding and the total width (see
+    _layout). Each glyph is described by two words that follow the
+    header. The first holds the offset, width and stride of the glyph
+    data and the second holds the character code together with a flag
+    (0x100) that indicates the glyph data is pre-rendered in the glyph
+    cache pool rather than being 1-bit font data. A stride of zero
+    indicates a cropped glyph, where only the bounding box of the glyph
+    is stored (and the rows are not padded).
+    """
+    dst = ptr16(buf)
+    fp = ptr8(fnt)
+    cp = ptr16(pool)
+    inf = ptr32(info)
+
+    n = int(inf[2])
+    row = int(inf[9])
+    bgfg = int(inf[10])
+    leftpad = int(inf[11])
+    total = int(inf[12])
 
     # Extract and byte-swap
     bg = ((bgfg >> 24) & 0xff) + ((bgfg >> 8) & 0xff00)
     fg = ((bgfg >>  8) & 0xff) + ((bgfg & 0xff) << 8)
 
-    bitselect = 0x80
-    pxp = 0
-    mvp = 0
+    p = 0
+    while p < leftpad:
+        dst[p] = bg
+        p += 1
+
+    for i in range(_INFO_HDR, _INFO_HDR + 2*n, 2):
+        g = inf[i]
+        w = (g >> 16) & 0xff
+        if w > total - p:
+            w = total - p
+        stride = (g >> 24) & 0xff
+        q = (g & 0xffff) + row * stride
+
+        if inf[i+1] & 0x100:
+            q >>= 1
+            for k in range(w):
+                dst[p] = cp[q]
+                p += 1
+                q += 1
+        elif stride:
+            bitselect = 0x80
+            for k in range(w):
+                dst[p] = fg if fp[q] & bitselect else bg
+                p += 1
+                bitselect >>= 1
+                if not bitselect:
+                    bitselect = 0x80
+                    q += 1
+        else:
+            # Cropped glyph: the header holds the bounding box
+            left = int(fp[q])
+            bw = int(fp[q+1])
+            r = row - int(fp[q+2])
+            end = p + w
+            if r >= 0 and r < int(fp[q+3]):
+                e = p + left
+                if e > end:
+                    e = end
+                while p < e:
+                    dst[p] = bg
+                    p += 1
+                pos = r * bw
+                q += 4 + (pos >> 3)
+                bitselect = 0x80 >> (pos & 7)
+                e += bw
+                if e > end:
+                    e = end
+                while p < e:
+                    dst[p] = fg if fp[q] & bitselect else bg
+                    p += 1
+                    bitselect >>= 1
+                    if not bitselect:
+                        bitselect = 0x80
+                        q += 1
+            while p < end:
+                dst[p] = bg
+                p += 1
+
+        if p < total:
+            dst[p] = bg
+            p += 1
+
+    while p < total:
+        dst[p] = bg
+        p += 1
+
+@micropython.viper
+def _expand(buf, fnt, glyph):
+    """Expand a 1-bit glyph into RGB565 pixels.
 
-    for bit in range(count):
-        # Draw the pixel
-        active = px[pxp] & bitselect
-        mv[mvp] = fg if active else bg
-        mvp += 1
+    glyph holds the byte offset into buf, the offset, stride, width and
+    height of the glyph data and the colours.
+    """
+    dst = ptr16(buf)
+    fp = ptr8(fnt)
+    gp = ptr32(glyph)
 
-        # Advance to the next bit
-        bitselect >>= 1
-        if not bitselect:
-            bitselect = 0x80
-            pxp += 1
+    offset = int(gp[0])
+    doff = int(gp[1])
+    stride = int(gp[2])
+    w = int(gp[3])
+    h = int(gp[4])
+    bgfg = int(gp[5])
+
+    # Extract and byte-swap
+    bg = ((bgfg >> 24) & 0xff) + ((bgfg >> 8) & 0xff00)
+    fg = ((bgfg >>  8) & 0xff) + ((bgfg & 0xff) << 8)
+
+    p = offset >> 1
+    if not stride:
+        # Cropped glyph: clear the glyph then draw the bounding box
+        for k in range(w * h):
+            dst[p+k] = bg
+        left = int(fp[doff])
+        bw = int(fp[doff+1])
+        p += int(fp[doff+2]) * w + left
+        q = doff + 4
+        bitselect = 0x80
+        for row in range(int(fp[doff+3])):
+            for k in range(bw):
+                if fp[q] & bitselect:
+                    dst[p+k] = fg
+                bitselect >>= 1
+                if not bitselect:
+                    bitselect = 0x80
+                    q += 1
+            p += w
+        return
+
+    for row in range(h):
+        q = doff + row * stride
+        bitselect = 0x80
+        for k in range(w):
+            dst[p] = fg if fp[q] & bitselect else bg
+            p += 1
+            bitselect >>= 1
+            if not bitselect:
+                bitselect = 0x80
+                q += 1
+
+# RGB565 value of each entry in the 8-bit CLUT used by 2-bit RLE images.
+# The values are stored big-endian (so they can be copied straight into
+# the linebuffer) and, because this is a bytes literal, the table lives in
+# flash when the module is frozen. Generated using:
+#
+#   tools/rle_encode.py --clut-table
+_CLUT8 =\
+b'\x00\x00\x00\x06\x00\x0c\x00\x13\x00\x19\x00\x1f\x01\x80\x01\x86'\
+b'\x01\x8c\x01\x93\x01\x99\x01\x9f\x03\x20\x03\x26\x03\x2c\x03\x33'\
+b'\x03\x39\x03\x3f\x04\xc0\x04\xc6\x04\xcc\x04\xd3\x04\xd9\x04\xdf'\
+b'\x06\x60\x06\x66\x06\x6c\x06\x73\x06\x79\x06\x7f\x07\xe0\x07\xe6'\
+b'\x07\xec\x07\xf3\x07\xf9\x07\xff\x30\x00\x30\x06\x30\x0c\x30\x13'\
+b'\x30\x19\x30\x1f\x31\x80\x31\x86\x31\x8c\x31\x93\x31\x99\x31\x9f'\
+b'\x33\x20\x33\x26\x33\x2c\x33\x33\x33\x39\x33\x3f\x34\xc0\x34\xc6'\
+b'\x34\xcc\x34\xd3\x34\xd9\x34\xdf\x36\x60\x36\x66\x36\x6c\x36\x73'\
+b'\x36\x79\x36\x7f\x37\xe0\x37\xe6\x37\xec\x37\xf3\x37\xf9\x37\xff'\
+b'\x60\x00\x60\x06\x60\x0c\x60\x13\x60\x19\x60\x1f\x61\x80\x61\x86'\
+b'\x61\x8c\x61\x93\x61\x99\x61\x9f\x63\x20\x63\x26\x63\x2c\x63\x33'\
+b'\x63\x39\x63\x3f\x64\xc0\x64\xc6\x64\xcc\x64\xd3\x64\xd9\x64\xdf'\
+b'\x66\x60\x66\x66\x66\x6c\x66\x73\x66\x79\x66\x7f\x67\xe0\x67\xe6'\
+b'\x67\xec\x67\xf3\x67\xf9\x67\xff\x98\x00\x98\x06\x98\x0c\x98\x13'\
+b'\x98\x19\x98\x1f\x99\x80\x99\x86\x99\x8c\x99\x93\x99\x99\x99\x9f'\
+b'\x9b\x20\x9b\x26\x9b\x2c\x9b\x33\x9b\x39\x9b\x3f\x9c\xc0\x9c\xc6'\
+b'\x9c\xcc\x9c\xd3\x9c\xd9\x9c\xdf\x9e\x60\x9e\x66\x9e\x6c\x9e\x73'\
+b'\x9e\x79\x9e\x7f\x9f\xe0\x9f\xe6\x9f\xec\x9f\xf3\x9f\xf9\x9f\xff'\
+b'\xc8\x00\xc8\x06\xc8\x0c\xc8\x13\xc8\x19\xc8\x1f\xc9\x80\xc9\x86'\
+b'\xc9\x8c\xc9\x93\xc9\x99\xc9\x9f\xcb\x20\xcb\x26\xcb\x2c\xcb\x33'\
+b'\xcb\x39\xcb\x3f\xcc\xc0\xcc\xc6\xcc\xcc\xcc\xd3\xcc\xd9\xcc\xdf'\
+b'\xce\x60\xce\x66\xce\x6c\xce\x73\xce\x79\xce\x7f\xcf\xe0\xcf\xe6'\
+b'\xcf\xec\xcf\xf3\xcf\xf9\xcf\xff\xf8\x00\xf8\x06\xf8\x0c\xf8\x13'\
+b'\xf8\x19\xf8\x1f\xf9\x80\xf9\x86\xf9\x8c\xf9\x93\xf9\x99\xf9\x9f'\
+b'\xfb\x20\xfb\x26\xfb\x2c\xfb\x33\xfb\x39\xfb\x3f\xfc\xc0\xfc\xc6'\
+b'\xfc\xcc\xfc\xd3\xfc\xd9\xfc\xdf\xfe\x60\xfe\x66\xfe\x6c\xfe\x73'\
+b'\xfe\x79\xfe\x7f\xff\xe0\xff\xe6\xff\xec\xff\xf3\xff\xf9\xff\xff'\
+b'\x7a\x6f\x7a\x76\x7a\x7c\x7b\xef\x7b\xf6\x7b\xfc\x7d\x8f\x7d\x96'\
+b'\x7d\x9c\x7f\x2f\x7f\x36\x7f\x3c\xb2\x6f\xb2\x76\xb2\x7c\xb3\xef'\
+b'\xb3\xf6\xb3\xfc\xb5\x8f\xb5\x96\xb5\x9c\xb7\x2f\xb7\x36\xb7\x3c'\
+b'\xe2\x6f\xe2\x76\xe2\x7c\xe3\xef\xe3\xf6\xe3\xfc\xe5\x8f\xe5\x96'\
+b'\xe5\x9c\xe7\x2f\xe7\x36\xe7\x3c\x29\x65\x39\xe7\x4a\x69\x5a\xeb'
+
+@micropython.viper
+def _rle_decode(rle, palette, state, buf) -> int:
+    """Decode RLE image data directly into a pixel buffer.
+
+    Both the 1-bit and 2-bit formats are handled. The decode stops when
+    either state[5] pixels have been written into buf or the end of the
+    RLE data (state[4]) is reached. The decoder state is kept in the
+    first four words of state (the offset into rle, the pixels remaining
+    in the current run, the current palette index and, for 2-bit images,
+    the next palette entry to reload, which is zero for 1-bit images) so
+    that the next call will carry on where this one left off. The
+    palette holds byte swapped RGB565 values.
+
+    Returns the number of pixels written into buf.
+    """
+    src = ptr8(rle)
+    pal = ptr16(palette)
+    st = ptr32(state)
+    dst = ptr16(buf)
+    clut = ptr16(_CLUT8)
+
+    i = int(st[0])
+    rl = int(st[1])
+    px = int(st[2])
+    nc = int(st[3])
+    n = int(st[4])
+    limit = int(st[5])
+    bp = 0
+
+    while True:
+        if rl:
+            end = bp + rl
+            if end > limit:
+                end = limit
+            rl -= end - bp
+            color = pal[px]
+            while bp < end:
+                dst[bp] = color
+                bp += 1
+            if bp >= limit:
+                break
+        if i >= n:
+            break
+
+        op = src[i]
+        i += 1
+        if not nc:
+            # 1-bit: runs alternate between background and foreground
+            rl = op
+            px ^= 1
+            continue
+
+        px = op >> 6
+        rl = op & 0x3f
+        if rl == 0:
+            # Load the next palette entry from the CLUT. The loaded
+            # entries cycle through 1, 2 and 3.
+            pal[nc] = clut[src[i]]
+            i += 1
+            nc += 1
+            if nc > 3:
+                nc = 1
+        elif rl == 63:
+            # Extended run length
+            while i < n:
+                op = src[i]
+                i += 1
+                rl += op
+                if op != 255:
+                    break
+
+    st[0] = i
+    st[1] = rl
+    st[2] = px
+    st[3] = nc
+    return bp
 
 @micropython.viper
-def _clut8_rgb565(i: int) -> int:
-    if i < 216:
-        rgb565  = (( i  % 6) * 0x33) >> 3
-        rg = i // 6
-        rgb565 += ((rg  % 6) * (0x33 << 3)) & 0x07e0
-        rgb565 += ((rg // 6) * (0x33 << 8)) & 0xf800
-    elif i < 252:
-        i -= 216
-        rgb565  = (0x7f + (( i  % 3) * 0x33)) >> 3
-        rg = i // 3
-        rgb565 += ((0x4c << 3) + ((rg  % 4) * (0x33 << 3))) & 0x07e0
-        rgb565 += ((0x7f << 8) + ((rg // 4) * (0x33 << 8))) & 0xf800
+def _rle8_decode(rle, palette, state, buf) -> int:
+    """Decode 8-bit RLE image data directly into a pixel buffer.
+
+    Each run is a CLUT index followed by a run length. A run length of
+    255 is extended by the bytes that follow (exactly as for 2-bit
+    images) and a run length of zero marks a single pixel followed by a
+    literal block: a count and then count CLUT indices, each of which is
+    a single pixel.
+
+    The arguments, and the decoder state (the offset into rle, the pixels
+    remaining in the current run, the current byte swapped RGB565 colour,
+    the pixels remaining in the literal block, the length of the RLE data
+    and the pixel limit), are the same as _rle_decode() although the
+    palette is not used.
+
+    Returns the number of pixels written into buf.
+    """
+    src = ptr8(rle)
+    st = ptr32(state)
+    dst = ptr16(buf)
+    clut = ptr16(_CLUT8)
+
+    i = int(st[0])
+    rl = int(st[1])
+    color = int(st[2])
+    lit = int(st[3])
+    n = int(st[4])
+    limit = int(st[5])
+    bp = 0
+
+    while True:
+        if rl:
+            end = bp + rl
+            if end > limit:
+                end = limit
+            rl -= end - bp
+            while bp < end:
+                dst[bp] = color
+                bp += 1
+            if bp >= limit:
+                break
+        if lit:
+            end = bp + lit
+            if end > limit:
+                end = limit
+            lit -= end - bp
+            while bp < end:
+                dst[bp] = clut[src[i]]
+                i += 1
+                bp += 1
+            if bp >= limit:
+                break
+        if i >= n:
+            break
+
+        color = clut[src[i]]
+        rl = src[i+1]
+        i += 2
+        if rl == 0:
+            rl = 1
+            lit = src[i]
+            i += 1
+        elif rl == 255:
+            # Extended run length
+            while i < n:
+                op = src[i]
+                i += 1
+                rl += op
+                if op != 255:
+                    break
+
+    st[0] = i
+    st[1] = rl
+    st[2] = color
+    st[3] = lit
+    return bp
+
+@micropython.viper
+def _line_spans(line, spans) -> int:
+    """Rasterise a line into spans.
+
+    line (an array('H')) holds x0, y0, x1, y1 and w. The line covers
+    every pixel swept by a w x w pen as it follows the Bresenham path
+    from (x0, y0) to (x1, y1), both of which are relative to the top-left
+    of the bounding box. Every row of the resulting polygon is a single
+    span. So is every column, so lines that are closer to vertical than
+    horizontal are rasterised into columns instead of rows (which results
+    in fewer spans).
+
+    The first and last pixel of each span is stored, relative to the
+    top-left of the bounding box, in consecutive elements of spans.
+
+    Returns the number of spans.
+    """
+    lp = ptr16(line)
+    sp = ptr16(spans)
+
+    x0 = int(lp[0])
+    y0 = int(lp[1])
+    x1 = int(lp[2])
+    y1 = int(lp[3])
+    w = int(lp[4])
+
+    dx = x1 - x0
+    sx = 1
+    if dx < 0:
+        dx = 0 - dx
+        sx = -1
+    dy = y1 - y0
+    sy = 1
+    if dy < 0:
+        dy = 0 - dy
+        sy = -1
+    columns = dy > dx
+
+    if columns:
+        n = dx + w
     else:
-        i -= 252
-        gr6 = (0x2c + (0x10 * i)) >> 2
-        gr5 = gr6 >> 1
-        rgb565 = (gr5 << 11) + (gr6 << 5) + gr5
+        n = dy + w
+    for i in range(n):
+        sp[2*i] = 0xffff
+        sp[2*i+1] = 0
+
+    x = x0
+    y = y0
+    err = dx - dy
+    while True:
+        if columns:
+            major = x
+            lo = y
+        else:
+            major = y
+            lo = x
+        hi = lo + w - 1
+        for i in range(2*major, 2*(major+w), 2):
+            if lo < int(sp[i]):
+                sp[i] = lo
+            if hi > int(sp[i+1]):
+                sp[i+1] = hi
+
+        if x == x1 and y == y1:
+            break
+        e2 = 2 * err
+        if e2 >= 0 - dy:
+            err -= dy
+            x += sx
+        if e2 <= dx:
+            err += dx
+            y += sy
+
+    return n
+
+@micropython.viper
+def _shape_row(shape, row: int, spans) -> int:
+    """Rasterise one row of a shape into spans.
+
+    Shapes are rounded rectangles, optionally with a rounded rectangle
+    hole and optionally clipped to a sector. All the parameters are
+    stored in shape (an array('h')):
+
+    - 0..2: width, height and corner radius of the outline
+    - 3..7: x, y, width, height and corner radius of the hole
+      (the hole is ignored when its width is zero)
+    - 8..9: x, y of the centre of the sector
+    - 10: sector mode (0 for no sector, 1 if the sector is no larger
+      than 180 degrees, 2 otherwise)
+    - 11..14: vectors (scaled by 1024) pointing along the first and
+      last edge of the sector
+
+    The first and last pixel of each span, relative to the left edge
+    of the shape, are stored in consecutive elements of spans, which
+    must have room for at least 16 spans.
+
+    Returns the number of spans.
+    """
+    sh = ptr16(shape)
+    sp = ptr16(spans)
+
+    # Calculate the inset of both the outline and the hole (using an
+    # integer square root of the corner circle) for this row
+    ax = 0
+    bx = 0
+    cx = 0
+    dx = 0
+    hole = 0
+    for k in range(2):
+        base = 0
+        y = row
+        if k:
+            base = 5
+            y = row - int(sh[4])
+            if not sh[5] or y < 0 or y >= int(sh[6]):
+                break
+            hole = 1
+        w = int(sh[base])
+        h = int(sh[base+1])
+        r = int(sh[base+2])
+        if y < r:
+            dy = r - y
+        elif y > h - 1 - r:
+            dy = y - (h - 1 - r)
+        else:
+            dy = 0
+        inset = 0
+        if dy:
+            v = r * r + r - dy * dy
+            lo = 0
+            hi = r
+            while lo < hi:
+                mid = (lo + hi + 1) >> 1
+                if mid * mid <= v:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            inset = r - lo
+        if k:
+            cx = int(sh[3]) + inset - 1
+            dx = int(sh[3]) + w - inset
+        else:
+            ax = inset
+            bx = w - 1 - inset
+
+    # Each row has (at most) two segments; to the left and right of
+    # the hole
+    segments = 1
+    if hole:
+        if cx >= ax and dx <= bx:
+            segments = 2
+        elif cx >= ax:
+            bx = cx
+        elif dx <= bx:
+            ax = dx
+        else:
+            return 0
+
+    mode = int(sh[10])
+    n = 0
+    for k in range(segments):
+        a = ax
+        b = bx
+        if segments == 2:
+            if k:
+                a = dx
+            else:
+                b = cx
+
+        if not mode:
+            sp[2*n] = a
+            sp[2*n+1] = b
+            n += 1
+            continue
+
+        # Clip to the sector, one pixel at a time
+        svx = int(sh[11])
+        svy = int(sh[12])
+        evx = int(sh[13])
+        evy = int(sh[14])
+        if svx > 0x7fff:
+            svx -= 0x10000
+        if svy > 0x7fff:
+            svy -= 0x10000
+        if evx > 0x7fff:
+            evx -= 0x10000
+        if evy > 0x7fff:
+            evy -= 0x10000
+        py = row - int(sh[9])
+        start = -1
+        for x in range(a, b + 2):
+            inside = 0
+            if x <= b:
+                px = x - int(sh[8])
+                c1 = svx * py - svy * px
+                c2 = px * evy - py * evx
+                if c1 >= 0 and c2 >= 0:
+                    inside = 1
+                elif mode == 2 and (c1 >= 0 or c2 >= 0):
+                    inside = 1
+            if inside:
+                if start < 0:
+                    start = x
+            elif start >= 0:
+                if n < 16:
+                    sp[2*n] = start
+                    sp[2*n+1] = x - 1
+                    n += 1
+                start = -1
+
+    return n
 
-    return rgb565
+@micropython.viper
+def _band_write(tile, buf, n: int, window):
+    """Copy pixels written to a window into a band.
+
+    window holds the window (x, y, width, height), the number of
+    pixels already written to the window and the top row, number of rows
+    and width of the band. Pixels that fall outside the band (including
+    those to the left of the display) are discarded.
+    """
+    dst = ptr16(tile)
+    src = ptr16(buf)
+    win = ptr32(window)
+    wx = int(win[0])
+    wy = int(win[1])
+    ww = int(win[2])
+    wh = int(win[3])
+    pos = int(win[4])
+    top = int(win[5])
+    bottom = top + int(win[6])
+    stride = int(win[7])
+
+    i = 0
+    while i < n:
+        r = pos // ww
+        if r >= wh:
+            pos -= ww * wh
+            r = 0
+        c = pos - r * ww
+        seg = ww - c
+        if seg > n - i:
+            seg = n - i
+
+        y = wy + r
+        if y >= top and y < bottom:
+            x = wx + c
+            start = 0
+            if x < 0:
+                start = 0 - x
+            end = seg
+            if x + end > stride:
+                end = stride - x
+            d = (y - top) * stride + x
+            for j in range(start, end):
+                dst[d + j] = src[i + j]
+
+        i += seg
+        pos += seg
+
+    win[4] = pos
 
 @micropython.viper
 def _fill(mv, color: int, count: int, offset: int):
@@ -70,35 +707,512 @@ def _fill(mv, color: int, count: int, offset: int):
     for x in range(offset, offset+count):
         p[x] = color
 
+@micropython.viper
+def _sort_rects(rects, n: int) -> int:
+    """Sort rectangles by colour (then y, then x) and coalesce neighbours.
+
+    rects holds n (x, y, w, h, colour) records. Returns the number of
+    records that remain after empty rectangles have been dropped and
+    rectangles that share a colour and an edge have been merged.
+    """
+    r = ptr16(rects)
+
+    # Insertion sort (n is small and the input is often partially sorted)
+    for i in range(1, n):
+        j = 5 * i
+        while j:
+            k = j - 5
+            if r[k+4] < r[j+4]:
+                break
+            if r[k+4] == r[j+4]:
+                if r[k+1] < r[j+1]:
+                    break
+                if r[k+1] == r[j+1] and r[k] <= r[j]:
+                    break
+            for m in range(5):
+                t = r[k+m]
+                r[k+m] = r[j+m]
+                r[j+m] = t
+            j = k
+
+    # Coalesce runs (horizontally, then vertically) of the same colour
+    d = -5
+    for i in range(n):
+        s = 5 * i
+        if r[s+2] == 0 or r[s+3] == 0:
+            continue
+        if d >= 0 and r[d+4] == r[s+4]:
+            if r[d+1] == r[s+1] and r[d+3] == r[s+3] and r[d] + r[d+2] == r[s]:
+                r[d+2] += r[s+2]
+                continue
+            if r[d] == r[s] and r[d+2] == r[s+2] and r[d+1] + r[d+3] == r[s+1]:
+                r[d+3] += r[s+3]
+                continue
+        d += 5
+        if d != s:
+            for m in range(5):
+                r[d+m] = r[s+m]
+
+    return (d + 5) // 5
+
+def _move_rect(d, src, dst):
+    d[dst] = d[src]
+    d[dst+1] = d[src+1]
+    d[dst+2] = d[src+2]
+    d[dst+3] = d[src+3]
+
 def _bounding_box(s, font):
     if not s:
         return (0, font.height())
+    return (fonts.width(font, s) - 1, font.height())
 
-    get_ch = font.get_ch
-    w = len(s) - 1
-    for ch in s:
-        (_, h, wc) = get_ch(ch)
-        w += wc
+@micropython.viper
+def _wrap(s, widths, state):
+    """Find the end of the next line of wrapped text.
+
+    state[0] and state[1] hold the byte offset and the character index
+    of the start of the line. On return they hold the start of the next
+    line. Lines are broken after the last space (or at a newline) that
+    precedes the character that does not fit. state[2] to state[5] hold
+    the length of the string (in characters), the range of characters in
+    the font and the width to wrap the text into.
+    """
+    sp = ptr8(s)
+    wp = ptr8(widths)
+    st = ptr32(state)
+
+    nchars = int(st[2])
+    lo = int(st[3])
+    hi = int(st[4])
+    width = int(st[5])
+    pos = int(st[0])
+    i = int(st[1])
+    start = i
+    end = i
+    endpos = pos
+    l = 0
+
+    while i < nchars:
+        c = int(sp[pos])
+        n = 1
+        if c >= 0xf0:
+            n = 4
+        elif c >= 0xe0:
+            n = 3
+        elif c >= 0xc0:
+            n = 2
+
+        if c == 10:
+            end = i + 1
+            endpos = pos + n
+            break
+        if c == 32:
+            end = i + 1
+            endpos = pos + n
+        if c >= lo and c <= hi:
+            l += int(wp[c - lo + 1]) + 1
+        else:
+            l += int(wp[0]) + 1
+        if l > width:
+            break
+        pos += n
+        i += 1
+
+    if end <= start:
+        end = i
+        endpos = pos
+    st[0] = endpos
+    st[1] = end
+
+class GlyphCache(object):
+    """Cache of pre-rendered RGB565 glyphs.
+
+    Rendering a glyph requires every pixel to be expanded from the 1-bit
+    font data. The glyph cache keeps the expanded pixels (including the
+    pixels in a fixed size pool so that text that is redrawn frequently,
+    such as the status bar clock, can simply be copied into the scanline
+    rather than being expanded every time it is drawn.
+
+    The pool is divided into equal sized slots and, when the cache is full,
+    the least recently used glyph is evicted. Glyphs that are too large to
+    fit in a slot are rendered without caching.
+
+    .. data:: hits
+
+        Number of glyphs drawn from the cache.
+
+    .. data:: misses
+
+        Number of glyphs that had to be rendered.
 
-    return (w, h)
+    .. automethod:: __init__
+    """
+    def __init__(self, size=4096, slot=2*24*24):
+        """Allocate the glyph pool.
 
-@micropython.native
-def _draw_glyph(display, glyph, x, y, bgfg):
-    (px, h, w) = glyph
+        :param size: Size of the pool, in bytes
+        :param slot: Size of each slot, in bytes. The default is large
+                     enough for any character in the 24pt Sans Serif font.
+        """
+        nslots = size // slot
+        self._slot = slot
+        self._pool = memoryview(bytearray(nslots * slot))
+        self._stamps = array.array('I', (0,) * nslots)
+        self._owners = [None] * nslots
+        self._glyph = array.array('I', (0,) * 6)
+        self.clear()
+
+    def clear(self):
+        """Discard all cached glyphs and reset the statistics."""
+        self._slots = {}
+        self._contexts = []
+        for i in range(len(self._owners)):
+            self._owners[i] = None
+            self._stamps[i] = 0
+        self._clock = 0
+        self.hits = 0
+        self.misses = 0
+
+    def context(self, font, bgfg):
+        """Get the context number for a font and colour pair.
+
+        Contexts allow the cache to be keyed on small integers (which
+        avoids allocating a key for each glyph that is looked up).
+        """
+        contexts = self._contexts
+        key = (font, bgfg)
+        if key in contexts:
+            return contexts.index(key)
+        if len(contexts) >= 64:
+            hits = self.hits
+            misses = self.misses
+            self.clear()
+            self.hits = hits
+            self.misses = misses
+        contexts.append(key)
+        return len(contexts) - 1
 
-    buf = display.linebuffer[0:2*(w+1)]
-    buf[2*w] = 0
-    buf[2*w + 1] = 0
-    bytes_per_row = (w + 7) // 8
+    @micropython.native
+    def prepare(self, font, bgfg, info, n):
+        """Substitute cached glyphs into a string layout.
 
-    display.set_window(x, y, w+1, h)
-    quick_write = display.quick_write
+        Glyphs that are not already cached are rendered into the pool,
+        evicting the least recently used glyphs. Glyphs used by the current
+        layout are never evicted (instead the new glyph will remain
+        uncached).
 
-    display.quick_start()
-    for row in range(h):
-        _bitblit(buf, px[row*bytes_per_row:], bgfg, w)
-        quick_write(buf)
-    display.quick_end()
+        :returns: The glyph pool
+        """
+        ctx = self.context(font, bgfg)
+        h = font.height()
+        slots = self._slots
+        stamps = self._stamps
+        slotsz = self._slot
+        glyph = self._glyph
+        glyph[4] = h
+        glyph[5] = bgfg
+        self._clock += 1
+        clock = self._clock
+
+        for i in range(_INFO_HDR, _INFO_HDR + 2*n, 2):
+            code = info[i+1]
+            g = info[i]
+            w = (g >> 16) & 0xff
+            key = (ctx << 8) + code
+            slot = slots.get(key, -1)
+
+            if slot >= 0:
+                self.hits += 1
+            else:
+                self.misses += 1
+                if 2 * w * h > slotsz:
+                    continue
+
+                slot = 0
+                for j in range(1, len(stamps)):
+                    if stamps[j] < stamps[slot]:
+                        slot = j
+                if stamps[slot] == clock:
+                    continue
+                owner = self._owners[slot]
+                if owner is not None:
+                    del slots[owner]
+                self._owners[slot] = key
+                slots[key] = slot
+                glyph[0] = slot * slotsz
+                glyph[1] = g & 0xffff
+                glyph[2] = (g >> 24) & 0xff
+                glyph[3] = w
+                _expand(self._pool, font._font, glyph)
+
+            stamps[slot] = clock
+            info[i] = (slot * slotsz) | (w << 16) | ((2 * w) << 24)
+            info[i+1] = code | 0x100
+
+        return self._pool
+
+class ImageCache(object):
+    """Cache of decoded RGB565 images.
+
+    Small images, such as the icons in the status bar, are often drawn
+    many times with the same colours. The image cache keeps the decoded
+    pixels so that drawing a cached image requires only a single
+    :py:meth:`~.ST7789.rawblit`.
+
+    Images are keyed on the image itself (together with the colours used
+    to draw them, except for 8-bit images which have no adjustable
+    colours). The key holds a reference to the image so a cached image
+    cannot be freed, and its memory reused by a different image, whilst
+    it remains in the cache. When the cached images exceed the budget
+    then the least recently used images are evicted. Images that are
+    larger than the budget are never cached.
+
+    .. data:: hits
+
+        Number of images drawn from the cache.
+
+    .. data:: misses
+
+        Number of images that had to be decoded.
+
+    .. automethod:: __init__
+    """
+    def __init__(self, budget=4096):
+        """Create an empty image cache.
+
+        :param budget: Maximum memory to use for decoded images, in bytes
+        """
+        self.budget = budget
+        self.clear()
+
+    def clear(self):
+        """Discard all cached images and reset the statistics."""
+        self._images = {}
+        self._used = 0
+        self._clock = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Lookup a decoded image.
+
+        :returns: A (pixels, width, height) tuple or None
+        """
+        entry = self._images.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._clock += 1
+        entry[2] = self._clock
+        return entry[0]
+
+    def put(self, key, image):
+        """Add a decoded image to the cache.
+
+        Least recently used images are evicted until the new image fits
+        within the budget.
+
+        :param image: A (pixels, width, height) tuple
+        """
+        sz = len(image[0])
+        if sz > self.budget:
+            return
+        images = self._images
+        while self._used + sz > self.budget:
+            oldest = None
+            for k in images:
+                if oldest is None or images[k][2] < images[oldest][2]:
+                    oldest = k
+            self._used -= images[oldest][1]
+            del images[oldest]
+        self._clock += 1
+        images[key] = [image, sz, self._clock]
+        self._used += sz
+
+class Band(object):
+    """Off-screen framebuffer for a horizontal band of the display.
+
+    A band holds a tile of RGB565 pixels as wide as the display but only a
+    few rows tall. It provides the same interface as the display driver so
+    it can be substituted for the display whilst drawing; any pixels that
+    fall outside the band are discarded. See :py:meth:`.Draw565.render`.
+
+    .. automethod:: __init__
+    """
+    def __init__(self, display, rows=24):
+        """Allocate the tile.
+
+        :param display: Display that the band will be flushed to
+        :param rows: Height of the band, the tile requires 2 bytes of RAM
+                     for every pixel (so a 240x24 tile needs 11520 bytes)
+        """
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+        self.rows = rows
+        self.linebuffer = display.linebuffer
+        self.linebuffers = display.linebuffers
+        self.tile = memoryview(bytearray(2 * display.width * rows))
+        self._window = array.array('i', (0, 0, 0, 0, 0, 0, rows,
+                                         display.width))
+        self.top = 0
+        self.bottom = rows
+
+    def start(self, top, rows):
+        """Clear the tile (to black) ready to render a new band.
+
+        The rows covered by the band are recorded in the ``top`` and
+        ``bottom`` attributes so drawing operations that do not touch
+        the band can be skipped.
+        """
+        window = self._window
+        window[5] = top
+        window[6] = rows
+        self.top = top
+        self.bottom = top + rows
+        _fill(self.tile, 0, self.width * rows, 0)
+
+    def flush(self):
+        """Copy the band to the display using a single transfer."""
+        window = self._window
+        top = window[5]
+        rows = window[6]
+        self.display.rawblit(self.tile[0:2 * self.width * rows],
+                             0, top, self.width, rows)
+
+    def set_window(self, x, y, width, height):
+        window = self._window
+        window[0] = x
+        window[1] = y
+        window[2] = width
+        window[3] = height
+        window[4] = 0
+
+    def quick_window(self, x, y, width, height):
+        self.set_window(x, y, width, height)
+
+    def quick_start(self):
+        pass
+
+    def quick_end(self):
+        pass
+
+    @micropython.native
+    def quick_write(self, buf):
+        window = self._window
+        n = len(buf) // 2
+        y = window[1]
+        top = window[5]
+        if y >= top + window[6] or y + window[3] <= top:
+            window[4] += n
+        else:
+            _band_write(self.tile, buf, n, window)
+
+    def write_data(self, buf):
+        self.quick_write(buf)
+
+    def write_async(self, buf):
+        self.quick_write(buf)
+
+    def wait(self):
+        pass
+
+    def rawblit(self, buf, x, y, width, height):
+        self.set_window(x, y, width, height)
+        self.quick_write(buf)
+
+class Wrapper(object):
+    """Lazily wrap a long string into lines of text.
+
+    :py:meth:`.Draw565.wrap` wraps an entire string in one go, which is
+    slow for long messages when only the first few lines are going to be
+    shown. A wrapper instead finds the line boundaries on demand and keeps
+    a compact index of the start of each page (a page being a fixed number
+    of lines) so that any line can be found by wrapping at most one page.
+
+    Pages are only indexed when they are first visited so the first page
+    can be shown immediately and later pages are wrapped as the user
+    reaches them.
+
+    .. automethod:: __init__
+    """
+    def __init__(self, s, width, font, lines=9):
+        """Prepare to wrap a string.
+
+        :param s:     String to be wrapped (no longer than 65535 bytes)
+        :param width: Width to wrap the text into
+        :param font:  Font that the text will be drawn with
+        :param lines: Number of lines in each page
+        """
+        self._s = s
+        self._len = len(s)
+        self._table = fonts.widths(font)
+        self.lines = lines
+
+        # Character index and byte offset of the start of each page
+        self._pages = array.array('H', (0, 0))
+        self._state = array.array('I', (0, 0, len(s), font.min_ch(),
+                                        font.max_ch(), width))
+
+    def _seek(self, page):
+        """Start wrapping from the start of a page."""
+        pages = self._pages
+        state = self._state
+        state[0] = pages[2*page + 1]
+        state[1] = pages[2*page]
+
+    def _skip(self, n):
+        """Wrap n lines, returning False if the text ends first."""
+        s = self._s
+        nchars = self._len
+        state = self._state
+        for i in range(n):
+            if state[1] >= nchars:
+                return False
+            _wrap(s, self._table, state)
+        return state[1] < nchars
+
+    def line(self, n):
+        """Find the boundaries of a line.
+
+        Example:
+
+        .. code-block:: python
+
+            draw = wasp.watch.drawable
+            wrapper = draw.wrapper(long_string, 240)
+
+            i = 0
+            line = wrapper.line(i)
+            while line:
+                draw.string(long_string[line[0]:line[1]].rstrip(), 0, 24*i)
+                i += 1
+                line = wrapper.line(i)
+
+        :param n: Line number (starting from zero)
+        :returns: Tuple of (start, end) or None if the text has fewer lines
+        """
+        lines = self.lines
+        page = n // lines
+        pages = self._pages
+
+        # Index any pages that have not yet been visited
+        while len(pages) <= 2 * page:
+            self._seek(len(pages) // 2 - 1)
+            if not self._skip(lines):
+                return None
+            state = self._state
+            pages.append(state[1])
+            pages.append(state[0])
+
+        self._seek(page)
+        if not self._skip(n - page * lines):
+            return None
+        state = self._state
+        start = state[1]
+        _wrap(self._s, self._table, state)
+        return (start, state[1])
 
 class Draw565(object):
     """Drawing library for RGB565 displays.
@@ -116,15 +1230,33 @@ class Draw565(object):
         and 24pt Sans Serif text.
         """
         self._display = display
+        self._damage = array.array('h', (0,) * (4 * _DAMAGE_MAX))
+        self._ndamage = 0
+        self._flushing = None
+        self._glyphs = None
+        self._images = None
+        self._band = None
+        self._clip = None
+        self._glyph_info = array.array('I', (0,) * (_INFO_HDR + 2*_GLYPH_MAX))
+        self._palette = array.array('H', (0, 0, 0, 0))
+        self._rle_state = array.array('I', (0,) * 6)
+        self._spans = array.array('H', (0,) * (2 * _SPAN_MAX))
+        self._shape = array.array('h', (0,) * 15)
+        self._line = array.array('H', (0,) * 5)
+        self._row_spans = array.array('H', (0,) * 32)
+        self._run_spans = array.array('H', (0,) * 32)
+        self._lstate = array.array('I', (0,) * 6)
         self.reset()
 
     def reset(self):
         """Restore the default colours and font.
 
         Default colours are white-on-block (white foreground, black
-        background) and the default font is 24pt Sans Serif."""
+        background) and the default font is 24pt Sans Serif. Any pending
+        damage is discarded."""
         self.set_color(0xffff)
         self.set_font(fonts.sans24)
+        self._ndamage = 0
 
     def fill(self, bg=None, x=0, y=0, w=None, h=None):
         """Draw a solid colour rectangle.
@@ -141,7 +1273,7 @@ class Draw565(object):
                    the bottom-most pixel of the display)
         """
         display = self._display
-        quick_write = display.quick_write
+        write_async = display.write_async
 
         if bg is None:
             bg = self._bgfg >> 16
@@ -149,8 +1281,9 @@ class Draw565(object):
             w = display.width - x
         if h is None:
             h = display.height - y
-
-        display.set_window(x, y, w, h)
+        clip = self._clip
+        if clip and (y >= clip.bottom or y + h <= clip.top):
+            return
 
         remaining = w * h
 
@@ -159,116 +1292,332 @@ class Draw565(object):
         sz = len(buf) // 2
         _fill(buf, bg, min(sz, remaining), 0)
 
-        display.quick_start()
+        display.quick_window(x, y, w, h)
         while remaining >= sz:
-            quick_write(buf)
+            write_async(buf)
             remaining -= sz
         if remaining:
-            quick_write(buf[0:2*remaining])
+            write_async(buf[0:2*remaining])
         display.quick_end()
 
+    def fill_rects(self, rects, n=None):
+        """Draw a batch of solid colour rectangles.
+
+        The rectangles are sorted by colour and rectangles of the same
+        colour that share an edge are merged. The line buffer is only
+        filled once for each colour and each rectangle needs just one
+        window. This makes fill_rects() much cheaper than calling
+        :py:meth:`.fill` for each rectangle.
+
+        Since the drawing order is changed the rectangles should not
+        overlap (unless they are the same colour).
+
+        Example:
+
+        .. code-block:: python
+
+            rects = array.array('H', (
+                    0,  0, 240, 2, 0xffff,
+                    0, 38, 240, 2, 0xffff,
+                    0,  2, 240, 36, 0x001f))
+            draw.fill_rects(rects)
+
+        :param rects: An ``array('H')`` of (x, y, w, h, colour) records.
+                      The array is sorted (and coalesced) in place.
+        :param n:     Number of records, defaults to None (which means
+                      use the whole array)
+        """
+        if n is None:
+            n = len(rects) // 5
+        n = _sort_rects(rects, n)
+
+        buf = self._display.linebuffer
+        sz = len(buf) // 2
+        color = -1
+        for i in range(0, 5*n, 5):
+            c = rects[i+4]
+            if c != color:
+                color = c
+                _fill(buf, c, sz, 0)
+            self._solid(rects[i], rects[i+1], rects[i+2], rects[i+3])
+
+    def invalidate(self, x, y, w, h):
+        """Add a rectangle to the damage set.
+
+        Rectangles that overlap (or touch) a rectangle that is already
+        damaged are merged with it so that, when the damage is flushed,
+        each pixel is only redrawn once. If the damage set is full then the
+        new rectangle is merged into whichever existing rectangle grows the
+        least.
+
+        :param x:  X coordinate of the left-most pixels of the rectangle
+        :param y:  Y coordinate of the top-most pixels of the rectangle
+        :param w:  Width of the rectangle
+        :param h:  Height of the rectangle
+        """
+        if w <= 0 or h <= 0:
+            return
+
+        d = self._damage
+        n = self._ndamage
+        x1 = x + w
+        y1 = y + h
+
+        # Absorb every rectangle we touch, restarting whenever we grow
+        i = 0
+        while i < n:
+            j = 4 * i
+            if x <= d[j+2] and d[j] <= x1 and y <= d[j+3] and d[j+1] <= y1:
+                x = min(x, d[j])
+                y = min(y, d[j+1])
+                x1 = max(x1, d[j+2])
+                y1 = max(y1, d[j+3])
+                n -= 1
+                _move_rect(d, 4 * n, j)
+                i = 0
+            else:
+                i += 1
+
+        if n >= _DAMAGE_MAX:
+            best = 0
+            growth = None
+            for i in range(n):
+                j = 4 * i
+                ux = max(x1, d[j+2]) - min(x, d[j])
+                uy = max(y1, d[j+3]) - min(y, d[j+1])
+                g = ux * uy - (d[j+2] - d[j]) * (d[j+3] - d[j+1])
+                if growth is None or g < growth:
+                    best = i
+                    growth = g
+            n -= 1
+            j = 4 * best
+            x = min(x, d[j])
+            y = min(y, d[j+1])
+            x1 = max(x1, d[j+2])
+            y1 = max(y1, d[j+3])
+            _move_rect(d, 4 * n, j)
+
+        j = 4 * n
+        d[j] = x
+        d[j+1] = y
+        d[j+2] = x1
+        d[j+3] = y1
+        self._ndamage = n + 1
+
+    def damaged(self, x, y, w, h):
+        """Check whether a rectangle intersects the damage set.
+
+        This is typically used from the paint callback passed to
+        :py:meth:`~.flush` to skip widgets that do not need redrawing.
+        During a flush only the rectangle that is currently being redrawn
+        is checked so a widget that overlaps several damaged rectangles is
+        only repainted as part of the rectangles it overlaps.
+
+        :returns: True if the rectangle needs to be redrawn.
+        """
+        x1 = x + w
+        y1 = y + h
+        d = self._flushing
+        if d:
+            return x < d[2] and d[0] < x1 and y < d[3] and d[1] < y1
+
+        d = self._damage
+        for i in range(0, 4 * self._ndamage, 4):
+            if x < d[i+2] and d[i] < x1 and y < d[i+3] and d[i+1] < y1:
+                return True
+        return False
+
+    def flush(self, paint=None, clear=True, region=None):
+        """Redraw the damage set.
+
+        Every merged rectangle is first cleared to the background colour
+        (using a single window per rectangle) and then, if provided, the
+        paint callback is invoked with the bounds of the rectangle. Once
+        all rectangles have been redrawn the damage set is emptied.
+
+        The damage set is shared by the application and the widgets that
+        surround it. Widgets that flush their own damage as soon as it is
+        invalidated should pass the region they own. Only the parts of the
+        damage set inside the region are redrawn and any damage outside
+        it remains pending until its owner flushes it. A rectangle that
+        extends beyond the region is redrawn where it overlaps the region
+        but it also stays in the damage set.
+
+        Example:
+
+        .. code-block:: python
+
+            def _paint(self, x, y, w, h):
+                draw = wasp.watch.drawable
+                if draw.damaged(*self._label_rect):
+                    draw.string(self._label, 0, 108, width=240)
+
+            draw.invalidate(0, 108, 240, 24)
+            draw.flush(self._paint)
+
+        :param paint: Callable taking ``(x, y, w, h)``, defaults to None
+        :param clear: Fill the damaged rectangles with the background
+                      colour before painting, defaults to True
+        :param region: Tuple of ``(x, y, w, h)`` limiting the redraw,
+                       defaults to None (the whole damage set is redrawn)
+        """
+        d = self._damage
+        n = self._ndamage
+        bg = self._bgfg >> 16
+        if region:
+            (rx, ry, rw, rh) = region
+            rx1 = rx + rw
+            ry1 = ry + rh
+        keep = 0
+        try:
+            for i in range(0, 4 * n, 4):
+                x = d[i]
+                y = d[i+1]
+                x1 = d[i+2]
+                y1 = d[i+3]
+                if region:
+                    if x >= rx1 or rx >= x1 or y >= ry1 or ry >= y1:
+                        _move_rect(d, i, 4 * keep)
+                        keep += 1
+                        continue
+                    if x < rx or y < ry or x1 > rx1 or y1 > ry1:
+                        _move_rect(d, i, 4 * keep)
+                        keep += 1
+                        x = max(x, rx)
+                        y = max(y, ry)
+                        x1 = min(x1, rx1)
+                        y1 = min(y1, ry1)
+                if clear:
+                    self.fill(bg, x, y, x1 - x, y1 - y)
+                if paint:
+                    self._flushing = (x, y, x1, y1)
+                    paint(x, y, x1 - x, y1 - y)
+        finally:
+            self._flushing = None
+            self._ndamage = keep
+
     @micropython.native
     def blit(self, image, x, y, fg=0xffff, c1=0x4a69, c2=0x7bef):
         """Decode and draw an encoded image.
 
-        :param image: Image data in either 1-bit RLE or 2-bit RLE formats. The
+        :param image: Image data in 1-bit, 2-bit or 8-bit RLE formats. The
                       format will be autodetected
         :param x: X coordinate for the left-most pixels in the image
         :param y: Y coordinate for the top-most pixels in the image
         """
-        if len(image) == 3:
-            # Legacy 1-bit image
-            self.rleblit(image, (x, y), fg)
-        else: #elif image[0] == 2:
-            # 2-bit RLE image, (255x255, v1)
-            self._rle2bit(image, x, y, fg, c1, c2)
+        clip = self._clip
+        if clip:
+            sy = image[1] if len(image) == 3 else image[2]
+            if y >= clip.bottom or y + sy <= clip.top:
+                return
+
+        images = self._images
+        if images:
+            if len(image) != 3 and image[0] == 8:
+                key = image
+            else:
+                key = (image, fg, c1, c2)
+            pixels = images.get(key)
+            if pixels:
+                self._display.rawblit(pixels[0], x, y, pixels[1], pixels[2])
+                return
+
+        (rle, sx, sy, decode) = self._rle_init(image, fg, c1, c2, 0)
+        if images and 2 * sx * sy <= images.budget:
+            buf = bytearray(2 * sx * sy)
+            state = self._rle_state
+            state[5] = sx * sy
+            decode(rle, self._palette, state, buf)
+            images.put(key, (buf, sx, sy))
+            self._display.rawblit(buf, x, y, sx, sy)
+        else:
+            self._rle_blit(rle, x, y, sx, sy, decode)
 
-    @micropython.native
     def rleblit(self, image, pos=(0, 0), fg=0xffff, bg=0):
         """Decode and draw a 1-bit RLE image.
 
         .. deprecated:: M2
             Use :py:meth:`~.blit` instead.
         """
-        display = self._display
-        write_data = display.write_data
-        (sx, sy, rle) = image
-
-        display.set_window(pos[0], pos[1], sx, sy)
-
-        buf = display.linebuffer[0:2*sx]
-        bp = 0
-        color = bg
+        clip = self._clip
+        if clip and (pos[1] >= clip.bottom or pos[1] + image[1] <= clip.top):
+            return
+        (rle, sx, sy, decode) = self._rle_init(image, fg, 0, 0, bg)
+        self._rle_blit(rle, pos[0], pos[1], sx, sy, decode)
 
-        for rl in rle:
-            while rl:
-                count = min(sx - bp, rl)
-                _fill(buf, color, count, bp)
-                bp += count
-                rl -= count
+    @micropython.native
+    def _rle_init(self, image, fg, c1, c2, bg):
+        """Prepare the decoder to draw an RLE image.
 
-                if bp >= sx:
-                    write_data(buf)
-                    bp = 0
+        :returns: A (rle, width, height, decoder) tuple
+        """
+        palette = self._palette
+        state = self._rle_state
+        palette[0] = (bg >> 8) | ((bg & 0xff) << 8)
+        state[1] = 0
 
-            if color == bg:
-                color = fg
-            else:
-                color = bg
+        if len(image) == 3:
+            # Legacy 1-bit image
+            palette[1] = (fg >> 8) | ((fg & 0xff) << 8)
+            state[0] = 0
+            state[2] = 1
+            state[3] = 0
+            state[4] = len(image[2])
+            return (image[2], image[0], image[1], _rle_decode)
+
+        if image[0] == 8:
+            # 8-bit RLE image, (255x255, v1)
+            state[0] = 3
+            state[3] = 0
+            state[4] = len(image)
+            return (image, image[1], image[2], _rle8_decode)
+
+        # 2-bit RLE image, (255x255, v1)
+        palette[1] = (c1 >> 8) | ((c1 & 0xff) << 8)
+        palette[2] = (c2 >> 8) | ((c2 & 0xff) << 8)
+        palette[3] = (fg >> 8) | ((fg & 0xff) << 8)
+        state[0] = 3
+        state[2] = 0
+        state[3] = 1
+        state[4] = len(image)
+        return (image, image[1], image[2], _rle_decode)
 
     @micropython.native
-    def _rle2bit(self, image, x, y, fg, c1, c2):
-        """Decode and draw a 2-bit RLE image."""
-        display = self._display
-        quick_write = display.quick_write
-        sx = image[1]
-        sy = image[2]
-        rle = memoryview(image)[3:]
-
-        display.set_window(x, y, sx, sy)
-
-        if sx <= (len(display.linebuffer) // 4) and not bool(sy & 1):
-            sx *= 2
-            sy //= 2
-
-        palette = array.array('H', (0, c1, c2, fg))
-        next_color = 1
-        rl = 0
-        buf = display.linebuffer[0:2*sx]
-        bp = 0
-
-        display.quick_start()
-        for op in rle:
-            if rl == 0:
-                px = op >> 6
-                rl = op & 0x3f
-                if 0 == rl:
-                    rl = -1
-                    continue
-                if rl >= 63:
-                    continue
-            elif rl > 0:
-                rl += op
-                if op >= 255:
-                    continue
-            else:
-                palette[next_color] = _clut8_rgb565(op)
-                if next_color < 3:
-                    next_color += 1
-                else:
-                    next_color = 1
-                rl = 0
-                continue
+    def _rle_blit(self, rle, x, y, sx, sy, decode):
+        """Decode and draw RLE data using the current decoder state.
 
-            while rl:
-                count = min(sx - bp, rl)
-                _fill(buf, palette[px], count, bp)
-                bp += count
-                rl -= count
-
-                if bp >= sx:
-                    quick_write(buf)
-                    bp = 0
+        The image is decoded into the whole of the linebuffer, regardless
+        of where the rows of the image start and end, so that each write
+        to the display carries as many pixels as possible. When rendering
+        into a band the decode stops at the bottom of the band.
+        """
+        display = self._display
+        write_async = display.write_async
+        palette = self._palette
+        state = self._rle_state
+        bufs = display.linebuffers
+        limit = len(bufs[0]) // 2
+        remaining = sx * sy
+        clip = self._clip
+        if clip and y + sy > clip.bottom:
+            remaining = sx * (clip.bottom - y)
+        i = 0
+
+        # Alternate between the two line buffers so that the next block
+        # is decoded whilst the previous one is being transferred
+        display.quick_window(x, y, sx, sy)
+        while remaining > 0:
+            buf = bufs[i]
+            i ^= 1
+            state[5] = min(limit, remaining)
+            count = decode(rle, palette, state, buf)
+            if count < limit:
+                # Final (or truncated) block
+                if count:
+                    write_async(buf[0:2*count])
+                break
+            write_async(buf)
+            remaining -= count
         display.quick_end()
 
     def set_color(self, color, bg=0):
@@ -290,6 +1639,144 @@ class Draw565(object):
         """
         self._font = font
 
+    def set_glyph_cache(self, cache):
+        """Set the cache used to accelerate text rendering.
+
+        Example:
+
+        .. code-block:: python
+
+            draw = wasp.watch.drawable
+            draw.set_glyph_cache(draw565.GlyphCache(8 * 1152))
+
+        :param cache: A :py:class:`.GlyphCache` or None to disable caching
+        """
+        self._glyphs = cache
+
+    def set_image_cache(self, cache):
+        """Set the cache used to accelerate image drawing.
+
+        Example:
+
+        .. code-block:: python
+
+            draw = wasp.watch.drawable
+            draw.set_image_cache(draw565.ImageCache(8192))
+
+        :param cache: An :py:class:`.ImageCache` or None to disable caching
+        """
+        self._images = cache
+
+    def release(self):
+        """Release any memory that is held on behalf of the current app.
+
+        Cached images are discarded but the cache itself remains attached
+        (and will be refilled as images are drawn).
+        """
+        if self._images:
+            self._images.clear()
+
+    def set_band(self, band):
+        """Set the band used by :py:meth:`.render`.
+
+        :param band: A :py:class:`.Band` or None to draw directly to the
+                     display
+        """
+        self._band = band
+
+    def render(self, paint, y=0, h=None):
+        """Redraw part of the display using the band framebuffer.
+
+        paint() is called once for each band and must redraw everything
+        (each band starts out black). Drawing operations are rendered into
+        the band and the whole band is then copied to the display in a
+        single transfer. Drawing operations that do not touch the band are
+        skipped before any text is composed or images decoded. This avoids
+        flicker, so there is no need to mute the display, and replaces lots
+        of small SPI transfers with a handful of large ones.
+
+        The colours and font are restored before paint() is called so that
+        every band is rendered in the same way.
+
+        If no band has been set then paint() is called just once and draws
+        directly to the (muted) display.
+
+        Example:
+
+        .. code-block:: python
+
+            def _draw(self):
+                wasp.watch.drawable.render(self._paint)
+
+        :param paint: Function to redraw the display
+        :param y: Y coordinate of the top-most row to be redrawn
+        :param h: Number of rows to redraw, defaults to None (which means
+                  redraw to the bottom of the display)
+        """
+        display = self._display
+        band = self._band
+        if h is None:
+            h = display.height - y
+
+        if not band:
+            display.mute(True)
+            paint()
+            display.mute(False)
+            return
+
+        bgfg = self._bgfg
+        font = self._font
+        self._display = band
+        self._clip = band
+        try:
+            for top in range(y, y + h, band.rows):
+                band.start(top, min(band.rows, y + h - top))
+                self._bgfg = bgfg
+                self._font = font
+                paint()
+                band.flush()
+        finally:
+            self._display = display
+            self._clip = None
+
+    def scroll(self, dy, paint=None):
+        """Scroll the display vertically and redraw the exposed rows.
+
+        The display's hardware scrolling is used to move the existing
+        contents of the display so only the newly exposed rows need to be
+        redrawn. Drawing coordinates are not affected by scrolling: (0, 0)
+        remains the top-left of the visible display.
+
+        Example:
+
+        .. code-block:: python
+
+            (y, h) = draw.scroll(24)
+            draw.fill(0, 0, y, 240, h)
+            draw.string(next_line, 0, y)
+
+        :param dy: Number of rows to scroll by. Positive values move the
+                   contents up (exposing rows at the bottom of the display),
+                   negative values move the contents down.
+        :param paint: Optional function to redraw the exposed rows. If set it
+                      is called via :py:meth:`.render` (or directly, without
+                      muting the display, if no band has been set).
+        :returns: The exposed rows as a tuple of y coordinate and height
+        """
+        display = self._display
+        height = display.height
+        display.scroll((display.scroll_offset + dy) % height)
+
+        h = min(abs(dy), height)
+        y = height - h if dy > 0 else 0
+
+        if paint:
+            if self._band:
+                self.render(paint, y, h)
+            else:
+                paint()
+        return (y, h)
+
     def string(self, s, x, y, width=None, right=False):
         """Draw a string at the supplied position.
 
@@ -306,29 +1793,109 @@ class Draw565(object):
                       centre the text
         """
         display = self._display
-        bgfg = self._bgfg
         font = self._font
-        bg = self._bgfg >> 16
+        bgfg = self._bgfg
+        state = self._glyph_info
+        cap = len(display.linebuffer) // 2
+        nchars = len(s)
+        h = font.height()
+        clip = self._clip
+        if clip and (y >= clip.bottom or y + h <= clip.top):
+            return
 
+        state[0] = 0
+        state[1] = 0
+        self._layout_chunk(s, nchars, cap)
+
+        leftpad = 0
+        rightpad = 0
         if width:
-            (w, h) = _bounding_box(s, font)
+            if state[1] == nchars:
+                w = state[3] - 1 if nchars else 0
+            else:
+                (w, h) = _bounding_box(s, font)
             if right:
                 leftpad = width - w
-                rightpad = 0
             else:
                 leftpad = (width - w) // 2
                 rightpad = width - w - leftpad
-            self.fill(bg, x, y, leftpad, h)
-            x += leftpad
+            if leftpad < 0:
+                x += leftpad
+                leftpad = 0
+            if rightpad < 0:
+                rightpad = 0
 
-        for ch in s:
-            glyph = font.get_ch(ch)
-            _draw_glyph(display, glyph, x, y, bgfg)
-            self.fill(bg, x+glyph[2], y, 1, glyph[1])
-            x += glyph[2] + 1
+        # Pad separately if the text will not fit in a single scanline
+        split = leftpad + state[3] + rightpad > cap or state[1] < nchars
+        if split:
+            if leftpad:
+                self.fill(bgfg >> 16, x, y, leftpad, h)
+                x += leftpad
+                leftpad = 0
 
-        if width:
-            self.fill(bg, x, y, rightpad, h)
+        while True:
+            total = state[3] + leftpad
+            if not split or state[1] == nchars:
+                total += rightpad
+                rightpad = 0
+            total = min(total, display.width - x)
+            if total > 0:
+                self._draw_chunk(x, y, h, leftpad, total)
+            x += total
+            if state[1] >= nchars:
+                break
+            self._layout_chunk(s, nchars, cap)
+
+        if rightpad:
+            self.fill(bgfg >> 16, x, y, rightpad, h)
+
+    def _layout_chunk(self, s, nchars, limit):
+        """Layout the next chunk of a string, see :py:meth:`~.string`"""
+        font = self._font
+        info = self._glyph_info
+        info[4] = nchars
+        info[5] = limit
+        info[6] = font.min_ch()
+        info[7] = font.max_ch()
+        info[8] = 1 if hasattr(font, 'cropped') else 0
+        _layout(s, font._index, font._font, info)
+
+    @micropython.native
+    def _draw_chunk(self, x, y, h, leftpad, total):
+        """Draw a chunk of text using a single window."""
+        display = self._display
+        info = self._glyph_info
+        n = info[2]
+        bgfg = self._bgfg
+        fnt = self._font._font
+        bufs = display.linebuffers
+        write_async = display.write_async
+
+        cache = self._glyphs
+        if cache:
+            pool = cache.prepare(self._font, bgfg, info, n)
+        else:
+            pool = bufs[0]
+
+        r0 = 0
+        r1 = h
+        clip = self._clip
+        if clip:
+            r0 = max(0, clip.top - y)
+            r1 = min(h, clip.bottom - y)
+
+        info[10] = bgfg
+        info[11] = leftpad
+        info[12] = total
+
+        lines = (bufs[0][0:2*total], bufs[1][0:2*total])
+        display.quick_window(x, y + r0, total, r1 - r0)
+        for row in range(r0, r1):
+            buf = bufs[row & 1]
+            info[9] = row
+            _compose(buf, fnt, pool, info)
+            write_async(lines[row & 1])
+        display.quick_end()
 
     def bounding_box(self, s):
         """Return the bounding box of a string.
@@ -358,33 +1925,36 @@ class Draw565(object):
         :returns:     List of chunk boundaries
         """
         font = self._font
+        table = fonts.widths(font)
+        state = self._lstate
+        state[0] = 0
+        state[1] = 0
         max = len(s)
+        state[2] = max
+        state[3] = font.min_ch()
+        state[4] = font.max_ch()
+        state[5] = width
         chunks = [ 0, ]
-        end = 0
-
-        while end < max:
-            start = end
-            l = 0
 
-            for i in range(start, max+1):
-                if i >= len(s):
-                    break
-                ch = s[i]
-                if ch == '\n':
-                    end = i+1
-                    break
-                if ch == ' ':
-                    end = i+1
-                (_, h, w) = font.get_ch(ch)
-                l += w + 1
-                if l > width:
-                    break
-            if end <= start:
-                end = i
-            chunks.append(end)
+        while state[1] < max:
+            _wrap(s, table, state)
+            chunks.append(state[1])
 
         return chunks
 
+    def wrapper(self, s, width, lines=9):
+        """Prepare to wrap a string, one line at a time, using the current font.
+
+        This is a better choice than :py:meth:`.wrap` for long strings
+        that are shown a page at a time. See :py:class:`.Wrapper`.
+
+        :param s:     String to be wrapped
+        :param width: Width to wrap the text into
+        :param lines: Number of lines in each page
+        :returns:     A :py:class:`.Wrapper`
+        """
+        return Wrapper(s, width, self._font, lines)
+
     def line(self, x0, y0, x1, y1, width=1, color=None):
         """Draw a line between points (x0, y0) and (x1, y1).
 
@@ -404,9 +1974,6 @@ class Draw565(object):
         """
         if color is None:
             color = self._bgfg & 0xffff
-        px = bytes(((color >> 8) & 0xFF, color & 0xFF)) * (width * width)
-        write_data = self._display.write_data
-        set_window = self._display.set_window
 
         dw = (width - 1) // 2
         x0 -= dw
@@ -414,32 +1981,79 @@ class Draw565(object):
         x1 -= dw
         y1 -= dw
 
-        dx =  abs(x1 - x0)
-        sx = 1 if x0 < x1 else -1
-        dy = -abs(y1 - y0)
-        sy = 1 if y0 < y1 else -1
-        err = dx + dy
-        if dx == 0 or dy == 0:
-            if x1 < x0 or y1 < y0:
-                x0, x1 = x1, x0
-                y0, y1 = y1, y0
-            w = width if dx == 0 else (dx + width)
-            h = width if dy == 0 else (-dy + width)
-            self.fill(color, x0, y0, w, h)
+        if x0 == x1 or y0 == y1:
+            display = self._display
+            x = max(min(x0, x1), 0)
+            y = max(min(y0, y1), 0)
+            w = min(max(x0, x1) + width, display.width) - x
+            h = min(max(y0, y1) + width, display.height) - y
+            if w > 0 and h > 0:
+                self.fill(color, x, y, w, h)
             return
-        while True:
-            set_window(x0, y0, width, width)
-            write_data(px)
-            if x0 == x1 and y0 == y1:
-                break
-            e2 = 2 * err
-            if e2 >= dy:
-                err += dy
-                x0 += sx
-            if e2 <= dx:
-                err += dx;
-                y0 += sy;
-        
+        clip = self._clip
+        if clip and (min(y0, y1) >= clip.bottom or
+                     max(y0, y1) + width <= clip.top):
+            return
+
+        spans = self._spans
+        n = min(abs(x1 - x0), abs(y1 - y0)) + width
+        if n > _SPAN_MAX:
+            spans = array.array('H', (0,) * (2 * n))
+        x = min(x0, x1)
+        y = min(y0, y1)
+        line = self._line
+        line[0] = x0 - x
+        line[1] = y0 - y
+        line[2] = x1 - x
+        line[3] = y1 - y
+        line[4] = width
+        n = _line_spans(line, spans)
+        self._draw_spans(spans, n, x, y, abs(y1 - y0) > abs(x1 - x0), color)
+
+    @micropython.native
+    def _draw_spans(self, spans, n, x, y, columns, color):
+        """Draw rasterised spans (see _line_spans).
+
+        Spans are clipped to the edges of the display.
+        """
+        display = self._display
+        _fill(display.linebuffer, color, len(display.linebuffer) // 2, 0)
+
+        if columns:
+            (x, y) = (y, x)
+            (length, across) = (display.height, display.width)
+        else:
+            (length, across) = (display.width, display.height)
+
+        for i in range(max(0, 0 - y), min(n, across - y)):
+            lo = max(x + spans[2*i], 0)
+            hi = min(x + spans[2*i+1], length - 1)
+            if lo > hi:
+                continue
+            if columns:
+                self._solid(y + i, lo, 1, hi - lo + 1)
+            else:
+                self._solid(lo, y + i, hi - lo + 1, 1)
+
+    @micropython.native
+    def _solid(self, x, y, w, h):
+        """Draw a rectangle from a linebuffer that has been pre-filled."""
+        clip = self._clip
+        if clip and (y >= clip.bottom or y + h <= clip.top):
+            return
+        display = self._display
+        write_async = display.write_async
+        buf = display.linebuffer
+        sz = len(buf) // 2
+        remaining = w * h
+
+        display.quick_window(x, y, w, h)
+        while remaining > sz:
+            write_async(buf)
+            remaining -= sz
+        write_async(buf[0:2*remaining])
+        display.quick_end()
+
     def polar(self, x, y, theta, r0, r1, width=1, color=None):
         """Draw a line using polar coordinates.
 
@@ -474,6 +2088,152 @@ class Draw565(object):
 
         self.line(x0, y0, x1, y1, width, color)
 
+    def circle(self, x, y, r, color=None, width=None):
+        """Draw a circle.
+
+        Example:
+
+        .. code-block:: python
+
+            draw = wasp.watch.drawable
+            draw.circle(120, 120, 100, 0x07e0, width=8)
+
+        :param x: X coordinate of the centre of the circle
+        :param y: Y coordinate of the centre of the circle
+        :param r: Radius of the circle
+        :param color: Colour of the circle, defaults to the foreground colour
+        :param width: Width of the outline, defaults to None (which means the
+                      circle will be filled)
+        """
+        self.rounded_rect(x - r, y - r, 2*r + 1, 2*r + 1, r, color, width)
+
+    def rounded_rect(self, x, y, w, h, r, color=None, width=None):
+        """Draw a rectangle with rounded corners.
+
+        :param x: X coordinate of the left-most pixels of the rectangle
+        :param y: Y coordinate of the top-most pixels of the rectangle
+        :param w: Width of the rectangle
+        :param h: Height of the rectangle
+        :param r: Radius of the corners
+        :param color: Colour of the rectangle, defaults to the foreground
+                      colour
+        :param width: Width of the outline, defaults to None (which means the
+                      rectangle will be filled)
+        """
+        shape = self._shape
+        self._set_shape(w, h, r, width)
+        shape[10] = 0
+        self._draw_shape(x, y, color)
+
+    def arc(self, x, y, r0, r1, start, end, color=None):
+        """Draw an arc (a segment of a ring).
+
+        The angles use the same coordinate system as :py:meth:`.polar`
+        (zero degrees is vertically upwards and angles are measured
+        clockwise) making it easy to draw gauges and progress rings.
+
+        Example:
+
+        .. code-block:: python
+
+            draw = wasp.watch.drawable
+            draw.arc(120, 120, 90, 100, 0, 360 * steps // goal, 0x07e0)
+
+        :param x: X coordinate of the centre of the ring
+        :param y: Y coordinate of the centre of the ring
+        :param r0: Inner radius of the ring
+        :param r1: Outer radius of the ring
+        :param start: Angle of the start of the arc, in degrees
+        :param end: Angle of the end of the arc, in degrees
+        :param color: Colour of the arc, defaults to the foreground colour
+        """
+        while end < start:
+            end += 360
+        sweep = end - start
+        if sweep == 0:
+            return
+
+        shape = self._shape
+        self._set_shape(2*r1 + 1, 2*r1 + 1, r1, r1 - r0 + 1 if r0 else None)
+        shape[8] = r1
+        shape[9] = r1
+        if sweep >= 360:
+            shape[10] = 0
+        else:
+            shape[10] = 1 if sweep <= 180 else 2
+            to_radians = math.pi / 180
+            shape[11] = int(math.sin(start * to_radians) * 1024)
+            shape[12] = -int(math.cos(start * to_radians) * 1024)
+            shape[13] = int(math.sin(end * to_radians) * 1024)
+            shape[14] = -int(math.cos(end * to_radians) * 1024)
+        self._draw_shape(x - r1, y - r1, color)
+
+    def _set_shape(self, w, h, r, width):
+        """Describe a (possibly hollow) rounded rectangle (see _shape_row)."""
+        shape = self._shape
+        r = min(r, w // 2, h // 2)
+        shape[0] = w
+        shape[1] = h
+        shape[2] = r
+        if width and 2*width < w and 2*width < h:
+            shape[3] = width
+            shape[4] = width
+            shape[5] = w - 2*width
+            shape[6] = h - 2*width
+            shape[7] = max(r - width, 0)
+        else:
+            shape[5] = 0
+
+    @micropython.native
+    def _draw_shape(self, x, y, color):
+        """Draw a shape (see _shape_row).
+
+        Consecutive rows that have identical spans are merged so that
+        each run of spans is drawn using a single window. The shape is
+        clipped to the edges of the display.
+        """
+        if color is None:
+            color = self._bgfg & 0xffff
+        _fill(self._display.linebuffer, color,
+              len(self._display.linebuffer) // 2, 0)
+
+        shape = self._shape
+        spans = self._row_spans
+        run = self._run_spans
+        nrun = 0
+
+        # Only rasterise the rows that fall within the display (and the
+        # band, if any)
+        display = self._display
+        width = display.width
+        r0 = max(0, 0 - y)
+        r1 = min(shape[1], display.height - y)
+        clip = self._clip
+        if clip:
+            r0 = max(r0, clip.top - y)
+            r1 = min(r1, clip.bottom - y)
+        start = r0
+
+        for row in range(r0, r1 + 1):
+            n = -1
+            if row < r1:
+                n = _shape_row(shape, row, spans)
+                if n == nrun:
+                    for i in range(2 * n):
+                        if spans[i] != run[i]:
+                            break
+                    else:
+                        continue
+
+            for i in range(0, 2 * nrun, 2):
+                a = max(x + run[i], 0)
+                b = min(x + run[i+1], width - 1)
+                if a <= b:
+                    self._solid(a, y + start, b - a + 1, row - start)
+            (spans, run) = (run, spans)
+            nrun = n
+            start = row
+
     def lighten(self, color, step=1):
         """Get a lighter shade from the same palette.
 
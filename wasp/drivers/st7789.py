@@ -28,12 +28,33 @@ _DISPON             = const(0x29)
 _CASET              = const(0x2a)
 _RASET              = const(0x2b)
 _RAMWR              = const(0x2c)
+_VSCRDEF            = const(0x33)
 _COLMOD             = const(0x3a)
 _MADCTL             = const(0x36)
+_VSCSAD             = const(0x37)
+
+# Number of rows of frame memory (the panel may show fewer)
+MEMORY_ROWS         = const(320)
 
 class ST7789(object):
     """Sitronix ST7789 display driver
 
+    The driver remembers the most recently programmed window and does not
+    resend the column (CASET) or row (RASET) address if it has not
+    changed.
+
+    .. data:: saved_commands
+
+        Number of CASET and RASET commands that did not need to be sent.
+
+    .. data:: saved_bytes
+
+        Number of bytes (commands and data) that did not need to be sent.
+
+    .. data:: scroll_offset
+
+        Current vertical scroll offset (see :py:meth:`.scroll`).
+
     .. automethod:: __init__
     """
     def __init__(self, width, height):
@@ -46,25 +67,33 @@ class ST7789(object):
         self.height = height
         self.linebuffer = memoryview(bytearray(2 * width))
         self.window = bytearray(4)
+        self.saved_commands = 0
+        self.saved_bytes = 0
         self.init_display()
 
     def init_display(self):
         """Reset and initialize the display."""
         self.reset()
+        self.forget_window()
 
         self.write_cmd(_SLPOUT)
         sleep_ms(10)
 
+        # The scrolling area covers the visible rows of the frame memory
+        h = self.height
+        b = MEMORY_ROWS - h
         for cmd in (
             (_COLMOD,   b'\x05'), # MCU will send 16-bit RGB565
             (_MADCTL,   b'\x00'), # Left to right, top to bottom
             #(_INVOFF,   None), # Results in odd palette
             (_INVON,   None),
             (_NORON,   None),
+            (_VSCRDEF,  bytes((0, 0, h >> 8, h & 0xff, b >> 8, b & 0xff))),
         ):
             self.write_cmd(cmd[0])
             if cmd[1]:
                 self.write_data(cmd[1])
+        self.scroll(0)
         self.fill(0)
         self.write_cmd(_DISPON)
 
@@ -106,6 +135,26 @@ class ST7789(object):
         else:
             self.write_cmd(_DISPON)
 
+    def scroll(self, line):
+        """Scroll the display vertically.
+
+        The row of frame memory at line is shown at the top of the display
+        and the rows above it wrap around to the bottom of the display.
+        Scrolling is done by the display controller so no pixels need to be
+        sent.
+
+        Whilst the display is scrolled the coordinates used to draw are
+        translated, so they remain relative to the top-left of the visible
+        area, and windows that wrap past the bottom of the frame memory are
+        split. Thus drawing code does not need to know whether the display
+        has been scrolled.
+
+        :param int line: Vertical scroll offset, from 0 to height-1
+        """
+        self.scroll_offset = line
+        self.write_cmd(_VSCSAD)
+        self.write_data(bytes((line >> 8, line & 0xff)))
+
     @micropython.native
     def set_window(self, x, y, width, height):
         """Set the clipping rectangle.
@@ -126,22 +175,45 @@ class ST7789(object):
         xp = x + width - 1
         yp = y + height - 1
 
-        write_cmd(_CASET)
-        window[0] = x >> 8
-        window[1] = x & 0xff
-        window[2] = xp >> 8
-        window[3] = xp & 0xff
-        write_data(window)
-
-        write_cmd(_RASET)
-        window[0] = y >> 8
-        window[1] = y & 0xff
-        window[2] = yp >> 8
-        window[3] = yp & 0xff
-        write_data(window)
+        cols = (x << 16) + xp
+        if cols != self._cols:
+            self._cols = cols
+            write_cmd(_CASET)
+            window[0] = x >> 8
+            window[1] = x & 0xff
+            window[2] = xp >> 8
+            window[3] = xp & 0xff
+            write_data(window)
+        else:
+            self.saved_commands += 1
+            self.saved_bytes += 5
+
+        rows = (y << 16) + yp
+        if rows != self._rows:
+            self._rows = rows
+            write_cmd(_RASET)
+            window[0] = y >> 8
+            window[1] = y & 0xff
+            window[2] = yp >> 8
+            window[3] = yp & 0xff
+            write_data(window)
+        else:
+            self.saved_commands += 1
+            self.saved_bytes += 5
 
         write_cmd(_RAMWR)
 
+    def forget_window(self):
+        """Forget the current window.
+
+        This ensures the column and row addresses will be sent by the next
+        call to :py:meth:`.set_window`. It must be called if the display
+        is reset or the addresses are changed without using
+        :py:meth:`.set_window`.
+        """
+        self._cols = -1
+        self._rows = -1
+
     def rawblit(self, buf, x, y, width, height):
         """Blit raw pixels to the display.
 
@@ -194,6 +266,29 @@ class ST7789_SPI(ST7789):
 
         :param bytes-like buf: Data, must be in a form that can be directly
                                consumed by the SPI bus.
+
+    .. method:: write_async(buf)
+
+        Start sending data to the display as part of an optimized write
+        sequence.
+
+        If the SPI controller supports non-blocking (typically DMA) transfers
+        then this returns as soon as the transfer has started, otherwise it
+        behaves exactly like :py:meth:`.quick_write`. Either way, any
+        previous transfer is completed first, so the buffer can be modified
+        once the next call to write_async() returns (or the sequence ends).
+        Buffers are normally taken, alternately, from :py:attr:`.linebuffers`
+        so that the next chunk can be rendered whilst the current chunk is
+        transferred.
+
+        :param bytes-like buf: Data, must be in a form that can be directly
+                               consumed by the SPI bus.
+
+    .. attribute:: linebuffers
+
+        A pair of line buffers to use with :py:meth:`.write_async`. If
+        the SPI controller does not support non-blocking transfers then both
+        are the same buffer (the :py:attr:`.linebuffer`).
     """
     def __init__(self, width, height, spi, cs, dc, res=None, rate=8000000):
         """Configure the display.
@@ -209,11 +304,25 @@ class ST7789_SPI(ST7789):
         :param int rate: SPI bus frequency
         """
         self.quick_write = spi.write
+        self._write = spi.write
         self.cs = cs.value
         self.dc = dc.value
         self.res = res
         self.rate = rate
         self.cmd = bytearray(1)
+        self._split = 0
+        self._wrap = 0
+        self._quick_window = self.quick_window
+
+        # Use non-blocking transfers (and a second line buffer so drawing
+        # can continue during the transfer) if the SPI controller supports
+        # them.
+        if hasattr(spi, 'write_async'):
+            self.write_async = spi.write_async
+            self.wait = spi.wait
+        else:
+            self.write_async = spi.write
+        self._write_async = self.write_async
 
         #spi.init(baudrate=self.rate, polarity=1, phase=1)
         cs.init(cs.OUT, value=1)
@@ -223,6 +332,12 @@ class ST7789_SPI(ST7789):
 
         super().__init__(width, height)
 
+        if hasattr(spi, 'write_async'):
+            self.linebuffers = (self.linebuffer,
+                                memoryview(bytearray(2 * width)))
+        else:
+            self.linebuffers = (self.linebuffer, self.linebuffer)
+
     def reset(self):
         """Reset the display.
 
@@ -248,13 +363,165 @@ class ST7789_SPI(ST7789):
         cs = self.cs
         c = self.cmd
 
+        # A command ends the current window (even if it was not filled)
+        # and must not change D/C whilst pixels are still being sent
+        self.wait()
+        self._split = 0
         dc(0)
         cs(0)
         c[0] = cmd
-        self.quick_write(c)
+        self._write(c)
         cs(1)
         dc(1)
 
+    @micropython.native
+    def set_window(self, x, y, width, height):
+        """Set the clipping rectangle.
+
+        All writes to the display will be wrapped at the edges of the rectangle.
+
+        :param x:  X coordinate of the left-most pixels of the rectangle
+        :param y:  Y coordinate of the top-most pixels of the rectangle
+        :param w:  Width of the rectangle, defaults to None (which means select
+                   the right-most pixel of the display)
+        :param h:  Height of the rectangle, defaults to None (which means select
+                   the bottom-most pixel of the display)
+        """
+        self.quick_window(x, y, width, height)
+        self.cs(1)
+
+    @micropython.native
+    def quick_window(self, x, y, width, height):
+        """Set the clipping rectangle and start an optimized write sequence.
+
+        This is equivalent to :py:meth:`.set_window` followed by
+        :py:meth:`.quick_start` except that the chip select is held low
+        throughout.
+        """
+        dc = self.dc
+        write = self._write
+        window = self.window
+        c = self.cmd
+
+        xp = x + width - 1
+        yp = y + height - 1
+
+        # Finish sending the previous window before changing D/C
+        self.wait()
+        self.cs(0)
+        cols = (x << 16) + xp
+        if cols != self._cols:
+            self._cols = cols
+            dc(0)
+            c[0] = _CASET
+            write(c)
+            dc(1)
+            window[0] = x >> 8
+            window[1] = x & 0xff
+            window[2] = xp >> 8
+            window[3] = xp & 0xff
+            write(window)
+        else:
+            self.saved_commands += 1
+            self.saved_bytes += 5
+
+        rows = (y << 16) + yp
+        if rows != self._rows:
+            self._rows = rows
+            dc(0)
+            c[0] = _RASET
+            write(c)
+            dc(1)
+            window[0] = y >> 8
+            window[1] = y & 0xff
+            window[2] = yp >> 8
+            window[3] = yp & 0xff
+            write(window)
+        else:
+            self.saved_commands += 1
+            self.saved_bytes += 5
+
+        dc(0)
+        c[0] = _RAMWR
+        write(c)
+        dc(1)
+
+    def scroll(self, line):
+        super().scroll(line)
+        if line:
+            self.quick_window = self._scrolled_window
+            self.quick_write = self._scrolled_write
+            self.write_async = self._scrolled_write
+        else:
+            self.quick_window = self._quick_window
+            self.quick_write = self._write
+            self.write_async = self._write_async
+
+    @micropython.native
+    def _scrolled_window(self, x, y, width, height):
+        """Set the clipping rectangle whilst the display is scrolled.
+
+        This is used in place of :py:meth:`.quick_window` whilst the
+        display is scrolled. The window is translated so that it remains
+        relative to the top-left of the visible area and, if it wraps past
+        the bottom of the frame memory, it is split (see
+        :py:meth:`._scrolled_write`).
+        """
+        h = self.height
+        y += self.scroll_offset
+        if y >= h:
+            y -= h
+        if y + height > h:
+            self._split = 2 * width * (h - y)
+            self._wrap = y + height - h - 1
+            height = h - y
+        else:
+            self._split = 0
+        self._quick_window(x, y, width, height)
+
+    @micropython.native
+    def _scrolled_write(self, buf):
+        """Send pixel data to a window that may be split.
+
+        This is used in place of :py:meth:`.quick_write` whilst the display
+        is scrolled. When the data reaches the bottom of the frame memory
+        the window is moved to the top of the frame memory.
+        """
+        write = self._write
+        split = self._split
+        n = len(buf)
+        if not split or n < split:
+            if split:
+                self._split = split - n
+            write(buf)
+            return
+
+        write(buf[0:split])
+        self._split = 0
+
+        dc = self.dc
+        c = self.cmd
+        window = self.window
+        wrap = self._wrap
+        self._rows = wrap
+
+        dc(0)
+        c[0] = _RASET
+        write(c)
+        dc(1)
+        window[0] = 0
+        window[1] = 0
+        window[2] = wrap >> 8
+        window[3] = wrap & 0xff
+        write(window)
+        dc(0)
+        c[0] = _RAMWR
+        write(c)
+        dc(1)
+
+        if n > split:
+            write(buf[split:])
+
     @micropython.native
     def write_data(self, buf):
         """Send data to the display.
@@ -277,4 +544,11 @@ class ST7789_SPI(ST7789):
 
     def quick_end(self):
         """Complete an optimized write sequence."""
+        self.wait()
         self.cs(1)
+        self._split = 0
+
+    def wait(self):
+        """Wait for the transfer started by :py:meth:`.write_async` to
+        complete."""
+        pass
@@ -1,19 +1,93 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 # Copyright (C) 2020 Daniel Thompson
 
+import micropython
+
 import fonts.sans24 as sans24
 import fonts.sans28 as sans28
 import fonts.sans36 as sans36
 
-def height(font):
-    return font.height()
+from micropython import const
 
-def width(font, s):
+# Maximum number of strings in each font's width cache
+_CACHE_MAX = const(16)
+
+_tables = {}
+_cache = {}
+
+@micropython.viper
+def _measure(s, nchars: int, widths, chars: int) -> int:
+    """Sum the advance widths (plus a one pixel gap) of nchars characters.
+
+    The string is consumed as UTF-8 so that no character objects need
+    to be allocated. chars holds the first character in the font in the
+    bottom 16 bits and the last character in the top 16 bits.
+    """
+    sp = ptr8(s)
+    wp = ptr8(widths)
+    lo = chars & 0xffff
+    hi = chars >> 16
+    pos = 0
+    done = 0
     w = 0
-    for ch in s:
-        (_, _, wc) = font.get_ch(ch)
-        w += wc + 1
+
+    while done < nchars:
+        c = int(sp[pos])
+        pos += 1
+        if (c & 0xc0) == 0x80:
+            continue
+        done += 1
+        if c >= lo and c <= hi:
+            w += int(wp[c - lo + 1]) + 1
+        else:
+            w += int(wp[0]) + 1
 
     return w
 
+def widths(font):
+    """Get the width table of a font.
+
+    The width table holds the advance width of the default glyph followed
+    by the advance width of every character from ``font.min_ch()`` to
+    ``font.max_ch()``. Fonts compiled with ``tools/cropfont.py`` include
+    a width table, for other fonts the table is built (once) from the
+    glyphs.
+    """
+    if hasattr(font, '_widths'):
+        return font._widths
 
+    table = _tables.get(font)
+    if not table:
+        lo = font.min_ch()
+        hi = font.max_ch()
+        table = bytearray(hi - lo + 2)
+        table[0] = font.get_ch('\0')[2] if lo else font.get_ch('\uffff')[2]
+        for i in range(lo, hi+1):
+            table[i - lo + 1] = font.get_ch(chr(i))[2]
+        _tables[font] = table
+    return table
+
+def height(font):
+    return font.height()
+
+def width(font, s):
+    """Measure the width of a string.
+
+    The width includes the one pixel gap that follows each character.
+    Strings are measured using the font's width table so no memory is
+    allocated and the most recently measured strings are cached (which
+    makes measuring fixed labels very cheap).
+    """
+    cache = _cache.get(font)
+    if cache is None:
+        cache = {}
+        _cache[font] = cache
+
+    w = cache.get(s, -1)
+    if w < 0:
+        w = _measure(s, len(s), widths(font),
+                     font.min_ch() | (font.max_ch() << 16))
+        if len(cache) >= _CACHE_MAX:
+            cache.clear()
+        cache[s] = w
+    return w
@@ -1,6 +1,7 @@
-# Code generated by font_to_py.py.
+# Code generated by cropfont.py.
 # Font: DejaVuSans.ttf
 # Cmd: tools/micropython-font-to-py/font_to_py.py /usr/share/fonts/dejavu/DejaVuSans.ttf --xmap 24 wasp/fonts/sans24.py
+# Cropped: tools/cropfont.py wasp/fonts/sans24.py -o wasp/fonts/sans24.py
 version = '0.33'
 
 def height():
@@ -27,331 +28,187 @@ def min_ch():
 def max_ch():
     return 126
 
+def cropped():
+    return True
+
 _font =\
-b'\x0c\x00\x00\x00\x0f\x80\x1f\xc0\x30\xe0\x20\x60\x00\x60\x00\x60'\
-b'\x00\xc0\x03\x80\x03\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00'\
-b'\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x00\x00\x00'\
-b'\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00'\
-b'\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00'\
-b'\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00'\
-b'\x00\x00\x33\x00\x33\x00\x33\x00\x33\x00\x33\x00\x33\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x13\x00\x00\x00\x00\x00\xc2\x00\x00\xc6\x00\x00\xc6\x00\x00\xc6'\
-b'\x00\x00\x86\x00\x1f\xff\xc0\x1f\xff\xc0\x01\x8c\x00\x03\x0c\x00'\
-b'\x03\x18\x00\x3f\xff\x80\x3f\xff\x80\x06\x10\x00\x06\x30\x00\x06'\
-b'\x30\x00\x06\x30\x00\x04\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x01\x00\x01\x00'\
-b'\x01\x00\x07\xe0\x1f\xf0\x39\x10\x31\x00\x31\x00\x39\x00\x1f\x00'\
-b'\x0f\xe0\x01\xf0\x01\x38\x01\x18\x01\x18\x21\x38\x3f\xf0\x0f\xc0'\
-b'\x01\x00\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x16\x00\x00\x00'\
-b'\x00\x1e\x03\x00\x33\x07\x00\x61\x86\x00\x61\x8c\x00\x61\x8c\x00'\
-b'\x61\x98\x00\x61\xb8\x00\x33\x30\x00\x1e\x73\xc0\x00\x66\x60\x00'\
-b'\xec\x30\x00\xcc\x30\x01\x8c\x30\x01\x8c\x30\x03\x0c\x30\x07\x06'\
-b'\x60\x06\x03\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x07\xc0\x00\x0f\xe0'\
-b'\x00\x1c\x20\x00\x18\x00\x00\x18\x00\x00\x18\x00\x00\x0c\x00\x00'\
-b'\x1e\x00\x00\x3b\x03\x00\x31\x83\x00\x60\xe6\x00\x60\x76\x00\x60'\
-b'\x3c\x00\x70\x1c\x00\x38\x7e\x00\x1f\xe7\x00\x0f\xc3\x80\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x06\x00\x00\x30\x30\x30\x30\x30\x30\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x00\x00\x00\x06\x00'\
-b'\x0c\x00\x0c\x00\x18\x00\x18\x00\x18\x00\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x18\x00\x18\x00'\
-b'\x18\x00\x0c\x00\x0c\x00\x06\x00\x00\x00\x00\x00\x09\x00\x00\x00'\
-b'\x30\x00\x18\x00\x18\x00\x0c\x00\x0c\x00\x0c\x00\x06\x00\x06\x00'\
-b'\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x0c\x00'\
-b'\x0c\x00\x0c\x00\x18\x00\x18\x00\x30\x00\x00\x00\x00\x00\x0c\x00'\
-b'\x00\x00\x04\x00\x04\x00\x44\x40\x35\x80\x0e\x00\x0e\x00\x35\x80'\
-b'\x44\x40\x04\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x13\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0'\
-b'\x00\x00\xc0\x00\x00\xc0\x00\x00\xc0\x00\x00\xc0\x00\x00\xc0\x00'\
-b'\x3f\xff\x00\x3f\xff\x00\x00\xc0\x00\x00\xc0\x00\x00\xc0\x00\x00'\
-b'\xc0\x00\x00\xc0\x00\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x18\x18\x10\x30'\
-b'\x20\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x7e\x7e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18'\
-b'\x18\x18\x00\x00\x00\x00\x00\x00\x08\x00\x00\x03\x07\x06\x06\x06'\
-b'\x0c\x0c\x0c\x18\x18\x18\x30\x30\x30\x60\x60\x60\xe0\xc0\x00\x00'\
-b'\x00\x00\x0f\x00\x00\x00\x03\xc0\x0f\xf0\x1c\x38\x18\x18\x38\x1c'\
-b'\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x30\x0c\x38\x1c'\
-b'\x18\x18\x1c\x38\x0f\xf0\x03\xc0\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0f\x00\x00\x00\x07\x80\x1f\x80\x19\x80\x01\x80'\
-b'\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80'\
-b'\x01\x80\x01\x80\x01\x80\x1f\xf8\x1f\xf8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x0f\xc0\x3f\xf0\x30\x70'\
-b'\x00\x18\x00\x18\x00\x18\x00\x18\x00\x30\x00\x60\x00\xe0\x01\xc0'\
-b'\x03\x80\x07\x00\x0e\x00\x18\x00\x3f\xf8\x3f\xf8\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x0f\xc0\x1f\xe0'\
-b'\x10\x70\x00\x30\x00\x30\x00\x30\x00\x60\x07\xc0\x07\xe0\x00\x70'\
-b'\x00\x18\x00\x18\x00\x18\x00\x18\x20\x70\x3f\xf0\x1f\xc0\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\xe0'\
-b'\x01\xe0\x03\x60\x03\x60\x06\x60\x0c\x60\x0c\x60\x18\x60\x10\x60'\
-b'\x30\x60\x60\x60\x7f\xf8\x7f\xf8\x00\x60\x00\x60\x00\x60\x00\x60'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00'\
-b'\x1f\xf0\x1f\xf0\x18\x00\x18\x00\x18\x00\x18\x00\x1f\xc0\x1f\xe0'\
-b'\x10\x70\x00\x38\x00\x18\x00\x18\x00\x18\x00\x38\x20\x70\x3f\xe0'\
-b'\x1f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00'\
-b'\x00\x00\x03\xf0\x07\xf8\x0e\x08\x1c\x00\x18\x00\x30\x00\x33\xe0'\
-b'\x37\xf0\x3e\x38\x3c\x1c\x38\x0c\x38\x0c\x38\x0c\x18\x1c\x1e\x38'\
-b'\x0f\xf0\x03\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0f\x00\x00\x00\x3f\xf8\x3f\xf8\x00\x30\x00\x30\x00\x60\x00\x60'\
-b'\x00\xe0\x00\xc0\x00\xc0\x01\x80\x01\x80\x03\x80\x03\x00\x07\x00'\
-b'\x06\x00\x06\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0f\x00\x00\x00\x07\xe0\x1f\xf8\x38\x1c\x30\x0c\x30\x0c'\
-b'\x30\x0c\x18\x18\x0f\xf0\x0f\xf0\x1c\x38\x30\x0c\x30\x0c\x30\x0c'\
-b'\x30\x0c\x1c\x38\x1f\xf8\x07\xe0\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0f\x00\x00\x00\x07\xc0\x0f\xf0\x1c\x78\x38\x38'\
-b'\x30\x1c\x30\x1c\x30\x1c\x30\x3c\x1c\x7c\x0f\xec\x07\xcc\x00\x0c'\
-b'\x00\x18\x00\x38\x10\x70\x1f\xe0\x0f\xc0\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x18\x18'\
-b'\x18\x00\x00\x00\x00\x00\x00\x18\x18\x18\x00\x00\x00\x00\x00\x00'\
-b'\x08\x00\x00\x00\x00\x00\x00\x00\x18\x18\x18\x00\x00\x00\x00\x00'\
-b'\x00\x18\x18\x18\x10\x30\x20\x00\x00\x00\x13\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x0f'\
-b'\x00\x00\x7e\x00\x03\xf0\x00\x0f\xc0\x00\x3e\x00\x00\x3e\x00\x00'\
-b'\x0f\xc0\x00\x03\xf0\x00\x00\x7e\x00\x00\x0f\x00\x00\x01\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x13\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\x00\x3f\xff'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3f\xff\x00\x3f\xff\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x13\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20'\
-b'\x00\x00\x3c\x00\x00\x1f\x80\x00\x03\xf0\x00\x00\x7c\x00\x00\x1f'\
-b'\x00\x00\x1f\x00\x00\x7c\x00\x03\xf0\x00\x1f\x80\x00\x3c\x00\x00'\
-b'\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x0f\x80\x1f\xc0'\
-b'\x30\xe0\x20\x60\x00\x60\x00\x60\x00\xc0\x03\x80\x03\x00\x06\x00'\
-b'\x06\x00\x06\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x17\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x7f\x00\x01\xff\xc0\x07\x81\xe0\x0e\x00\x70\x0c\x00'\
-b'\x38\x18\x79\x98\x18\xff\x8c\x30\xc3\x8c\x31\x81\x8c\x31\x81\x8c'\
-b'\x31\x81\x8c\x31\x81\x98\x31\xc3\xb8\x18\xff\xf0\x18\x79\xc0\x0c'\
-b'\x00\x00\x0e\x00\x40\x07\x81\xc0\x01\xff\x80\x00\x7e\x00\x00\x00'\
-b'\x00\x00\x00\x00\x10\x00\x00\x00\x03\x80\x03\x80\x06\xc0\x06\xc0'\
-b'\x06\xc0\x0c\x60\x0c\x60\x1c\x70\x18\x30\x18\x30\x38\x38\x3f\xf8'\
-b'\x3f\xf8\x60\x0c\x60\x0c\x60\x0c\xc0\x06\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x3f\xe0\x3f\xf0\x30\x38'\
-b'\x30\x18\x30\x18\x30\x18\x30\x30\x3f\xe0\x3f\xf0\x30\x18\x30\x0c'\
-b'\x30\x0c\x30\x0c\x30\x0c\x30\x18\x3f\xf8\x3f\xe0\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x03\xf0\x0f\xfc'\
-b'\x1c\x0e\x38\x02\x30\x00\x60\x00\x60\x00\x60\x00\x60\x00\x60\x00'\
-b'\x60\x00\x60\x00\x30\x00\x38\x02\x1c\x0e\x0f\xfc\x03\xf0\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x3f'\
-b'\xe0\x00\x3f\xf8\x00\x30\x3c\x00\x30\x0e\x00\x30\x06\x00\x30\x03'\
-b'\x00\x30\x03\x00\x30\x03\x00\x30\x03\x00\x30\x03\x00\x30\x03\x00'\
-b'\x30\x03\x00\x30\x06\x00\x30\x0e\x00\x30\x3c\x00\x3f\xf8\x00\x3f'\
-b'\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0f\x00\x00\x00\x3f\xf8\x3f\xf8\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x3f\xf0\x3f\xf0\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x3f\xf8\x3f\xf8\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0d\x00\x00\x00\x3f\xf0\x3f\xf0\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x3f\xe0\x3f\xe0\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x03\xf0\x00'\
-b'\x0f\xfc\x00\x1c\x0e\x00\x38\x02\x00\x30\x00\x00\x60\x00\x00\x60'\
-b'\x00\x00\x60\x00\x00\x60\x3f\x00\x60\x3f\x00\x60\x03\x00\x60\x03'\
-b'\x00\x30\x03\x00\x38\x03\x00\x1e\x07\x00\x0f\xfe\x00\x03\xf8\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x11\x00\x00\x00\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00'\
-b'\x30\x06\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00\x3f\xfe\x00\x3f'\
-b'\xfe\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00\x30\x06'\
-b'\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x30'\
-b'\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30'\
-b'\x00\x00\x00\x00\x00\x00\x08\x00\x00\x18\x18\x18\x18\x18\x18\x18'\
-b'\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x38\xf0\xe0\x00'\
-b'\x0f\x00\x00\x00\x30\x1c\x30\x38\x30\x70\x30\xe0\x31\xc0\x33\x80'\
-b'\x37\x00\x3e\x00\x3e\x00\x37\x00\x33\x80\x31\xc0\x30\xe0\x30\x70'\
-b'\x30\x38\x30\x1c\x30\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0d\x00\x00\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x3f\xf0\x3f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x14\x00\x00\x00\x00\x3c\x07\x80\x3c\x07\x80\x3c'\
-b'\x07\x80\x36\x0d\x80\x36\x0d\x80\x36\x0d\x80\x33\x19\x80\x33\x19'\
-b'\x80\x33\x19\x80\x31\xb1\x80\x31\xb1\x80\x31\xf1\x80\x30\xe1\x80'\
-b'\x30\xe1\x80\x30\x01\x80\x30\x01\x80\x30\x01\x80\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11\x00'\
-b'\x00\x00\x00\x38\x06\x00\x3c\x06\x00\x3c\x06\x00\x36\x06\x00\x36'\
-b'\x06\x00\x33\x06\x00\x33\x86\x00\x31\x86\x00\x31\xc6\x00\x30\xc6'\
-b'\x00\x30\xe6\x00\x30\x66\x00\x30\x36\x00\x30\x36\x00\x30\x1e\x00'\
-b'\x30\x1e\x00\x30\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x03\xf0\x00'\
-b'\x0f\xfc\x00\x1c\x0e\x00\x38\x07\x00\x30\x03\x00\x70\x03\x80\x60'\
-b'\x01\x80\x60\x01\x80\x60\x01\x80\x60\x01\x80\x60\x01\x80\x70\x03'\
-b'\x80\x30\x03\x00\x38\x07\x00\x1c\x0e\x00\x0f\xfc\x00\x03\xf0\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0e\x00\x00\x00\x3f\xc0\x3f\xf0\x30\x30\x30\x18\x30\x18'\
-b'\x30\x18\x30\x18\x30\x30\x3f\xf0\x3f\xc0\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x12\x00\x00\x00\x00\x03\xf0\x00\x0f\xfc\x00\x1c'\
-b'\x0e\x00\x38\x07\x00\x30\x03\x00\x70\x03\x80\x60\x01\x80\x60\x01'\
-b'\x80\x60\x01\x80\x60\x01\x80\x60\x01\x80\x70\x03\x80\x30\x03\x00'\
-b'\x38\x07\x00\x1c\x0e\x00\x0f\xfc\x00\x03\xf8\x00\x00\x1c\x00\x00'\
-b'\x0c\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00'\
-b'\x00\x00\x3f\xc0\x3f\xf0\x30\x38\x30\x18\x30\x18\x30\x18\x30\x18'\
-b'\x30\x30\x3f\xf0\x3f\xe0\x30\x70\x30\x30\x30\x18\x30\x18\x30\x0c'\
-b'\x30\x0c\x30\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0f\x00\x00\x00\x07\xe0\x1f\xf8\x18\x18\x30\x00\x30\x00\x30\x00'\
-b'\x38\x00\x1f\x00\x0f\xf0\x00\xf8\x00\x1c\x00\x0c\x00\x0c\x00\x0c'\
-b'\x30\x18\x3f\xf8\x0f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0e\x00\x00\x00\xff\xfc\xff\xfc\x03\x00\x03\x00\x03\x00'\
-b'\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00'\
-b'\x03\x00\x03\x00\x03\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x11\x00\x00\x00\x00\x30\x06\x00\x30\x06\x00\x30'\
-b'\x06\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00\x30\x06'\
-b'\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00\x30\x06\x00'\
-b'\x18\x0c\x00\x1c\x1c\x00\x0f\xf8\x00\x07\xf0\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00'\
-b'\x00\x00\xc0\x06\x60\x0c\x60\x0c\x60\x0c\x30\x18\x30\x18\x38\x38'\
-b'\x18\x30\x18\x30\x1c\x70\x0c\x60\x0c\x60\x06\xc0\x06\xc0\x06\xc0'\
-b'\x03\x80\x03\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x17\x00\x00\x00\x00\x60\x38\x0c\x60\x38\x0c\x30\x6c\x18\x30\x6c'\
-b'\x18\x30\x6c\x18\x30\x6c\x18\x18\xc6\x30\x18\xc6\x30\x18\xc6\x30'\
-b'\x18\xc6\x30\x0d\xc7\x60\x0d\x83\x60\x0d\x83\x60\x0d\x83\x60\x07'\
-b'\x83\xc0\x07\x01\xc0\x07\x01\xc0\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x38\x0e'\
-b'\x18\x0c\x0c\x18\x0e\x38\x06\x30\x07\x60\x03\xe0\x01\xc0\x01\xc0'\
-b'\x03\xc0\x07\x60\x06\x70\x0c\x30\x1c\x38\x18\x18\x30\x0c\x70\x0e'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00'\
-b'\xe0\x1c\x60\x18\x30\x30\x38\x70\x18\x60\x0c\xc0\x0f\xc0\x07\x80'\
-b'\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00'\
-b'\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00'\
-b'\x00\x00\x7f\xfe\x7f\xfe\x00\x0c\x00\x1c\x00\x38\x00\x70\x00\xe0'\
-b'\x00\xc0\x01\x80\x03\x00\x07\x00\x0e\x00\x1c\x00\x38\x00\x30\x00'\
-b'\x7f\xfe\x7f\xfe\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x09\x00\x00\x00\x3e\x00\x3e\x00\x30\x00\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x3e\x00\x3e\x00\x00\x00'\
-b'\x00\x00\x08\x00\x00\xc0\xe0\x60\x60\x60\x30\x30\x30\x18\x18\x18'\
-b'\x0c\x0c\x0c\x06\x06\x06\x07\x03\x00\x00\x00\x00\x09\x00\x00\x00'\
-b'\x3e\x00\x3e\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00'\
-b'\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00'\
-b'\x06\x00\x06\x00\x06\x00\x3e\x00\x3e\x00\x00\x00\x00\x00\x13\x00'\
-b'\x00\x00\x00\x01\xe0\x00\x03\xf0\x00\x07\x38\x00\x0e\x1c\x00\x1c'\
-b'\x0e\x00\x38\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf0'\
-b'\xff\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x30\x00\x18\x00'\
-b'\x0c\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x80\x3f\xe0\x20\x60\x00\x30'\
-b'\x00\x30\x0f\xf0\x3f\xf0\x70\x30\x60\x30\x60\x70\x70\xf0\x3f\xf0'\
-b'\x1f\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00'\
-b'\x00\x00\x30\x00\x30\x00\x30\x00\x30\x00\x33\xc0\x3f\xe0\x3c\x70'\
-b'\x38\x38\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x38\x38\x3c\x70'\
-b'\x3f\xe0\x33\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xc0\x1f\xe0'\
-b'\x38\x20\x30\x00\x60\x00\x60\x00\x60\x00\x60\x00\x60\x00\x30\x00'\
-b'\x38\x20\x1f\xe0\x07\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0f\x00\x00\x00\x00\x30\x00\x30\x00\x30\x00\x30\x0f\x30'\
-b'\x1f\xf0\x38\xf0\x70\x70\x60\x30\x60\x30\x60\x30\x60\x30\x60\x30'\
-b'\x70\x70\x38\xf0\x1f\xf0\x0f\x30\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x07\xc0\x1f\xe0\x38\x30\x30\x18\x60\x18\x7f\xf8\x7f\xf8\x60\x00'\
-b'\x60\x00\x30\x00\x38\x08\x1f\xf8\x07\xf0\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x09\x00\x00\x00\x0f\x80\x1f\x80\x18\x00'\
-b'\x18\x00\x7f\x00\x7f\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00'\
-b'\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0f\x30\x1f\xf0\x38\xf0\x70\x70\x60\x30\x60\x30'\
-b'\x60\x30\x60\x30\x60\x30\x70\x70\x38\xf0\x1f\xf0\x0f\x30\x00\x30'\
-b'\x00\x70\x10\xe0\x1f\xe0\x0f\x80\x00\x00\x0f\x00\x00\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x33\xe0\x3f\xf0\x3c\x38\x38\x18\x30\x18'\
-b'\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\x30'\
-b'\x30\x30\x00\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30'\
-b'\x00\x00\x00\x00\x00\x00\x07\x00\x00\x18\x18\x18\x00\x18\x18\x18'\
-b'\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\xf0\xe0\x00'\
-b'\x0d\x00\x00\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x70\x30\xe0'\
-b'\x31\xc0\x33\x80\x37\x00\x3e\x00\x3e\x00\x37\x00\x33\x80\x31\xc0'\
-b'\x30\xe0\x30\x70\x30\x38\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x06\x00\x00\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30'\
-b'\x30\x30\x30\x30\x30\x30\x00\x00\x00\x00\x00\x00\x16\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x33\xc3\xc0'\
-b'\x3f\xef\xe0\x3c\x7c\x70\x38\x38\x30\x30\x30\x30\x30\x30\x30\x30'\
-b'\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30'\
-b'\x30\x30\x30\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x33\xe0\x3f\xf0\x3c\x38\x38\x18\x30\x18\x30\x18\x30\x18'\
-b'\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0f\xc0\x1f\xe0\x38\x70\x30\x30\x60\x18\x60\x18'\
-b'\x60\x18\x60\x18\x60\x18\x30\x30\x38\x70\x1f\xe0\x0f\xc0\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x33\xc0\x3f\xe0\x3c\x70\x38\x38\x30\x18'\
-b'\x30\x18\x30\x18\x30\x18\x30\x18\x38\x38\x3c\x70\x3f\xe0\x33\xc0'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x00\x00\x0e\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x30\x1f\xf0\x38\xf0\x70\x70'\
-b'\x60\x30\x60\x30\x60\x30\x60\x30\x60\x30\x70\x70\x38\xf0\x1f\xf0'\
-b'\x0f\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x00\x09\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x33\x80\x3f\x80\x3c\x00'\
-b'\x38\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x80\x3f\xc0'\
-b'\x70\x40\x60\x00\x60\x00\x7e\x00\x1f\xc0\x03\xe0\x00\x60\x00\x60'\
-b'\x40\xe0\x7f\xc0\x3f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x09\x00\x00\x00\x30\x00\x30\x00\x30\x00\x30\x00\xff\x00'\
-b'\xff\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x3f\x00\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18\x30\x18'\
-b'\x30\x18\x30\x38\x38\x78\x1f\xf8\x0f\x98\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x60\x18\x30\x30\x30\x30\x30\x30\x18\x60\x18\x60\x18\x60'\
-b'\x0c\xc0\x0c\xc0\x0f\xc0\x07\x80\x07\x80\x07\x80\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x13\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x60\xe0\xc0\x60\xe0\xc0\x31'\
-b'\xb1\x80\x31\xb1\x80\x31\xb1\x80\x31\xb1\x80\x1b\x1b\x00\x1b\x1b'\
-b'\x00\x1b\x1b\x00\x1b\x1b\x00\x0e\x0e\x00\x0e\x0e\x00\x0e\x0e\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x70\x38'\
-b'\x38\x70\x18\x60\x0c\xc0\x0f\xc0\x07\x80\x07\x00\x07\x80\x0d\xc0'\
-b'\x1c\xe0\x18\x60\x30\x70\x70\x38\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x60\x18\x30\x30\x30\x30\x30\x70\x18\x60\x18\x60\x0c\xc0\x0c\xc0'\
-b'\x0c\xc0\x07\x80\x07\x80\x07\x80\x03\x00\x03\x00\x06\x00\x06\x00'\
-b'\x3c\x00\x3c\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x7f\xe0\x7f\xe0\x00\xe0\x01\xc0\x03\x80\x03\x00\x06\x00'\
-b'\x0e\x00\x1c\x00\x38\x00\x70\x00\x7f\xe0\x7f\xe0\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\x01\xe0\x03\xe0'\
-b'\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x07\x00\x3e\x00'\
-b'\x3e\x00\x07\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00'\
-b'\x03\x00\x03\xe0\x01\xe0\x00\x00\x00\x00\x08\x00\x00\x18\x18\x18'\
-b'\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18'\
-b'\x18\x18\x18\x18\x0f\x00\x00\x00\x1e\x00\x1f\x00\x03\x00\x03\x00'\
-b'\x03\x00\x03\x00\x03\x00\x03\x00\x03\x80\x01\xf0\x01\xf0\x03\x80'\
-b'\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x1f\x00'\
-b'\x1e\x00\x00\x00\x00\x00\x13\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x0f\x01\x00\x1f\xc3\x00\x30\xfe\x00\x00\x3c\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x0c\x02\x09\x01\x11\x3e\x3f\xb0\xf0\x30\x18\x0c\x0c\x1c\x0c\x0c'\
+b'\x06\x03\x00\x00\x00\x60\x30\x18\x00\x07\x00\x00\x00\x00\x09\x03'\
+b'\x02\x01\x11\xff\xff\xfc\x0f\xc0\x0b\x02\x06\x01\x06\xcf\x3c\xf3'\
+b'\xcf\x30\x13\x02\x10\x01\x11\x03\x08\x03\x18\x03\x18\x03\x18\x02'\
+b'\x18\x7f\xff\x7f\xff\x06\x30\x0c\x30\x0c\x60\xff\xfe\xff\xfe\x18'\
+b'\x40\x18\xc0\x18\xc0\x18\xc0\x10\xc0\x0f\x02\x0b\x00\x15\x04\x00'\
+b'\x80\x10\x0f\xc7\xfd\xc8\xb1\x06\x20\xe4\x0f\x80\xfe\x03\xe0\x4e'\
+b'\x08\xc1\x1c\x27\xff\xc7\xe0\x10\x02\x00\x40\x16\x01\x13\x01\x11'\
+b'\x3c\x06\x0c\xc1\xc3\x0c\x30\x61\x8c\x0c\x31\x81\x86\x60\x30\xdc'\
+b'\x03\x33\x00\x3c\xe7\x80\x19\x98\x07\x61\x80\xcc\x30\x31\x86\x06'\
+b'\x30\xc1\x86\x18\x70\x66\x0c\x07\x80\x12\x01\x10\x01\x11\x0f\x80'\
+b'\x1f\xc0\x38\x40\x30\x00\x30\x00\x30\x00\x18\x00\x3c\x00\x76\x06'\
+b'\x63\x06\xc1\xcc\xc0\xec\xc0\x78\xe0\x38\x70\xfc\x3f\xce\x1f\x87'\
+b'\x06\x02\x02\x01\x06\xff\xf0\x09\x02\x05\x01\x15\x19\x8c\xc6\x33'\
+b'\x18\xc6\x31\x8c\x63\x0c\x63\x0c\x61\x80\x09\x02\x05\x01\x15\xc3'\
+b'\x18\x63\x18\x63\x18\xc6\x31\x8c\x66\x31\x98\xcc\x00\x0c\x01\x09'\
+b'\x01\x0a\x08\x04\x22\x2d\x61\xc0\xe1\xad\x11\x08\x04\x00\x13\x02'\
+b'\x0e\x04\x0e\x03\x00\x0c\x00\x30\x00\xc0\x03\x00\x0c\x0f\xff\xff'\
+b'\xff\x03\x00\x0c\x00\x30\x00\xc0\x03\x00\x0c\x00\x07\x02\x03\x0f'\
+b'\x06\x6d\xad\x00\x08\x01\x06\x0b\x02\xff\xf0\x07\x03\x02\x0f\x03'\
+b'\xfc\x08\x00\x08\x01\x13\x03\x07\x06\x06\x06\x0c\x0c\x0c\x18\x18'\
+b'\x18\x30\x30\x30\x60\x60\x60\xe0\xc0\x0f\x02\x0c\x01\x11\x0f\x03'\
+b'\xfc\x70\xe6\x06\xe0\x7c\x03\xc0\x3c\x03\xc0\x3c\x03\xc0\x3c\x03'\
+b'\xe0\x76\x06\x70\xe3\xfc\x0f\x00\x0f\x03\x0a\x01\x11\x3c\x3f\x0c'\
+b'\xc0\x30\x0c\x03\x00\xc0\x30\x0c\x03\x00\xc0\x30\x0c\x03\x00\xc3'\
+b'\xff\xff\xc0\x0f\x02\x0b\x01\x11\x3f\x1f\xfb\x07\x00\x30\x06\x00'\
+b'\xc0\x18\x06\x01\x80\x70\x1c\x07\x01\xc0\x70\x18\x07\xff\xff\xe0'\
+b'\x0f\x02\x0b\x01\x11\x3f\x0f\xf1\x07\x00\x60\x0c\x01\x80\x60\xf8'\
+b'\x1f\x80\x38\x01\x80\x30\x06\x00\xe0\x77\xfe\x7f\x00\x0f\x01\x0c'\
+b'\x01\x11\x01\xc0\x3c\x06\xc0\x6c\x0c\xc1\x8c\x18\xc3\x0c\x20\xc6'\
+b'\x0c\xc0\xcf\xff\xff\xf0\x0c\x00\xc0\x0c\x00\xc0\x0f\x02\x0b\x01'\
+b'\x11\x7f\xcf\xf9\x80\x30\x06\x00\xc0\x1f\xc3\xfc\x41\xc0\x1c\x01'\
+b'\x80\x30\x06\x01\xe0\x77\xfc\x7f\x00\x0f\x02\x0c\x01\x11\x0f\xc1'\
+b'\xfe\x38\x27\x00\x60\x0c\x00\xcf\x8d\xfc\xf8\xef\x07\xe0\x3e\x03'\
+b'\xe0\x36\x07\x78\xe3\xfc\x0f\x80\x0f\x02\x0b\x01\x11\xff\xff\xfc'\
+b'\x03\x00\x60\x18\x03\x00\xe0\x18\x03\x00\xc0\x18\x07\x00\xc0\x38'\
+b'\x06\x00\xc0\x30\x00\x0f\x02\x0c\x01\x11\x1f\x87\xfe\xe0\x7c\x03'\
+b'\xc0\x3c\x03\x60\x63\xfc\x3f\xc7\x0e\xc0\x3c\x03\xc0\x3c\x03\x70'\
+b'\xe7\xfe\x1f\x80\x0f\x02\x0c\x01\x11\x1f\x03\xfc\x71\xee\x0e\xc0'\
+b'\x7c\x07\xc0\x7c\x0f\x71\xf3\xfb\x1f\x30\x03\x00\x60\x0e\x41\xc7'\
+b'\xf8\x3f\x00\x08\x03\x02\x06\x0c\xfc\x00\x3f\x08\x02\x03\x06\x0f'\
+b'\x6d\x80\x00\x0d\xb5\xa0\x13\x02\x0e\x05\x0c\x00\x04\x00\xf0\x1f'\
+b'\x83\xf0\x3f\x03\xe0\x0f\x80\x0f\xc0\x0f\xc0\x07\xe0\x03\xc0\x01'\
+b'\x13\x02\x0e\x07\x07\xff\xff\xff\xf0\x00\x00\x00\x00\x03\xff\xff'\
+b'\xff\xc0\x13\x02\x0e\x05\x0c\x80\x03\xc0\x07\xe0\x03\xf0\x01\xf0'\
+b'\x01\xf0\x07\xc0\x7c\x0f\xc1\xf8\x0f\x00\x20\x00\x17\x02\x14\x02'\
+b'\x14\x01\xfc\x00\x7f\xf0\x1e\x07\x83\x80\x1c\x30\x00\xe6\x1e\x66'\
+b'\x63\xfe\x3c\x30\xe3\xc6\x06\x3c\x60\x63\xc6\x06\x3c\x60\x66\xc7'\
+b'\x0e\xe6\x3f\xfc\x61\xe7\x03\x00\x00\x38\x01\x01\xe0\x70\x07\xfe'\
+b'\x00\x1f\x80\x10\x00\x0f\x01\x11\x03\x80\x07\x00\x1b\x00\x36\x00'\
+b'\x6c\x01\x8c\x03\x18\x0e\x38\x18\x30\x30\x60\xe0\xe1\xff\xc3\xff'\
+b'\x8c\x01\x98\x03\x30\x06\xc0\x06\x10\x02\x0c\x01\x11\xff\x8f\xfc'\
+b'\xc0\xec\x06\xc0\x6c\x06\xc0\xcf\xf8\xff\xcc\x06\xc0\x3c\x03\xc0'\
+b'\x3c\x03\xc0\x6f\xfe\xff\x80\x10\x01\x0e\x01\x11\x07\xe0\x7f\xe3'\
+b'\x81\xdc\x01\x60\x03\x00\x0c\x00\x30\x00\xc0\x03\x00\x0c\x00\x30'\
+b'\x00\x60\x01\xc0\x13\x81\xc7\xfe\x07\xe0\x12\x02\x0e\x01\x11\xff'\
+b'\x83\xff\x8c\x0f\x30\x0e\xc0\x1b\x00\x3c\x00\xf0\x03\xc0\x0f\x00'\
+b'\x3c\x00\xf0\x03\xc0\x1b\x00\xec\x0f\x3f\xf8\xff\x80\x0f\x02\x0b'\
+b'\x01\x11\xff\xff\xff\x00\x60\x0c\x01\x80\x30\x07\xfe\xff\xd8\x03'\
+b'\x00\x60\x0c\x01\x80\x30\x07\xff\xff\xe0\x0d\x02\x0a\x01\x11\xff'\
+b'\xff\xfc\x03\x00\xc0\x30\x0c\x03\xfe\xff\xb0\x0c\x03\x00\xc0\x30'\
+b'\x0c\x03\x00\xc0\x00\x12\x01\x0f\x01\x11\x07\xe0\x3f\xf0\xe0\x73'\
+b'\x80\x26\x00\x18\x00\x30\x00\x60\x00\xc0\x7f\x80\xff\x00\x1e\x00'\
+b'\x36\x00\x6e\x00\xcf\x03\x8f\xfe\x07\xf0\x11\x02\x0d\x01\x11\xc0'\
+b'\x1e\x00\xf0\x07\x80\x3c\x01\xe0\x0f\x00\x7f\xff\xff\xfe\x00\xf0'\
+b'\x07\x80\x3c\x01\xe0\x0f\x00\x78\x03\xc0\x18\x07\x02\x02\x01\x11'\
+b'\xff\xff\xff\xff\xc0\x08\x00\x05\x01\x16\x18\xc6\x31\x8c\x63\x18'\
+b'\xc6\x31\x8c\x63\x18\xc6\x7f\x70\x0f\x02\x0d\x01\x11\xc0\x76\x07'\
+b'\x30\x71\x87\x0c\x70\x67\x03\x70\x1f\x00\xf8\x06\xe0\x33\x81\x8e'\
+b'\x0c\x38\x60\xe3\x03\x98\x0e\xc0\x38\x0d\x02\x0a\x01\x11\xc0\x30'\
+b'\x0c\x03\x00\xc0\x30\x0c\x03\x00\xc0\x30\x0c\x03\x00\xc0\x30\x0c'\
+b'\x03\xff\xff\xc0\x14\x02\x0f\x01\x11\xf0\x1f\xe0\x3f\xc0\x7e\xc1'\
+b'\xbd\x83\x7b\x06\xf3\x19\xe6\x33\xcc\x67\x8d\x8f\x1b\x1e\x3e\x3c'\
+b'\x38\x78\x70\xf0\x01\xe0\x03\xc0\x06\x11\x02\x0d\x01\x11\xe0\x1f'\
+b'\x80\xfc\x07\xb0\x3d\x81\xe6\x0f\x38\x78\xc3\xc7\x1e\x18\xf0\xe7'\
+b'\x83\x3c\x0d\xe0\x6f\x01\xf8\x0f\xc0\x38\x12\x01\x10\x01\x11\x07'\
+b'\xe0\x1f\xf8\x38\x1c\x70\x0e\x60\x06\xe0\x07\xc0\x03\xc0\x03\xc0'\
+b'\x03\xc0\x03\xc0\x03\xe0\x07\x60\x06\x70\x0e\x38\x1c\x1f\xf8\x07'\
+b'\xe0\x0e\x02\x0b\x01\x11\xff\x1f\xfb\x03\x60\x3c\x07\x80\xf0\x1e'\
+b'\x06\xff\xdf\xe3\x00\x60\x0c\x01\x80\x30\x06\x00\xc0\x00\x12\x01'\
+b'\x10\x01\x14\x07\xe0\x1f\xf8\x38\x1c\x70\x0e\x60\x06\xe0\x07\xc0'\
+b'\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xe0\x07\x60\x06\x70\x0e\x38'\
+b'\x1c\x1f\xf8\x07\xf0\x00\x38\x00\x18\x00\x0c\x10\x02\x0d\x01\x11'\
+b'\xff\x07\xfe\x30\x39\x80\xcc\x06\x60\x33\x01\x98\x18\xff\xc7\xfc'\
+b'\x30\x71\x81\x8c\x06\x60\x33\x00\xd8\x06\xc0\x18\x0f\x02\x0c\x01'\
+b'\x11\x1f\x87\xfe\x60\x6c\x00\xc0\x0c\x00\xe0\x07\xc0\x3f\xc0\x3e'\
+b'\x00\x70\x03\x00\x30\x03\xc0\x6f\xfe\x3f\x80\x0e\x00\x0e\x01\x11'\
+b'\xff\xff\xff\xf0\x30\x00\xc0\x03\x00\x0c\x00\x30\x00\xc0\x03\x00'\
+b'\x0c\x00\x30\x00\xc0\x03\x00\x0c\x00\x30\x00\xc0\x03\x00\x11\x02'\
+b'\x0d\x01\x11\xc0\x1e\x00\xf0\x07\x80\x3c\x01\xe0\x0f\x00\x78\x03'\
+b'\xc0\x1e\x00\xf0\x07\x80\x3c\x01\xb0\x19\xc1\xc7\xfc\x1f\xc0\x10'\
+b'\x00\x0f\x01\x11\xc0\x06\xc0\x19\x80\x33\x00\x63\x01\x86\x03\x0e'\
+b'\x0e\x0c\x18\x18\x30\x38\xe0\x31\x80\x63\x00\x6c\x00\xd8\x01\xb0'\
+b'\x01\xc0\x03\x80\x17\x01\x15\x01\x11\xc0\x70\x1e\x03\x80\xd8\x36'\
+b'\x0c\xc1\xb0\x66\x0d\x83\x30\x6c\x18\xc6\x31\x86\x31\x8c\x31\x8c'\
+b'\x61\x8c\x63\x06\xe3\xb0\x36\x0d\x81\xb0\x6c\x0d\x83\x60\x3c\x1e'\
+b'\x01\xc0\x70\x0e\x03\x80\x10\x01\x0e\x01\x11\x70\x1c\xc0\x61\x83'\
+b'\x07\x1c\x0c\x60\x3b\x00\x7c\x00\xe0\x03\x80\x1e\x00\xec\x03\x38'\
+b'\x18\x60\xe1\xc3\x03\x18\x06\xe0\x1c\x0e\x00\x0e\x01\x11\xe0\x1d'\
+b'\x80\x63\x03\x0e\x1c\x18\x60\x33\x00\xfc\x01\xe0\x03\x00\x0c\x00'\
+b'\x30\x00\xc0\x03\x00\x0c\x00\x30\x00\xc0\x03\x00\x10\x01\x0e\x01'\
+b'\x11\xff\xff\xff\xf0\x01\x80\x0e\x00\x70\x03\x80\x1c\x00\x60\x03'\
+b'\x00\x18\x00\xe0\x07\x00\x38\x01\xc0\x06\x00\x3f\xff\xff\xfc\x09'\
+b'\x02\x05\x01\x15\xff\xf1\x8c\x63\x18\xc6\x31\x8c\x63\x18\xc6\x31'\
+b'\xff\x80\x08\x00\x08\x01\x13\xc0\xe0\x60\x60\x60\x30\x30\x30\x18'\
+b'\x18\x18\x0c\x0c\x0c\x06\x06\x06\x07\x03\x09\x02\x05\x01\x15\xff'\
+b'\xc6\x31\x8c\x63\x18\xc6\x31\x8c\x63\x18\xc7\xff\x80\x13\x02\x0e'\
+b'\x01\x06\x07\x80\x3f\x01\xce\x0e\x1c\x70\x3b\x80\x70\x0c\x00\x0c'\
+b'\x12\x02\xff\xff\xff\x0c\x02\x05\x00\x04\xc3\x0c\x30\x0e\x01\x0b'\
+b'\x05\x0d\x3f\x0f\xf9\x03\x00\x30\x06\x3f\xdf\xff\x03\xc0\x78\x1f'\
+b'\x87\xbf\xf3\xe6\x0f\x02\x0b\x01\x11\xc0\x18\x03\x00\x60\x0c\xf1'\
+b'\xff\x3c\x77\x07\xc0\x78\x0f\x01\xe0\x3c\x07\xc1\xfc\x77\xfc\xcf'\
+b'\x00\x0d\x01\x0a\x05\x0d\x0f\x8f\xf7\x05\x80\xc0\x30\x0c\x03\x00'\
+b'\xc0\x18\x07\x04\xff\x0f\x80\x0f\x01\x0b\x01\x11\x00\x60\x0c\x01'\
+b'\x80\x31\xe6\x7f\xdc\x7f\x07\xc0\x78\x0f\x01\xe0\x3c\x07\xc1\xdc'\
+b'\x79\xff\x1e\x60\x0e\x01\x0c\x05\x0d\x0f\x83\xfc\x70\x66\x03\xc0'\
+b'\x3f\xff\xff\xfc\x00\xc0\x06\x00\x70\x13\xff\x0f\xe0\x09\x01\x08'\
+b'\x01\x11\x1f\x3f\x30\x30\xfe\xfe\x30\x30\x30\x30\x30\x30\x30\x30'\
+b'\x30\x30\x30\x0f\x01\x0b\x05\x12\x1e\x67\xfd\xc7\xf0\x7c\x07\x80'\
+b'\xf0\x1e\x03\xc0\x7c\x1d\xc7\x9f\xf1\xe6\x00\xc0\x39\x0e\x3f\xc3'\
+b'\xe0\x0f\x02\x0b\x01\x11\xc0\x18\x03\x00\x60\x0c\xf9\xff\xbc\x3f'\
+b'\x03\xc0\x78\x0f\x01\xe0\x3c\x07\x80\xf0\x1e\x03\xc0\x60\x06\x02'\
+b'\x02\x01\x11\xfc\xff\xff\xff\xc0\x07\x00\x05\x01\x16\x18\xc6\x01'\
+b'\x8c\x63\x18\xc6\x31\x8c\x63\x18\xc6\x3f\x70\x0d\x02\x0b\x01\x11'\
+b'\xc0\x18\x03\x00\x60\x0c\x1d\x87\x31\xc6\x70\xdc\x1f\x03\xe0\x6e'\
+b'\x0c\xe1\x8e\x30\xe6\x0e\xc0\xe0\x06\x02\x02\x01\x11\xff\xff\xff'\
+b'\xff\xc0\x16\x02\x12\x05\x0d\xcf\x0f\x3f\xef\xef\x1f\x1f\x83\x83'\
+b'\xc0\xc0\xf0\x30\x3c\x0c\x0f\x03\x03\xc0\xc0\xf0\x30\x3c\x0c\x0f'\
+b'\x03\x03\xc0\xc0\xc0\x0f\x02\x0b\x05\x0d\xcf\x9f\xfb\xc3\xf0\x3c'\
+b'\x07\x80\xf0\x1e\x03\xc0\x78\x0f\x01\xe0\x3c\x06\x0e\x01\x0c\x05'\
+b'\x0d\x1f\x83\xfc\x70\xe6\x06\xc0\x3c\x03\xc0\x3c\x03\xc0\x36\x06'\
+b'\x70\xe3\xfc\x1f\x80\x0e\x02\x0b\x05\x12\xcf\x1f\xf3\xc7\x70\x7c'\
+b'\x07\x80\xf0\x1e\x03\xc0\x7c\x1f\xc7\x7f\xcc\xf1\x80\x30\x06\x00'\
+b'\xc0\x18\x00\x0e\x01\x0b\x05\x12\x1e\x67\xfd\xc7\xf0\x7c\x07\x80'\
+b'\xf0\x1e\x03\xc0\x7c\x1d\xc7\x9f\xf1\xe6\x00\xc0\x18\x03\x00\x60'\
+b'\x0c\x09\x02\x07\x05\x0d\xcf\xff\xc7\x0c\x18\x30\x60\xc1\x83\x06'\
+b'\x0c\x00\x0c\x01\x0a\x05\x0d\x3f\x1f\xee\x0b\x00\xc0\x3f\x03\xf8'\
+b'\x1f\x00\xc0\x38\x1f\xfe\x7f\x00\x09\x00\x08\x01\x11\x30\x30\x30'\
+b'\x30\xff\xff\x30\x30\x30\x30\x30\x30\x30\x30\x30\x3f\x1f\x0f\x02'\
+b'\x0b\x05\x0d\xc0\x78\x0f\x01\xe0\x3c\x07\x80\xf0\x1e\x03\xc0\x78'\
+b'\x1f\x87\xbf\xf3\xe6\x0e\x01\x0c\x05\x0d\xc0\x36\x06\x60\x66\x06'\
+b'\x30\xc3\x0c\x30\xc1\x98\x19\x81\xf8\x0f\x00\xf0\x0f\x00\x13\x01'\
+b'\x11\x05\x0d\xc1\xc1\xe0\xe0\xd8\xd8\xcc\x6c\x66\x36\x33\x1b\x18'\
+b'\xd8\xd8\x6c\x6c\x36\x36\x1b\x1b\x07\x07\x03\x83\x81\xc1\xc0\x0e'\
+b'\x01\x0c\x05\x0d\xe0\x77\x0e\x30\xc1\x98\x1f\x80\xf0\x0e\x00\xf0'\
+b'\x1b\x83\x9c\x30\xc6\x0e\xe0\x70\x0e\x01\x0c\x05\x12\xc0\x36\x06'\
+b'\x60\x66\x0e\x30\xc3\x0c\x19\x81\x98\x19\x80\xf0\x0f\x00\xf0\x06'\
+b'\x00\x60\x0c\x00\xc0\x78\x07\x80\x0c\x01\x0a\x05\x0d\xff\xff\xf0'\
+b'\x1c\x0e\x07\x01\x80\xc0\x70\x38\x1c\x0e\x03\xff\xff\xc0\x0f\x02'\
+b'\x09\x01\x15\x07\x87\xc3\x01\x80\xc0\x60\x30\x18\x1c\x7c\x3e\x03'\
+b'\x80\xc0\x60\x30\x18\x0c\x06\x03\x01\xf0\x78\x08\x03\x02\x01\x17'\
+b'\xff\xff\xff\xff\xff\xfc\x0f\x03\x09\x01\x15\xf0\x7c\x06\x03\x01'\
+b'\x80\xc0\x60\x30\x1c\x07\xc3\xe3\x81\x80\xc0\x60\x30\x18\x0c\x06'\
+b'\x1f\x0f\x00\x13\x02\x0e\x09\x04\x3c\x05\xfc\x3c\x3f\x80\x3c'
 
 _index =\
-b'\x00\x00\x32\x00\x4c\x00\x7e\x00\xb0\x00\xfa\x00\x2c\x01\x76\x01'\
-b'\xc0\x01\xda\x01\x0c\x02\x3e\x02\x70\x02\xba\x02\xd4\x02\xee\x02'\
-b'\x08\x03\x22\x03\x54\x03\x86\x03\xb8\x03\xea\x03\x1c\x04\x4e\x04'\
-b'\x80\x04\xb2\x04\xe4\x04\x16\x05\x30\x05\x4a\x05\x94\x05\xde\x05'\
-b'\x28\x06\x5a\x06\xa4\x06\xd6\x06\x08\x07\x3a\x07\x84\x07\xb6\x07'\
-b'\xe8\x07\x32\x08\x7c\x08\x96\x08\xb0\x08\xe2\x08\x14\x09\x5e\x09'\
-b'\xa8\x09\xf2\x09\x24\x0a\x6e\x0a\xa0\x0a\xd2\x0a\x04\x0b\x4e\x0b'\
-b'\x80\x0b\xca\x0b\xfc\x0b\x2e\x0c\x60\x0c\x92\x0c\xac\x0c\xde\x0c'\
-b'\x28\x0d\x5a\x0d\x8c\x0d\xbe\x0d\xf0\x0d\x22\x0e\x54\x0e\x86\x0e'\
-b'\xb8\x0e\xea\x0e\x1c\x0f\x36\x0f\x50\x0f\x82\x0f\x9c\x0f\xe6\x0f'\
-b'\x18\x10\x4a\x10\x7c\x10\xae\x10\xe0\x10\x12\x11\x44\x11\x76\x11'\
-b'\xa8\x11\xf2\x11\x24\x12\x56\x12\x88\x12\xba\x12\xd4\x12\x06\x13'\
-b'\x50\x13'
+b'\x00\x00\x19\x00\x1e\x00\x28\x00\x32\x00\x59\x00\x7b\x00\xa9\x00'\
+b'\xd0\x00\xd7\x00\xea\x00\xfd\x00\x0e\x01\x2c\x01\x34\x01\x3b\x01'\
+b'\x41\x01\x59\x01\x78\x01\x93\x01\xb0\x01\xcd\x01\xec\x01\x09\x02'\
+b'\x28\x02\x45\x02\x64\x02\x83\x02\x8b\x02\x96\x02\xb0\x02\xc2\x02'\
+b'\x00\x00\xdc\x02\x13\x03\x38\x03\x57\x03\x7a\x03\x9d\x03\xba\x03'\
+b'\xd5\x03\xfa\x03\x1b\x04\x25\x04\x38\x04\x59\x04\x74\x04\x99\x04'\
+b'\xba\x04\xe1\x04\xfe\x04\x2b\x05\x4c\x05\x6b\x05\x8e\x05\xaf\x05'\
+b'\xd4\x05\x06\x06\x29\x06\x4c\x06\x6f\x06\x82\x06\x9a\x06\xad\x06'\
+b'\xbd\x06\xc5\x06\xcd\x06\xe4\x06\x01\x07\x17\x07\x34\x07\x4d\x07'\
+b'\x63\x07\x81\x07\x9e\x07\xa8\x07\xbb\x07\xd8\x07\xe2\x07\x05\x08'\
+b'\x1c\x08\x35\x08\x53\x08\x71\x08\x82\x08\x98\x08\xae\x08\xc5\x08'\
+b'\xde\x08\xff\x08\x18\x09\x38\x09\x4e\x09\x6b\x09\x76\x09\x93\x09'\
+b'\x9f\x09'
+
+_widths =\
+b'\x0c\x07\x09\x0b\x13\x0f\x16\x12\x06\x09\x09\x0c\x13\x07\x08\x07'\
+b'\x08\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x08\x08\x13\x13\x13'\
+b'\x0c\x17\x10\x10\x10\x12\x0f\x0d\x12\x11\x07\x08\x0f\x0d\x14\x11'\
+b'\x12\x0e\x12\x10\x0f\x0e\x11\x10\x17\x10\x0e\x10\x09\x08\x09\x13'\
+b'\x0c\x0c\x0e\x0f\x0d\x0f\x0e\x09\x0f\x0f\x06\x07\x0d\x06\x16\x0f'\
+b'\x0e\x0e\x0e\x09\x0c\x09\x0f\x0e\x13\x0e\x0e\x0c\x0f\x08\x0f\x13'
 
 _mvfont = memoryview(_font)
 _mvi = memoryview(_index)
@@ -363,7 +220,7 @@ def get_ch(ch):
     oc = ord(ch)
     ioff = 2 * (oc - 32 + 1) if oc >= 32 and oc <= 126 else 0
     doff = mvi[ioff] | (mvi[ioff+1] << 8)
-    width = mvfont[doff] | (mvfont[doff+1] << 8)
+    width = mvfont[doff]
 
-    next_offs = doff + 2 + ((width - 1)//8 + 1) * 24
-    return _mvfont[doff + 2:next_offs], 24, width
+    next_offs = doff + 5 + (mvfont[doff+2] * mvfont[doff+4] + 7) // 8
+    return _mvfont[doff + 1:next_offs], 24, width
@@ -1,6 +1,7 @@
-# Code generated by font_to_py.py.
+# Code generated by cropfont.py.
 # Font: DejaVuSans.ttf
 # Cmd: ./tools/micropython-font-to-py/font_to_py.py /usr/share/fonts/dejavu/DejaVuSans.ttf --xmap 28 -e 58 -s 48 -l 58 wasp/fonts/sans28.py
+# Cropped: tools/cropfont.py wasp/fonts/sans28.py -o wasp/fonts/sans28.py
 version = '0.33'
 
 def height():
@@ -27,81 +28,72 @@ def min_ch():
 def max_ch():
     return 58
 
+def cropped():
+    return True
+
 _font =\
-b'\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00'\
-b'\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x18\x00\x00\xfe\x00\x03\xff\x80'\
-b'\x07\xff\xc0\x0f\x83\xe0\x0f\x01\xe0\x1e\x00\xf0\x1e\x00\xf0\x1e'\
-b'\x00\xf0\x3c\x00\x78\x3c\x00\x78\x3c\x00\x78\x3c\x00\x78\x3c\x00'\
-b'\x78\x3c\x00\x78\x3c\x00\x78\x3c\x00\x78\x3c\x00\x78\x3c\x00\x78'\
-b'\x3c\x00\x78\x1e\x00\xf0\x1e\x00\xf0\x1e\x00\xf0\x0f\x01\xe0\x0f'\
-b'\x83\xe0\x07\xff\xc0\x03\xff\x80\x00\xfe\x00\x18\x00\x00\xfe\x00'\
-b'\x07\xfe\x00\x07\xfe\x00\x07\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00'\
-b'\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00\x1e'\
-b'\x00\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00'\
-b'\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00\x1e\x00\x00'\
-b'\x1e\x00\x00\x1e\x00\x07\xff\xf8\x07\xff\xf8\x07\xff\xf8\x18\x00'\
-b'\x01\xfc\x00\x0f\xff\x80\x1f\xff\xc0\x1f\x07\xe0\x18\x01\xe0\x10'\
-b'\x01\xf0\x00\x00\xf0\x00\x00\xf0\x00\x00\xf0\x00\x00\xf0\x00\x01'\
-b'\xf0\x00\x01\xe0\x00\x03\xe0\x00\x07\xc0\x00\x0f\x80\x00\x1f\x00'\
-b'\x00\x3e\x00\x00\x7e\x00\x00\xfc\x00\x01\xf8\x00\x03\xf0\x00\x07'\
-b'\xe0\x00\x0f\xc0\x00\x1f\x80\x00\x1f\xff\xf0\x1f\xff\xf0\x1f\xff'\
-b'\xf0\x18\x00\x03\xfe\x00\x0f\xff\x80\x0f\xff\xc0\x0c\x03\xe0\x00'\
-b'\x01\xf0\x00\x00\xf0\x00\x00\xf0\x00\x00\xf0\x00\x00\xf0\x00\x01'\
-b'\xe0\x00\x03\xc0\x00\xff\x80\x00\xfe\x00\x00\xff\xc0\x00\x03\xe0'\
-b'\x00\x00\xf0\x00\x00\xf8\x00\x00\x78\x00\x00\x78\x00\x00\x78\x00'\
-b'\x00\x78\x00\x00\xf8\x00\x01\xf0\x18\x03\xf0\x1f\xff\xe0\x1f\xff'\
-b'\x80\x07\xfe\x00\x18\x00\x00\x07\xc0\x00\x0f\xc0\x00\x0f\xc0\x00'\
-b'\x1f\xc0\x00\x3b\xc0\x00\x3b\xc0\x00\x73\xc0\x00\xf3\xc0\x00\xe3'\
-b'\xc0\x01\xc3\xc0\x03\xc3\xc0\x03\x83\xc0\x07\x03\xc0\x07\x03\xc0'\
-b'\x0e\x03\xc0\x1e\x03\xc0\x1c\x03\xc0\x38\x03\xc0\x3f\xff\xfc\x3f'\
-b'\xff\xfc\x3f\xff\xfc\x00\x03\xc0\x00\x03\xc0\x00\x03\xc0\x00\x03'\
-b'\xc0\x00\x03\xc0\x00\x03\xc0\x18\x00\x0f\xff\xc0\x0f\xff\xc0\x0f'\
-b'\xff\xc0\x0f\x00\x00\x0f\x00\x00\x0f\x00\x00\x0f\x00\x00\x0f\x00'\
-b'\x00\x0f\x00\x00\x0f\xfc\x00\x0f\xff\x00\x0f\xff\xc0\x0c\x0f\xc0'\
-b'\x00\x03\xe0\x00\x01\xe0\x00\x00\xf0\x00\x00\xf0\x00\x00\xf0\x00'\
-b'\x00\xf0\x00\x00\xf0\x00\x00\xf0\x00\x01\xe0\x00\x03\xe0\x18\x07'\
-b'\xc0\x1f\xff\xc0\x1f\xff\x00\x07\xfc\x00\x18\x00\x00\x3f\x80\x00'\
-b'\xff\xe0\x03\xff\xe0\x07\xe0\x60\x0f\x80\x00\x0f\x00\x00\x1f\x00'\
-b'\x00\x1e\x00\x00\x1e\x00\x00\x3c\x00\x00\x3c\x7f\x00\x3c\xff\xc0'\
-b'\x3d\xff\xe0\x3f\x83\xf0\x3e\x00\xf0\x3e\x00\xf8\x3c\x00\x78\x3c'\
-b'\x00\x78\x3c\x00\x78\x1c\x00\x78\x1c\x00\x78\x1e\x00\xf8\x0e\x00'\
-b'\xf0\x0f\x83\xf0\x07\xff\xe0\x03\xff\x80\x00\xfe\x00\x18\x00\x1f'\
-b'\xff\xf0\x1f\xff\xf0\x1f\xff\xf0\x00\x01\xe0\x00\x01\xe0\x00\x03'\
-b'\xe0\x00\x03\xc0\x00\x03\xc0\x00\x07\xc0\x00\x07\x80\x00\x07\x80'\
-b'\x00\x0f\x80\x00\x0f\x00\x00\x0f\x00\x00\x1f\x00\x00\x1e\x00\x00'\
-b'\x1e\x00\x00\x3e\x00\x00\x3c\x00\x00\x3c\x00\x00\x78\x00\x00\x78'\
-b'\x00\x00\x78\x00\x00\xf0\x00\x00\xf0\x00\x00\xf0\x00\x01\xe0\x00'\
-b'\x18\x00\x00\xfe\x00\x03\xff\x80\x0f\xff\xe0\x0f\x83\xe0\x1f\x01'\
-b'\xf0\x1e\x00\xf0\x1e\x00\xf0\x1e\x00\xf0\x1e\x00\xf0\x0f\x01\xe0'\
-b'\x07\x83\xc0\x03\xff\x80\x00\xfe\x00\x07\xff\xc0\x0f\x83\xe0\x1e'\
-b'\x00\xf0\x3e\x00\xf0\x3c\x00\x78\x3c\x00\x78\x3c\x00\x78\x3c\x00'\
-b'\x78\x3e\x00\xf8\x1e\x00\xf0\x1f\x83\xf0\x0f\xff\xe0\x07\xff\xc0'\
-b'\x00\xfe\x00\x18\x00\x00\xfe\x00\x03\xff\x00\x0f\xff\xc0\x1f\x83'\
-b'\xe0\x1e\x00\xe0\x3e\x00\xf0\x3c\x00\x70\x3c\x00\x70\x3c\x00\x78'\
-b'\x3c\x00\x78\x3c\x00\x78\x3e\x00\xf8\x1e\x00\xf8\x1f\x83\xf8\x0f'\
-b'\xff\x78\x07\xfe\x78\x01\xfc\x78\x00\x00\xf8\x00\x00\xf0\x00\x00'\
-b'\xf0\x00\x01\xf0\x00\x01\xe0\x00\x03\xe0\x0c\x0f\xc0\x0f\xff\x80'\
-b'\x0f\xfe\x00\x03\xf8\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00'\
-b'\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00\x0f\x00'
+b'\x0c\x04\x04\x08\x13\xff\xff\xf0\x00\x00\x00\x00\xff\xff\xf0\x18'\
+b'\x02\x13\x00\x1b\x03\xf8\x01\xff\xc0\x7f\xfc\x1f\x07\xc3\xc0\x78'\
+b'\xf0\x07\x9e\x00\xf3\xc0\x1e\xf0\x01\xfe\x00\x3f\xc0\x07\xf8\x00'\
+b'\xff\x00\x1f\xe0\x03\xfc\x00\x7f\x80\x0f\xf0\x01\xfe\x00\x3f\xc0'\
+b'\x07\xbc\x01\xe7\x80\x3c\xf0\x07\x8f\x01\xe1\xf0\x7c\x1f\xff\x01'\
+b'\xff\xc0\x0f\xe0\x00\x18\x05\x10\x00\x1b\x1f\xc0\xff\xc0\xff\xc0'\
+b'\xe3\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0'\
+b'\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0'\
+b'\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x03\xc0\xff\xff\xff\xff\xff\xff'\
+b'\x18\x03\x11\x00\x1b\x0f\xe0\x3f\xfe\x3f\xff\x9f\x07\xec\x00\xf4'\
+b'\x00\x7c\x00\x1e\x00\x0f\x00\x07\x80\x03\xc0\x03\xe0\x01\xe0\x01'\
+b'\xf0\x01\xf0\x01\xf0\x01\xf0\x01\xf0\x01\xf8\x01\xf8\x01\xf8\x01'\
+b'\xf8\x01\xf8\x01\xf8\x01\xf8\x00\xff\xff\xff\xff\xff\xff\xe0\x18'\
+b'\x03\x12\x00\x1b\x1f\xf0\x1f\xff\x07\xff\xe1\x80\x7c\x00\x0f\x80'\
+b'\x01\xe0\x00\x78\x00\x1e\x00\x07\x80\x03\xc0\x01\xe0\x1f\xf0\x07'\
+b'\xf0\x01\xff\x80\x01\xf0\x00\x1e\x00\x07\xc0\x00\xf0\x00\x3c\x00'\
+b'\x0f\x00\x03\xc0\x01\xf0\x00\xfb\x00\x7e\xff\xff\x3f\xff\x03\xff'\
+b'\x00\x18\x02\x14\x00\x1b\x00\x1f\x00\x03\xf0\x00\x3f\x00\x07\xf0'\
+b'\x00\xef\x00\x0e\xf0\x01\xcf\x00\x3c\xf0\x03\x8f\x00\x70\xf0\x0f'\
+b'\x0f\x00\xe0\xf0\x1c\x0f\x01\xc0\xf0\x38\x0f\x07\x80\xf0\x70\x0f'\
+b'\x0e\x00\xf0\xff\xff\xff\xff\xff\xff\xff\xf0\x00\xf0\x00\x0f\x00'\
+b'\x00\xf0\x00\x0f\x00\x00\xf0\x00\x0f\x00\x18\x03\x11\x00\x1b\x7f'\
+b'\xfe\x3f\xff\x1f\xff\x8f\x00\x07\x80\x03\xc0\x01\xe0\x00\xf0\x00'\
+b'\x78\x00\x3f\xf0\x1f\xfe\x0f\xff\xc6\x07\xe0\x00\xf8\x00\x3c\x00'\
+b'\x0f\x00\x07\x80\x03\xc0\x01\xe0\x00\xf0\x00\x78\x00\x78\x00\x7d'\
+b'\x80\x7c\xff\xfe\x7f\xfc\x0f\xf8\x00\x18\x02\x13\x00\x1b\x00\xfe'\
+b'\x00\x7f\xf0\x3f\xfe\x0f\xc0\xc3\xe0\x00\x78\x00\x1f\x00\x03\xc0'\
+b'\x00\x78\x00\x1e\x00\x03\xc7\xf0\x79\xff\x8f\x7f\xf9\xfc\x1f\xbe'\
+b'\x00\xf7\xc0\x1f\xf0\x01\xfe\x00\x3f\xc0\x07\xb8\x00\xf7\x00\x1e'\
+b'\xf0\x07\xce\x00\xf1\xf0\x7e\x1f\xff\x81\xff\xc0\x0f\xe0\x00\x18'\
+b'\x03\x11\x00\x1b\xff\xff\xff\xff\xff\xff\xe0\x01\xe0\x00\xf0\x00'\
+b'\xf8\x00\x78\x00\x3c\x00\x3e\x00\x1e\x00\x0f\x00\x0f\x80\x07\x80'\
+b'\x03\xc0\x03\xe0\x01\xe0\x00\xf0\x00\xf8\x00\x78\x00\x3c\x00\x3c'\
+b'\x00\x1e\x00\x0f\x00\x0f\x00\x07\x80\x03\xc0\x03\xc0\x00\x18\x02'\
+b'\x13\x00\x1b\x03\xf8\x01\xff\xc0\xff\xfe\x1f\x07\xc7\xc0\x7c\xf0'\
+b'\x07\x9e\x00\xf3\xc0\x1e\x78\x03\xc7\x80\xf0\x78\x3c\x07\xff\x00'\
+b'\x3f\x80\x3f\xfe\x0f\x83\xe3\xc0\x1e\xf8\x03\xde\x00\x3f\xc0\x07'\
+b'\xf8\x00\xff\x00\x1f\xf0\x07\xde\x00\xf3\xf0\x7e\x3f\xff\x83\xff'\
+b'\xe0\x0f\xe0\x00\x18\x02\x13\x00\x1b\x03\xf8\x01\xff\x80\xff\xfc'\
+b'\x3f\x07\xc7\x80\x39\xf0\x07\xbc\x00\x77\x80\x0e\xf0\x01\xfe\x00'\
+b'\x3f\xc0\x07\xfc\x01\xf7\x80\x3e\xfc\x1f\xcf\xff\x78\xff\xcf\x07'\
+b'\xf1\xe0\x00\x7c\x00\x0f\x00\x01\xe0\x00\x7c\x00\x0f\x00\x03\xe1'\
+b'\x81\xf8\x3f\xfe\x07\xff\x00\x3f\x80\x00'
 
 _index =\
-b'\x00\x00\x38\x00\x8b\x00\xde\x00\x31\x01\x84\x01\xd7\x01\x2a\x02'\
-b'\x7d\x02\xd0\x02\x23\x03\x76\x03\xae\x03'
+b'\x00\x00\x0f\x00\x55\x00\x90\x00\xcf\x00\x11\x01\x5a\x01\x99\x01'\
+b'\xdf\x01\x1e\x02\x64\x02\x00\x00\xaa\x02'
+
+_widths =\
+b'\x0c\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x0c'
 
 _mvfont = memoryview(_font)
 _mvi = memoryview(_index)
-ifb = lambda l : l[0] | (l[1] << 8)
 
 def get_ch(ch):
+    mvi = _mvi
+    mvfont = _mvfont
+
     oc = ord(ch)
     ioff = 2 * (oc - 48 + 1) if oc >= 48 and oc <= 58 else 0
-    doff = ifb(_mvi[ioff : ])
-    width = ifb(_mvfont[doff : ])
+    doff = mvi[ioff] | (mvi[ioff+1] << 8)
+    width = mvfont[doff]
 
-    next_offs = doff + 2 + ((width - 1)//8 + 1) * 27
-    return _mvfont[doff + 2:next_offs], 27, width
- 
+    next_offs = doff + 5 + (mvfont[doff+2] * mvfont[doff+4] + 7) // 8
+    return _mvfont[doff + 1:next_offs], 27, width
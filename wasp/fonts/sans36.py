@@ -1,6 +1,7 @@
-# Code generated by font_to_py.py.
+# Code generated by cropfont.py.
 # Font: DejaVuSans.ttf
 # Cmd: tools/micropython-font-to-py/font_to_py.py /usr/share/fonts/dejavu/DejaVuSans.ttf --xmap 36 -e 58 -s 48 -l 58 wasp/fonts/sans36.py
+# Cropped: tools/cropfont.py wasp/fonts/sans36.py -o wasp/fonts/sans36.py
 version = '0.33'
 
 def height():
@@ -27,123 +28,97 @@ def min_ch():
 def max_ch():
     return 58
 
+def cropped():
+    return True
+
 _font =\
-b'\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x03\xe0\x03\xe0\x03\xe0\x03\xe0'\
-b'\x03\xe0\x03\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xe0\x03\xe0'\
-b'\x03\xe0\x03\xe0\x03\xe0\x03\xe0\x00\x00\x1e\x00\x00\x0f\xc0\x00'\
-b'\x00\x7f\xf8\x00\x00\xff\xfc\x00\x01\xff\xfe\x00\x03\xf0\x3f\x00'\
-b'\x03\xe0\x1f\x00\x07\xc0\x0f\x80\x07\x80\x07\x80\x0f\x80\x07\xc0'\
-b'\x0f\x00\x03\xc0\x0f\x00\x03\xc0\x0f\x00\x03\xc0\x1e\x00\x01\xe0'\
-b'\x1e\x00\x01\xe0\x1e\x00\x01\xe0\x1e\x00\x01\xe0\x1e\x00\x01\xe0'\
-b'\x1e\x00\x01\xe0\x1e\x00\x01\xe0\x1e\x00\x01\xe0\x1e\x00\x01\xe0'\
-b'\x1e\x00\x01\xe0\x1e\x00\x01\xe0\x1e\x00\x01\xe0\x0f\x00\x03\xc0'\
-b'\x0f\x00\x03\xc0\x0f\x00\x03\xc0\x0f\x00\x07\xc0\x07\x80\x07\x80'\
-b'\x07\xc0\x0f\x80\x07\xe0\x1f\x00\x03\xf0\x3f\x00\x01\xff\xfe\x00'\
-b'\x00\xff\xfc\x00\x00\x7f\xf8\x00\x00\x1f\xe0\x00\x1e\x00\x00\x00'\
-b'\x00\x00\x00\x1f\x80\x00\x01\xff\x80\x00\x07\xff\x80\x00\x07\xff'\
-b'\x80\x00\x07\xe7\x80\x00\x06\x07\x80\x00\x00\x07\x80\x00\x00\x07'\
-b'\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07'\
-b'\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07'\
-b'\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07'\
-b'\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07'\
-b'\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07'\
-b'\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x07\xff\xff\x80\x07\xff'\
-b'\xff\x80\x07\xff\xff\x80\x07\xff\xff\x80\x00\x00\x00\x00\x1e\x00'\
-b'\x00\x7f\xc0\x00\x03\xff\xf8\x00\x0f\xff\xfc\x00\x0f\xff\xff\x00'\
-b'\x0f\xe0\x3f\x00\x0e\x00\x0f\x80\x08\x00\x07\x80\x00\x00\x07\xc0'\
-b'\x00\x00\x03\xc0\x00\x00\x03\xc0\x00\x00\x03\xc0\x00\x00\x03\xc0'\
-b'\x00\x00\x03\xc0\x00\x00\x07\x80\x00\x00\x0f\x80\x00\x00\x0f\x00'\
-b'\x00\x00\x1f\x00\x00\x00\x3e\x00\x00\x00\x7c\x00\x00\x00\xf8\x00'\
-b'\x00\x01\xf0\x00\x00\x03\xe0\x00\x00\x07\xc0\x00\x00\x0f\x80\x00'\
-b'\x00\x1f\x00\x00\x00\x3e\x00\x00\x00\x7c\x00\x00\x00\xf8\x00\x00'\
-b'\x01\xf0\x00\x00\x03\xe0\x00\x00\x07\xc0\x00\x00\x0f\xff\xff\xc0'\
-b'\x0f\xff\xff\xc0\x0f\xff\xff\xc0\x0f\xff\xff\xc0\x00\x00\x00\x00'\
-b'\x1e\x00\x00\xff\xe0\x00\x07\xff\xf8\x00\x07\xff\xfe\x00\x07\xff'\
-b'\xff\x00\x07\x00\x3f\x80\x00\x00\x0f\x80\x00\x00\x07\xc0\x00\x00'\
-b'\x03\xc0\x00\x00\x03\xc0\x00\x00\x03\xc0\x00\x00\x03\xc0\x00\x00'\
-b'\x03\xc0\x00\x00\x07\x80\x00\x00\x0f\x80\x00\x00\x3f\x00\x00\x3f'\
-b'\xfe\x00\x00\x3f\xf8\x00\x00\x3f\xfc\x00\x00\x3f\xff\x00\x00\x00'\
-b'\x3f\x80\x00\x00\x0f\xc0\x00\x00\x03\xc0\x00\x00\x03\xe0\x00\x00'\
-b'\x01\xe0\x00\x00\x01\xe0\x00\x00\x01\xe0\x00\x00\x01\xe0\x00\x00'\
-b'\x01\xe0\x00\x00\x03\xe0\x00\x00\x07\xc0\x08\x00\x0f\xc0\x0f\x00'\
-b'\x3f\x80\x0f\xff\xff\x00\x0f\xff\xfe\x00\x07\xff\xf8\x00\x00\x7f'\
-b'\xc0\x00\x1e\x00\x00\x00\x00\x00\x00\x00\xfc\x00\x00\x01\xfc\x00'\
-b'\x00\x01\xfc\x00\x00\x03\xfc\x00\x00\x07\xbc\x00\x00\x07\x3c\x00'\
-b'\x00\x0f\x3c\x00\x00\x1e\x3c\x00\x00\x1e\x3c\x00\x00\x3c\x3c\x00'\
-b'\x00\x78\x3c\x00\x00\x78\x3c\x00\x00\xf0\x3c\x00\x01\xe0\x3c\x00'\
-b'\x01\xe0\x3c\x00\x03\xc0\x3c\x00\x07\x80\x3c\x00\x07\x80\x3c\x00'\
-b'\x0f\x00\x3c\x00\x1f\x00\x3c\x00\x1e\x00\x3c\x00\x3c\x00\x3c\x00'\
-b'\x3f\xff\xff\xe0\x3f\xff\xff\xe0\x3f\xff\xff\xe0\x3f\xff\xff\xe0'\
-b'\x00\x00\x3c\x00\x00\x00\x3c\x00\x00\x00\x3c\x00\x00\x00\x3c\x00'\
-b'\x00\x00\x3c\x00\x00\x00\x3c\x00\x00\x00\x3c\x00\x00\x00\x3c\x00'\
-b'\x00\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x07\xff\xfe\x00\x07\xff'\
-b'\xfe\x00\x07\xff\xfe\x00\x07\xff\xfe\x00\x07\x80\x00\x00\x07\x80'\
-b'\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07\x80\x00\x00\x07\x80'\
-b'\x00\x00\x07\x80\x00\x00\x07\xbf\x80\x00\x07\xff\xf0\x00\x07\xff'\
-b'\xfc\x00\x07\xff\xfe\x00\x07\x80\xff\x00\x04\x00\x1f\x00\x00\x00'\
-b'\x0f\x80\x00\x00\x07\x80\x00\x00\x07\xc0\x00\x00\x03\xc0\x00\x00'\
-b'\x03\xc0\x00\x00\x03\xc0\x00\x00\x03\xc0\x00\x00\x03\xc0\x00\x00'\
-b'\x03\xc0\x00\x00\x07\xc0\x00\x00\x07\x80\x00\x00\x0f\x80\x08\x00'\
-b'\x1f\x00\x0f\x00\x7f\x00\x0f\xff\xfe\x00\x0f\xff\xfc\x00\x0f\xff'\
-b'\xf0\x00\x01\xff\x80\x00\x1e\x00\x00\x03\xfe\x00\x00\x1f\xff\x80'\
-b'\x00\x7f\xff\x80\x00\xff\xff\x80\x01\xfc\x01\x80\x03\xf0\x00\x00'\
-b'\x03\xe0\x00\x00\x07\xc0\x00\x00\x07\x80\x00\x00\x0f\x00\x00\x00'\
-b'\x0f\x00\x00\x00\x0f\x00\x00\x00\x0f\x0f\xe0\x00\x1e\x3f\xfc\x00'\
-b'\x1e\x7f\xfe\x00\x1e\xff\xff\x00\x1f\xf8\x3f\x80\x1f\xe0\x0f\x80'\
-b'\x1f\xc0\x07\xc0\x1f\x80\x03\xc0\x1f\x80\x03\xe0\x1f\x00\x01\xe0'\
-b'\x1f\x00\x01\xe0\x1f\x00\x01\xe0\x0f\x00\x01\xe0\x0f\x00\x01\xe0'\
-b'\x0f\x00\x01\xe0\x0f\x80\x03\xe0\x07\x80\x03\xc0\x07\xc0\x07\xc0'\
-b'\x03\xe0\x0f\x80\x03\xf8\x3f\x80\x01\xff\xff\x00\x00\xff\xfe\x00'\
-b'\x00\x7f\xfc\x00\x00\x0f\xe0\x00\x1e\x00\x00\x00\x00\x00\x0f\xff'\
-b'\xff\xc0\x0f\xff\xff\xc0\x0f\xff\xff\xc0\x0f\xff\xff\x80\x00\x00'\
-b'\x07\x80\x00\x00\x0f\x80\x00\x00\x0f\x00\x00\x00\x1f\x00\x00\x00'\
-b'\x1e\x00\x00\x00\x1e\x00\x00\x00\x3e\x00\x00\x00\x3c\x00\x00\x00'\
-b'\x3c\x00\x00\x00\x78\x00\x00\x00\x78\x00\x00\x00\xf8\x00\x00\x00'\
-b'\xf0\x00\x00\x00\xf0\x00\x00\x01\xe0\x00\x00\x01\xe0\x00\x00\x03'\
-b'\xe0\x00\x00\x03\xc0\x00\x00\x03\xc0\x00\x00\x07\x80\x00\x00\x07'\
-b'\x80\x00\x00\x0f\x80\x00\x00\x0f\x00\x00\x00\x0f\x00\x00\x00\x1e'\
-b'\x00\x00\x00\x1e\x00\x00\x00\x3e\x00\x00\x00\x3c\x00\x00\x00\x3c'\
-b'\x00\x00\x00\x78\x00\x00\x00\x00\x00\x00\x1e\x00\x00\x1f\xe0\x00'\
-b'\x00\xff\xfc\x00\x01\xff\xfe\x00\x03\xff\xff\x00\x07\xf0\x3f\x80'\
-b'\x07\xc0\x0f\x80\x0f\x80\x07\xc0\x0f\x00\x03\xc0\x0f\x00\x03\xc0'\
-b'\x0f\x00\x03\xc0\x0f\x00\x03\xc0\x0f\x00\x03\xc0\x07\x80\x07\x80'\
-b'\x07\xc0\x0f\x80\x03\xf0\x3f\x00\x01\xff\xfe\x00\x00\x7f\xf8\x00'\
-b'\x00\xff\xfc\x00\x03\xff\xff\x00\x07\xe0\x1f\x80\x0f\x80\x07\xc0'\
-b'\x0f\x00\x03\xc0\x1f\x00\x03\xe0\x1e\x00\x01\xe0\x1e\x00\x01\xe0'\
-b'\x1e\x00\x01\xe0\x1e\x00\x01\xe0\x1e\x00\x01\xe0\x1f\x00\x03\xe0'\
-b'\x0f\x00\x03\xc0\x0f\x80\x07\xc0\x0f\xe0\x1f\x80\x07\xff\xff\x80'\
-b'\x03\xff\xff\x00\x00\xff\xfc\x00\x00\x1f\xe0\x00\x1e\x00\x00\x1f'\
-b'\xc0\x00\x00\xff\xf0\x00\x01\xff\xfc\x00\x03\xff\xfe\x00\x07\xf0'\
-b'\x7f\x00\x0f\xc0\x1f\x00\x0f\x80\x0f\x80\x0f\x00\x07\x80\x1f\x00'\
-b'\x07\xc0\x1e\x00\x03\xc0\x1e\x00\x03\xc0\x1e\x00\x03\xc0\x1e\x00'\
-b'\x03\xe0\x1e\x00\x03\xe0\x1e\x00\x03\xe0\x1f\x00\x07\xe0\x0f\x00'\
-b'\x07\xe0\x0f\x80\x0f\xe0\x0f\xc0\x1f\xe0\x07\xf0\x7f\xe0\x03\xff'\
-b'\xfd\xe0\x01\xff\xf9\xe0\x00\xff\xf1\xe0\x00\x1f\xc3\xc0\x00\x00'\
-b'\x03\xc0\x00\x00\x03\xc0\x00\x00\x07\xc0\x00\x00\x07\x80\x00\x00'\
-b'\x0f\x80\x00\x00\x1f\x00\x00\x00\x3f\x00\x06\x00\xfe\x00\x07\xff'\
-b'\xfc\x00\x07\xff\xf8\x00\x07\xff\xe0\x00\x01\xff\x00\x00\x10\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x03\xe0\x03\xe0\x03\xe0\x03\xe0\x03\xe0'\
-b'\x03\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xe0\x03\xe0\x03\xe0'\
-b'\x03\xe0\x03\xe0\x03\xe0\x00\x00'
+b'\x10\x06\x05\x0b\x18\xff\xff\xff\xfc\x00\x00\x00\x00\x00\x00\x00'\
+b'\x3f\xff\xff\xff\x1e\x03\x18\x00\x24\x00\x7e\x00\x03\xff\xc0\x07'\
+b'\xff\xe0\x0f\xff\xf0\x1f\x81\xf8\x1f\x00\xf8\x3e\x00\x7c\x3c\x00'\
+b'\x3c\x7c\x00\x3e\x78\x00\x1e\x78\x00\x1e\x78\x00\x1e\xf0\x00\x0f'\
+b'\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0'\
+b'\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00'\
+b'\x0f\x78\x00\x1e\x78\x00\x1e\x78\x00\x1e\x78\x00\x3e\x3c\x00\x3c'\
+b'\x3e\x00\x7c\x3f\x00\xf8\x1f\x81\xf8\x0f\xff\xf0\x07\xff\xe0\x03'\
+b'\xff\xc0\x00\xff\x00\x1e\x05\x14\x01\x22\x03\xf0\x03\xff\x00\xff'\
+b'\xf0\x0f\xff\x00\xfc\xf0\x0c\x0f\x00\x00\xf0\x00\x0f\x00\x00\xf0'\
+b'\x00\x0f\x00\x00\xf0\x00\x0f\x00\x00\xf0\x00\x0f\x00\x00\xf0\x00'\
+b'\x0f\x00\x00\xf0\x00\x0f\x00\x00\xf0\x00\x0f\x00\x00\xf0\x00\x0f'\
+b'\x00\x00\xf0\x00\x0f\x00\x00\xf0\x00\x0f\x00\x00\xf0\x00\x0f\x00'\
+b'\x00\xf0\x00\x0f\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x1e'\
+b'\x04\x16\x00\x23\x07\xfc\x00\xff\xfe\x0f\xff\xfc\x3f\xff\xfc\xfe'\
+b'\x03\xf3\x80\x03\xe8\x00\x07\x80\x00\x1f\x00\x00\x3c\x00\x00\xf0'\
+b'\x00\x03\xc0\x00\x0f\x00\x00\x3c\x00\x01\xe0\x00\x0f\x80\x00\x3c'\
+b'\x00\x01\xf0\x00\x0f\x80\x00\x7c\x00\x03\xe0\x00\x1f\x00\x00\xf8'\
+b'\x00\x07\xc0\x00\x3e\x00\x01\xf0\x00\x0f\x80\x00\x7c\x00\x03\xe0'\
+b'\x00\x1f\x00\x00\xf8\x00\x07\xc0\x00\x3f\xff\xff\xff\xff\xff\xff'\
+b'\xff\xff\xff\xff\xc0\x1e\x04\x17\x00\x24\x0f\xfe\x00\xff\xff\x01'\
+b'\xff\xff\x83\xff\xff\x87\x00\x3f\x80\x00\x1f\x00\x00\x1f\x00\x00'\
+b'\x1e\x00\x00\x3c\x00\x00\x78\x00\x00\xf0\x00\x01\xe0\x00\x07\x80'\
+b'\x00\x1f\x00\x00\xfc\x01\xff\xf0\x03\xff\x80\x07\xff\x80\x0f\xff'\
+b'\xc0\x00\x1f\xc0\x00\x0f\xc0\x00\x07\x80\x00\x0f\x80\x00\x0f\x00'\
+b'\x00\x1e\x00\x00\x3c\x00\x00\x78\x00\x00\xf0\x00\x03\xe0\x00\x0f'\
+b'\xa0\x00\x3f\x78\x01\xfc\xff\xff\xf1\xff\xff\xc1\xff\xfe\x00\x3f'\
+b'\xe0\x00\x1e\x02\x19\x01\x22\x00\x03\xf0\x00\x03\xf8\x00\x01\xfc'\
+b'\x00\x01\xfe\x00\x01\xef\x00\x00\xe7\x80\x00\xf3\xc0\x00\xf1\xe0'\
+b'\x00\x78\xf0\x00\x78\x78\x00\x78\x3c\x00\x3c\x1e\x00\x3c\x0f\x00'\
+b'\x3c\x07\x80\x1e\x03\xc0\x1e\x01\xe0\x1e\x00\xf0\x0f\x00\x78\x0f'\
+b'\x00\x3c\x0f\x80\x1e\x07\x80\x0f\x07\x80\x07\x83\xff\xff\xff\xff'\
+b'\xff\xff\xff\xff\xff\xff\xff\xff\xc0\x00\x3c\x00\x00\x1e\x00\x00'\
+b'\x0f\x00\x00\x07\x80\x00\x03\xc0\x00\x01\xe0\x00\x00\xf0\x00\x00'\
+b'\x78\x00\x1e\x04\x16\x01\x23\x7f\xff\xe1\xff\xff\x87\xff\xfe\x1f'\
+b'\xff\xf8\x78\x00\x01\xe0\x00\x07\x80\x00\x1e\x00\x00\x78\x00\x01'\
+b'\xe0\x00\x07\x80\x00\x1e\xfe\x00\x7f\xff\x01\xff\xff\x07\xff\xfe'\
+b'\x1e\x03\xfc\x40\x01\xf0\x00\x03\xe0\x00\x07\x80\x00\x1f\x00\x00'\
+b'\x3c\x00\x00\xf0\x00\x03\xc0\x00\x0f\x00\x00\x3c\x00\x00\xf0\x00'\
+b'\x07\xc0\x00\x1e\x00\x00\xfa\x00\x07\xcf\x00\x7f\x3f\xff\xf8\xff'\
+b'\xff\xc3\xff\xfc\x01\xff\x80\x00\x1e\x03\x18\x00\x24\x00\x1f\xf0'\
+b'\x00\xff\xfc\x03\xff\xfc\x07\xff\xfc\x0f\xe0\x0c\x1f\x80\x00\x1f'\
+b'\x00\x00\x3e\x00\x00\x3c\x00\x00\x78\x00\x00\x78\x00\x00\x78\x00'\
+b'\x00\x78\x7f\x00\xf1\xff\xe0\xf3\xff\xf0\xf7\xff\xf8\xff\xc1\xfc'\
+b'\xff\x00\x7c\xfe\x00\x3e\xfc\x00\x1e\xfc\x00\x1f\xf8\x00\x0f\xf8'\
+b'\x00\x0f\xf8\x00\x0f\x78\x00\x0f\x78\x00\x0f\x78\x00\x0f\x7c\x00'\
+b'\x1f\x3c\x00\x1e\x3e\x00\x3e\x1f\x00\x7c\x1f\xc1\xfc\x0f\xff\xf8'\
+b'\x07\xff\xf0\x03\xff\xe0\x00\x7f\x00\x1e\x04\x16\x01\x22\xff\xff'\
+b'\xff\xff\xff\xff\xff\xff\xff\xff\xfe\x00\x00\x78\x00\x03\xe0\x00'\
+b'\x0f\x00\x00\x7c\x00\x01\xe0\x00\x07\x80\x00\x3e\x00\x00\xf0\x00'\
+b'\x03\xc0\x00\x1e\x00\x00\x78\x00\x03\xe0\x00\x0f\x00\x00\x3c\x00'\
+b'\x01\xe0\x00\x07\x80\x00\x3e\x00\x00\xf0\x00\x03\xc0\x00\x1e\x00'\
+b'\x00\x78\x00\x03\xe0\x00\x0f\x00\x00\x3c\x00\x01\xe0\x00\x07\x80'\
+b'\x00\x3e\x00\x00\xf0\x00\x03\xc0\x00\x1e\x00\x00\x1e\x03\x18\x00'\
+b'\x24\x00\xff\x00\x07\xff\xe0\x0f\xff\xf0\x1f\xff\xf8\x3f\x81\xfc'\
+b'\x3e\x00\x7c\x7c\x00\x3e\x78\x00\x1e\x78\x00\x1e\x78\x00\x1e\x78'\
+b'\x00\x1e\x78\x00\x1e\x3c\x00\x3c\x3e\x00\x7c\x1f\x81\xf8\x0f\xff'\
+b'\xf0\x03\xff\xc0\x07\xff\xe0\x1f\xff\xf8\x3f\x00\xfc\x7c\x00\x3e'\
+b'\x78\x00\x1e\xf8\x00\x1f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0'\
+b'\x00\x0f\xf0\x00\x0f\xf8\x00\x1f\x78\x00\x1e\x7c\x00\x3e\x7f\x00'\
+b'\xfc\x3f\xff\xfc\x1f\xff\xf8\x07\xff\xe0\x00\xff\x00\x1e\x03\x18'\
+b'\x00\x24\x00\xfe\x00\x07\xff\x80\x0f\xff\xe0\x1f\xff\xf0\x3f\x83'\
+b'\xf8\x7e\x00\xf8\x7c\x00\x7c\x78\x00\x3c\xf8\x00\x3e\xf0\x00\x1e'\
+b'\xf0\x00\x1e\xf0\x00\x1e\xf0\x00\x1f\xf0\x00\x1f\xf0\x00\x1f\xf8'\
+b'\x00\x3f\x78\x00\x3f\x7c\x00\x7f\x7e\x00\xff\x3f\x83\xff\x1f\xff'\
+b'\xef\x0f\xff\xcf\x07\xff\x8f\x00\xfe\x1e\x00\x00\x1e\x00\x00\x1e'\
+b'\x00\x00\x3e\x00\x00\x3c\x00\x00\x7c\x00\x00\xf8\x00\x01\xf8\x30'\
+b'\x07\xf0\x3f\xff\xe0\x3f\xff\xc0\x3f\xff\x00\x0f\xf8\x00'
 
 _index =\
-b'\x00\x00\x4a\x00\xdc\x00\x6e\x01\x00\x02\x92\x02\x24\x03\xb6\x03'\
-b'\x48\x04\xda\x04\x6c\x05\xfe\x05\x48\x06'
+b'\x00\x00\x14\x00\x85\x00\xdf\x00\x45\x01\xb2\x01\x22\x02\x88\x02'\
+b'\xf9\x02\x5c\x03\xcd\x03\x00\x00\x3e\x04'
+
+_widths =\
+b'\x10\x1e\x1e\x1e\x1e\x1e\x1e\x1e\x1e\x1e\x1e\x10'
 
 _mvfont = memoryview(_font)
 _mvi = memoryview(_index)
-ifb = lambda l : l[0] | (l[1] << 8)
 
 def get_ch(ch):
+    mvi = _mvi
+    mvfont = _mvfont
+
     oc = ord(ch)
     ioff = 2 * (oc - 48 + 1) if oc >= 48 and oc <= 58 else 0
-    doff = ifb(_mvi[ioff : ])
-    width = ifb(_mvfont[doff : ])
+    doff = mvi[ioff] | (mvi[ioff+1] << 8)
+    width = mvfont[doff]
 
-    next_offs = doff + 2 + ((width - 1)//8 + 1) * 36
-    return _mvfont[doff + 2:next_offs], 36, width
- 
+    next_offs = doff + 5 + (mvfont[doff+2] * mvfont[doff+4] + 7) // 8
+    return _mvfont[doff + 1:next_offs], 36, width
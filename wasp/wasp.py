@@ -14,6 +14,7 @@
     wasp.watch is an import of :py:mod:`watch` and is simply provided as a
     shortcut (and to reduce memory by keeping it out of other namespaces).
 """
+import array
 import gc
 import machine
 import micropython
@@ -55,6 +56,45 @@ class EventMask():
     BUTTON = 0x0008
     NEXT = 0x0010
 
+class Theme():
+    """Enumerated slots in the system theme.
+
+    The first eleven slots are set by the theme (see ``tools/themer.py``)
+    and the remainder are shades derived from them, which are calculated
+    once when the theme is set rather than every time they are drawn. Use
+    these with :py:meth:`.Manager.theme`.
+    """
+    BLE = 0
+    SCROLL_INDICATOR = 1
+    BATTERY = 2
+    STATUS_CLOCK = 3
+    NOTIFY_ICON = 4
+    BRIGHT = 5
+    MID = 6
+    UI = 7
+    SPOT1 = 8
+    SPOT2 = 9
+    CONTRAST = 10
+
+    # Derived shades
+    UI_DARK = 11            # darken(UI)
+    UI_LIGHTER = 12         # lighten(UI, CONTRAST)
+    UI_DARKER = 13          # darken(UI, CONTRAST)
+    SPOT1_LIGHTER = 14      # lighten(SPOT1, CONTRAST)
+    SPOT1_DARKER = 15       # darken(SPOT1, CONTRAST)
+
+_THEME_PARTS = ("ble",
+                "scroll-indicator",
+                "battery",
+                "status-clock",
+                "notify-icon",
+                "bright",
+                "mid",
+                "ui",
+                "spot1",
+                "spot2",
+                "contrast")
+
 class PinHandler():
     """Pin (and Signal) event generator.
 
@@ -130,6 +170,8 @@ class Manager():
                 b'\xdd\xd0'     # spot2
                 b'\x00\x0f'     # contrast
         )
+        self._colors = array.array('H', (0,) * 16)
+        self._compile_theme()
 
         self.blank_after = 15
 
@@ -229,6 +271,7 @@ class Manager():
                     # code.
                     self.app = True
                     raise
+            watch.drawable.release()
         else:
             # System start up...
             watch.display.poweron()
@@ -246,6 +289,8 @@ class Manager():
 
         self.app = app
         watch.display.mute(True)
+        if watch.display.scroll_offset:
+            watch.display.scroll(0)
         watch.drawable.reset()
         app.foreground()
         watch.display.mute(False)
@@ -540,29 +585,46 @@ class Manager():
     def set_theme(self, new_theme) -> bool:
         """Sets the system theme.
 
-        Accepts anything that supports indexing,
-        and has a len() equivalent to the default theme."""
-        if len(self._theme) != len(new_theme):
+        Accepts anything that supports indexing and has a len() equivalent
+        to either the default theme or to a compiled theme (which also
+        includes the derived shades). For more see ../tools/themer.py"""
+        if len(new_theme) not in (len(self._theme), 2 * len(self._colors)):
             return False
         self._theme = new_theme
+        self._compile_theme()
         return True
 
-    def theme(self, theme_part: str) -> int:
-        """Returns the relevant part of theme. For more see ../tools/themer.py"""
-        theme_parts = ("ble",
-                       "scroll-indicator",
-                       "battery",
-                       "status-clock",
-                       "notify-icon",
-                       "bright",
-                       "mid",
-                       "ui",
-                       "spot1",
-                       "spot2",
-                       "contrast")
-        if theme_part not in theme_parts:
-            raise IndexError('Theme part {} does not exist'.format(theme_part))
-        idx = theme_parts.index(theme_part) * 2
-        return (self._theme[idx] << 8) | self._theme[idx+1]
+    def _compile_theme(self):
+        """Unpack the theme and (re)calculate the derived shades."""
+        theme = self._theme
+        colors = self._colors
+        for i in range(len(theme) // 2):
+            colors[i] = (theme[2*i] << 8) | theme[2*i+1]
+        if len(theme) == 2 * len(colors):
+            return
+
+        draw = watch.drawable
+        ui = colors[Theme.UI]
+        spot1 = colors[Theme.SPOT1]
+        contrast = colors[Theme.CONTRAST]
+        colors[Theme.UI_DARK] = draw.darken(ui)
+        colors[Theme.UI_LIGHTER] = draw.lighten(ui, contrast)
+        colors[Theme.UI_DARKER] = draw.darken(ui, contrast)
+        colors[Theme.SPOT1_LIGHTER] = draw.lighten(spot1, contrast)
+        colors[Theme.SPOT1_DARKER] = draw.darken(spot1, contrast)
+
+    def theme(self, theme_part) -> int:
+        """Returns the relevant part of theme.
+
+        :param theme_part: One of the :py:class:`.Theme` slots. The names
+                           of the original theme parts (such as ``'ui'``)
+                           are also accepted but looking them up is
+                           much slower.
+        """
+        if isinstance(theme_part, str):
+            if theme_part not in _THEME_PARTS:
+                raise IndexError('Theme part {} does not exist'.format(theme_part))
+            theme_part = _THEME_PARTS.index(theme_part)
+        return self._colors[theme_part]
 
 system = Manager()
@@ -8,6 +8,7 @@ The widget library allows common fragments of logic and drawing code to be
 shared between applications.
 """
 
+import array
 import fonts
 import icons
 import wasp
@@ -15,6 +16,24 @@ import watch
 
 from micropython import const
 
+# Scratch space for a batch of rectangles (see Draw565.fill_rects())
+_rects = array.array('H', (0,) * (5 * 10))
+
+def add_rect(rects, n, x, y, w, h, color):
+    """Append a rectangle to a batch for :py:meth:`draw565.Draw565.fill_rects`.
+
+    :param rects: An ``array('H')`` with space for the new record
+    :param n:     Number of records already in the batch
+    :returns:     The new number of records in the batch
+    """
+    i = 5 * n
+    rects[i] = x
+    rects[i+1] = y
+    rects[i+2] = w
+    rects[i+3] = h
+    rects[i+4] = color
+    return n + 1
+
 class BatteryMeter:
     """Battery meter widget.
 
@@ -33,44 +52,64 @@ class BatteryMeter:
         """Update the meter.
 
         The update is lazy and won't redraw unless the level has changed.
+        Only the level indicator is redrawn unless the icon itself changes
+        colour (or switches to/from the charging indicator).
         """
         icon = icons.battery
         draw = watch.drawable
 
         if watch.battery.charging():
-            if self.level != -1:
-                draw.blit(icon, 239-icon[1], 0,
-                             fg=wasp.system.theme('battery'))
-                self.level = -1
+            if self.level == -1:
+                return
+            draw.invalidate(239-icon[1], 0, icon[1], icon[2])
+            self.level = -1
         else:
             level = watch.battery.level()
             if level == self.level:
                 return
 
+            if self.level < 0 or ((level > 5) ^ (self.level > 5)):
+                draw.invalidate(239-icon[1], 0, icon[1], icon[2])
+            else:
+                w = icon[1] - 10
+                draw.invalidate(239 - 5 - w, 9, w, 18)
+            self.level = level
 
-            green = level // 3
-            if green > 31:
-                green = 31
-            red = 31-green
-            rgb = (red << 11) + (green << 6)
+        draw.flush(self.paint, clear=False,
+                   region=(239-icon[1], 0, icon[1], icon[2]))
 
-            if self.level < 0 or ((level > 5) ^ (self.level > 5)):
-                if level  > 5:
-                    draw.blit(icon, 239-icon[1], 0,
-                             fg=wasp.system.theme('battery'))
-                else:
-                    rgb = 0xf800
-                    draw.blit(icon, 239-icon[1], 0, fg=0xf800)
-
-            w = icon[1] - 10
-            x = 239 - 5 - w
-            h = 2*level // 11
-            if 18 - h:
-                draw.fill(0, x, 9, w, 18 - h)
-            if h:
-                draw.fill(rgb, x, 27 - h, w, h)
+    def paint(self, x, y, w, h):
+        """Repaint the damaged parts of the meter.
 
-            self.level = level
+        This is the paint callback for :py:meth:`draw565.Draw565.flush`.
+        """
+        icon = icons.battery
+        draw = watch.drawable
+        level = self.level
+
+        if draw.damaged(239-icon[1], 0, icon[1], 9):
+            fg = 0xf800
+            if level == -1 or level > 5:
+                fg = wasp.system.theme(wasp.Theme.BATTERY)
+            draw.blit(icon, 239-icon[1], 0, fg=fg)
+
+        w = icon[1] - 10
+        x = 239 - 5 - w
+        if level >= 0 and draw.damaged(x, 9, w, 18):
+            if level > 5:
+                green = level // 3
+                if green > 31:
+                    green = 31
+                red = 31-green
+                rgb = (red << 11) + (green << 6)
+            else:
+                rgb = 0xf800
+
+            h = 2*level // 11
+            rects = _rects
+            n = add_rect(rects, 0, x, 9, w, 18 - h, 0)
+            n = add_rect(rects, n, x, 27 - h, w, h, rgb)
+            draw.fill_rects(rects, n)
 
 class Clock:
     """Small clock widget."""
@@ -102,18 +141,27 @@ class Clock:
         if on_screen and on_screen == now:
             return None
 
+        self.on_screen = now
         if self.enabled and (not on_screen
                 or now[4] != on_screen[4] or now[3] != on_screen[3]):
-            t1 = '{:02}:{:02}'.format(now[3], now[4])
-
             draw = wasp.watch.drawable
-            draw.set_font(fonts.sans28)
-            draw.set_color(wasp.system.theme('status-clock'))
-            draw.string(t1, 52, 4, 138)
+            draw.invalidate(52, 4, 138, 27)
+            draw.flush(self.paint, clear=False, region=(52, 4, 138, 27))
 
-        self.on_screen = now
         return now
 
+    def paint(self, x, y, w, h):
+        """Repaint the clock if it has been damaged.
+
+        This is the paint callback for :py:meth:`draw565.Draw565.flush`.
+        """
+        draw = wasp.watch.drawable
+        now = self.on_screen
+        if self.enabled and now and draw.damaged(52, 4, 138, 27):
+            draw.set_font(fonts.sans28)
+            draw.set_color(wasp.system.theme(wasp.Theme.STATUS_CLOCK))
+            draw.string('{:02}:{:02}'.format(now[3], now[4]), 52, 4, 138)
+
 class NotificationBar:
     """Show BT status and if there are pending notifications."""
     def __init__(self, x=0, y=0):
@@ -137,15 +185,15 @@ class NotificationBar:
         (x, y) = self._pos
 
         if wasp.watch.connected():
-            draw.blit(icons.blestatus, x, y, fg=wasp.system.theme('ble'))
+            draw.blit(icons.blestatus, x, y, fg=wasp.system.theme(wasp.Theme.BLE))
             if wasp.system.notifications:
                 draw.blit(icons.notification, x+22, y,
-                          fg=wasp.system.theme('notify-icon'))
+                          fg=wasp.system.theme(wasp.Theme.NOTIFY_ICON))
             else:
                 draw.fill(0, x+22, y, 30, 32)
         elif wasp.system.notifications:
             draw.blit(icons.notification, x, y,
-                      fg=wasp.system.theme('notify-icon'))
+                      fg=wasp.system.theme(wasp.Theme.NOTIFY_ICON))
             draw.fill(0, x+30, y, 22, 32)
         else:
             draw.fill(0, x, y, 52, 32)
@@ -208,7 +256,7 @@ class ScrollIndicator:
     def update(self):
         """Update from scrolling indicator."""
         draw = watch.drawable
-        color = wasp.system.theme('scroll-indicator')
+        color = wasp.system.theme(wasp.Theme.SCROLL_INDICATOR)
 
         if self.up:
             draw.blit(icons.up_arrow, self._pos[0], self._pos[1], fg=color)
@@ -224,19 +272,22 @@ class Button():
         """Draw the button."""
         draw = wasp.watch.drawable
         im = self._im
-        bg = draw.darken(wasp.system.theme('ui'))
-        frame = wasp.system.theme('mid')
-        txt = wasp.system.theme('bright')
+        bg = wasp.system.theme(wasp.Theme.UI_DARK)
+        frame = wasp.system.theme(wasp.Theme.MID)
+        txt = wasp.system.theme(wasp.Theme.BRIGHT)
 
-        draw.fill(bg, im[0], im[1], im[2], im[3])
+        (x, y, w, h, label) = im
+        draw.fill(bg, x, y, w, h)
         draw.set_color(txt, bg)
         draw.set_font(fonts.sans24)
-        draw.string(im[4], im[0], im[1]+(im[3]//2)-12, width=im[2])
+        draw.string(label, x, y+(h//2)-12, width=w)
 
-        draw.fill(frame, im[0],im[1],          im[2], 2)
-        draw.fill(frame, im[0], im[1]+im[3]-2, im[2], 2)
-        draw.fill(frame, im[0],         im[1], 2, im[3])
-        draw.fill(frame, im[0]+im[2]-2, im[1], 2, im[3])
+        rects = _rects
+        n = add_rect(rects, 0, x,     y,     w, 2,   frame)
+        n = add_rect(rects, n, x,     y+h-2, w, 2,   frame)
+        n = add_rect(rects, n, x,     y+2,   2, h-4, frame)
+        n = add_rect(rects, n, x+w-2, y+2,   2, h-4, frame)
+        draw.fill_rects(rects, n)
 
     def touch(self, event):
         """Handle touch events."""
@@ -270,7 +321,7 @@ class Checkbox():
         draw = wasp.watch.drawable
         im = self._im
         if im[2]:
-            draw.set_color(wasp.system.theme('bright'))
+            draw.set_color(wasp.system.theme(wasp.Theme.BRIGHT))
             draw.set_font(fonts.sans24)
             draw.string(im[2], im[0], im[1]+6)
         self.update()
@@ -280,13 +331,13 @@ class Checkbox():
         draw = wasp.watch.drawable
         im = self._im
         if self.state:
-            c1 = wasp.system.theme('ui')
-            c2 = draw.lighten(c1, wasp.system.theme('contrast'))
+            c1 = wasp.system.theme(wasp.Theme.UI)
+            c2 = wasp.system.theme(wasp.Theme.UI_LIGHTER)
             fg = c2
         else:
             c1 = 0
             c2 = 0
-            fg = wasp.system.theme('mid')
+            fg = wasp.system.theme(wasp.Theme.MID)
         # Draw checkbox on the right margin if there is a label, otherwise
         # draw at the natural location
         x = 239 - 32 - 4 if im[2] else im[0]
@@ -355,40 +406,53 @@ class Slider():
         x = self._x
         y = self._y
         color = self._color
-        if self._color is None:
-            self._color = wasp.system.theme('ui')
-            color = self._color
-        if self._lowlight is None:
-            self._lowlight = draw.lighten(color, wasp.system.theme('contrast'))
-        light = self._lowlight
+        if color is None:
+            color = wasp.system.theme(wasp.Theme.UI)
+            light = wasp.system.theme(wasp.Theme.UI_LIGHTER)
+        else:
+            light = self._lowlight
+            if light is None:
+                light = draw.lighten(color,
+                                     wasp.system.theme(wasp.Theme.CONTRAST))
+                self._lowlight = light
 
         knob_x = x + ((_SLIDER_TRACK * self.value) // (self._steps-1))
         draw.blit(icons.knob, knob_x, y, color)
 
+        rects = _rects
+        n = 0
         w = knob_x - x
         if w > 0:
-            draw.fill(0, x, y, w, _SLIDER_TRACK_Y1)
+            n = add_rect(rects, n, x, y, w, _SLIDER_TRACK_Y1, 0)
             if w > _SLIDER_KNOB_RADIUS:
-                draw.fill(0, x, y+_SLIDER_TRACK_Y1,
-                          _SLIDER_KNOB_RADIUS, _SLIDER_TRACK_HEIGHT)
-                draw.fill(color, x+_SLIDER_KNOB_RADIUS, y+_SLIDER_TRACK_Y1,
-                          w-_SLIDER_KNOB_RADIUS, _SLIDER_TRACK_HEIGHT)
+                n = add_rect(rects, n, x, y+_SLIDER_TRACK_Y1,
+                             _SLIDER_KNOB_RADIUS, _SLIDER_TRACK_HEIGHT, 0)
+                n = add_rect(rects, n, x+_SLIDER_KNOB_RADIUS,
+                             y+_SLIDER_TRACK_Y1, w-_SLIDER_KNOB_RADIUS,
+                             _SLIDER_TRACK_HEIGHT, color)
             else:
-                draw.fill(0, x, y+_SLIDER_TRACK_Y1, w, _SLIDER_TRACK_HEIGHT)
-            draw.fill(0, x, y+_SLIDER_TRACK_Y2, w, _SLIDER_TRACK_Y1)
+                n = add_rect(rects, n, x, y+_SLIDER_TRACK_Y1,
+                             w, _SLIDER_TRACK_HEIGHT, 0)
+            n = add_rect(rects, n, x, y+_SLIDER_TRACK_Y2,
+                         w, _SLIDER_TRACK_Y1, 0)
 
         sx = knob_x + _SLIDER_KNOB_DIAMETER
         w = _SLIDER_WIDTH - _SLIDER_KNOB_DIAMETER - w
         if w > 0:
-            draw.fill(0, sx, y, w, _SLIDER_TRACK_Y1)
+            n = add_rect(rects, n, sx, y, w, _SLIDER_TRACK_Y1, 0)
             if w > _SLIDER_KNOB_RADIUS:
-                draw.fill(0, sx+w-_SLIDER_KNOB_RADIUS, y+_SLIDER_TRACK_Y1,
-                          _SLIDER_KNOB_RADIUS, _SLIDER_TRACK_HEIGHT)
-                draw.fill(light, sx, y+_SLIDER_TRACK_Y1,
-                          w-_SLIDER_KNOB_RADIUS, _SLIDER_TRACK_HEIGHT)
+                n = add_rect(rects, n, sx+w-_SLIDER_KNOB_RADIUS,
+                             y+_SLIDER_TRACK_Y1, _SLIDER_KNOB_RADIUS,
+                             _SLIDER_TRACK_HEIGHT, 0)
+                n = add_rect(rects, n, sx, y+_SLIDER_TRACK_Y1,
+                             w-_SLIDER_KNOB_RADIUS, _SLIDER_TRACK_HEIGHT, light)
             else:
-                draw.fill(0, sx, y+_SLIDER_TRACK_Y1, w, _SLIDER_TRACK_HEIGHT)
-            draw.fill(0, sx, y+_SLIDER_TRACK_Y2, w, _SLIDER_TRACK_Y1)
+                n = add_rect(rects, n, sx, y+_SLIDER_TRACK_Y1,
+                             w, _SLIDER_TRACK_HEIGHT, 0)
+            n = add_rect(rects, n, sx, y+_SLIDER_TRACK_Y2,
+                         w, _SLIDER_TRACK_Y1, 0)
+
+        draw.fill_rects(rects, n)
 
     def update(self):
         self.draw()
@@ -417,7 +481,7 @@ class Spinner():
         """Draw the spinner."""
         draw = watch.drawable
         im = self._im
-        fg = draw.lighten(wasp.system.theme('ui'), wasp.system.theme('contrast'))
+        fg = wasp.system.theme(wasp.Theme.UI_LIGHTER)
         draw.blit(icons.up_arrow, im[0]+30-8, im[1]+20, fg)
         draw.blit(icons.down_arrow, im[0]+30-8, im[1]+120-20-9, fg)
         self.update()
@@ -426,7 +490,7 @@ class Spinner():
         """Update the spinner value."""
         draw = watch.drawable
         im = self._im
-        draw.set_color(wasp.system.theme('bright'))
+        draw.set_color(wasp.system.theme(wasp.Theme.BRIGHT))
         draw.set_font(fonts.sans28)
         s = str(self.value)
         if len(s) < im[4]:
@@ -466,7 +530,7 @@ class ConfirmationView:
         mute = wasp.watch.display.mute
 
         mute(True)
-        draw.set_color(wasp.system.theme('bright'))
+        draw.set_color(wasp.system.theme(wasp.Theme.BRIGHT))
         draw.set_font(fonts.sans24)
         draw.fill()
         draw.string(message, 0, 60)